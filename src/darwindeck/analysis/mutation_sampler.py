@@ -8,6 +8,7 @@ from dataclasses import dataclass, field
 from typing import Callable, Optional
 
 from darwindeck.genome.schema import GameGenome
+from darwindeck.evolution.cpus import available_cpus
 from darwindeck.evolution.operators import create_default_pipeline, MutationPipeline
 from darwindeck.evolution.fitness_full import FitnessEvaluator, FitnessMetrics
 from darwindeck.simulation.go_simulator import GoSimulator
@@ -257,7 +258,7 @@ def sample_trajectories_parallel(
         seed_type: "known" or "baseline" for trajectory labeling
         progress_callback: Optional (current, total) progress reporter
         base_random_seed: Base seed for reproducibility
-        num_workers: Number of parallel workers (default: cpu_count)
+        num_workers: Number of parallel workers (default: available_cpus())
 
     Returns:
         List of trajectories (len = seeds * paths_per_genome)
@@ -265,7 +266,7 @@ def sample_trajectories_parallel(
     config.validate()
 
     total_paths = len(seed_genomes) * config.paths_per_genome
-    num_workers = num_workers or mp.cpu_count()
+    num_workers = num_workers or available_cpus()
 
     # Generate random seeds
     rng = random.Random(base_random_seed)
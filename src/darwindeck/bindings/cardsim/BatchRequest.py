@@ -56,8 +56,15 @@ class BatchRequest(object):
             return self._tab.Get(flatbuffers.number_types.Uint64Flags, o + self._tab.Pos)
         return 0
 
+    # BatchRequest
+    def DeadlineMs(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        if o != 0:
+            return self._tab.Get(flatbuffers.number_types.Uint32Flags, o + self._tab.Pos)
+        return 0
+
 def BatchRequestStart(builder):
-    builder.StartObject(2)
+    builder.StartObject(3)
 
 def Start(builder):
     BatchRequestStart(builder)
@@ -80,6 +87,12 @@ def BatchRequestAddBatchId(builder, batchId):
 def AddBatchId(builder, batchId):
     BatchRequestAddBatchId(builder, batchId)
 
+def BatchRequestAddDeadlineMs(builder, deadlineMs):
+    builder.PrependUint32Slot(2, deadlineMs, 0)
+
+def AddDeadlineMs(builder, deadlineMs):
+    BatchRequestAddDeadlineMs(builder, deadlineMs)
+
 def BatchRequestEnd(builder):
     return builder.EndObject()
 
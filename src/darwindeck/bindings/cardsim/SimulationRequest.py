@@ -166,8 +166,15 @@ class SimulationRequest(object):
         o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(26))
         return o == 0
 
+    # SimulationRequest
+    def MctsThreads(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(28))
+        if o != 0:
+            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
+        return 0
+
 def SimulationRequestStart(builder):
-    builder.StartObject(12)
+    builder.StartObject(13)
 
 def Start(builder):
     SimulationRequestStart(builder)
@@ -262,6 +269,12 @@ def SimulationRequestStartTeamsVector(builder, numElems):
 def StartTeamsVector(builder, numElems):
     return SimulationRequestStartTeamsVector(builder, numElems)
 
+def SimulationRequestAddMctsThreads(builder, mctsThreads):
+    builder.PrependUint8Slot(12, mctsThreads, 0)
+
+def AddMctsThreads(builder, mctsThreads):
+    SimulationRequestAddMctsThreads(builder, mctsThreads)
+
 def SimulationRequestEnd(builder):
     return builder.EndObject()
 
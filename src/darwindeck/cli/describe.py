@@ -15,6 +15,23 @@ logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
 
+def _skill_from_json(genome_id: str, skill_data: dict) -> SkillEvalResult:
+    """Rebuild a SkillEvalResult from its saved JSON form."""
+    return SkillEvalResult(
+        genome_id=genome_id,
+        greedy_wins_as_p0=skill_data.get('greedy_wins_as_p0', 0),
+        greedy_wins_as_p1=skill_data.get('greedy_wins_as_p1', 0),
+        greedy_win_rate=skill_data.get('greedy_win_rate', 0.5),
+        mcts_wins_as_p0=skill_data.get('mcts_wins_as_p0', 0),
+        mcts_wins_as_p1=skill_data.get('mcts_wins_as_p1', 0),
+        # Files written before mcts_games was saved split games evenly between tiers
+        mcts_games=skill_data.get('mcts_games', skill_data.get('total_games', 0) // 2),
+        total_games=skill_data.get('total_games', 0),
+        skill_score=skill_data.get('skill_score', 0.5),
+        first_player_advantage=skill_data.get('first_player_advantage', 0.0),
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate LLM game description from saved genome JSON'
@@ -88,36 +105,14 @@ def main():
         try:
             with open(args.skill_file) as f:
                 skill_data = json.load(f)
-            skill = SkillEvalResult(
-                genome_id=genome.genome_id,
-                greedy_wins_as_p0=skill_data.get('greedy_wins_as_p0', 0),
-                greedy_wins_as_p1=skill_data.get('greedy_wins_as_p1', 0),
-                greedy_win_rate=skill_data.get('greedy_win_rate', 0.5),
-                mcts_wins_as_p0=skill_data.get('mcts_wins_as_p0', 0),
-                mcts_wins_as_p1=skill_data.get('mcts_wins_as_p1', 0),
-                mcts_win_rate=skill_data.get('mcts_win_rate', 0.5),
-                total_games=skill_data.get('total_games', 0),
-                skill_score=skill_data.get('skill_score', 0.5),
-                first_player_advantage=skill_data.get('first_player_advantage', 0.0),
-            )
+            skill = _skill_from_json(genome.genome_id, skill_data)
         except Exception as e:
             logger.warning(f"Failed to load skill file: {e}")
 
     # Also check if skill data is embedded in genome file
     if skill is None and 'skill_evaluation' in genome_data:
         skill_data = genome_data['skill_evaluation']
-        skill = SkillEvalResult(
-            genome_id=genome.genome_id,
-            greedy_wins_as_p0=skill_data.get('greedy_wins_as_p0', 0),
-            greedy_wins_as_p1=skill_data.get('greedy_wins_as_p1', 0),
-            greedy_win_rate=skill_data.get('greedy_win_rate', 0.5),
-            mcts_wins_as_p0=skill_data.get('mcts_wins_as_p0', 0),
-            mcts_wins_as_p1=skill_data.get('mcts_wins_as_p1', 0),
-            mcts_win_rate=skill_data.get('mcts_win_rate', 0.5),
-            total_games=skill_data.get('total_games', 0),
-            skill_score=skill_data.get('skill_score', 0.5),
-            first_player_advantage=skill_data.get('first_player_advantage', 0.0),
-        )
+        skill = _skill_from_json(genome.genome_id, skill_data)
 
     if args.verbose:
         logger.info(f"Game: {genome.genome_id}")
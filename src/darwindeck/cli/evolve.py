@@ -275,6 +275,11 @@ def main() -> int:
         default=10,
         help='Games per genome for in-evolution skill evaluation'
     )
+    parser.add_argument(
+        '--parallel-skill-eval',
+        action='store_true',
+        help='Run skill evaluation in a worker pool (experimental under Python 3.13 + CGo)'
+    )
     parser.add_argument(
         '--fpa-penalty-threshold',
         type=float,
@@ -361,6 +366,7 @@ def main() -> int:
         skill_eval_frequency=args.skill_eval_frequency,
         skill_eval_games=args.skill_eval_games,
         skill_eval_mcts_iterations=args.mcts_iterations,
+        skill_eval_parallel=args.parallel_skill_eval,
         fpa_penalty_threshold=args.fpa_penalty_threshold,
         fpa_penalty_weight=args.fpa_penalty_weight,
         low_skill_penalty_threshold=args.low_skill_threshold,
@@ -436,7 +442,7 @@ def main() -> int:
             key=lambda ind: skill_results.get(ind.genome.genome_id, SkillEvalResult(
                 genome_id=ind.genome.genome_id,
                 greedy_wins_as_p0=0, greedy_wins_as_p1=0, greedy_win_rate=0.5,
-                mcts_wins_as_p0=0, mcts_wins_as_p1=0, mcts_win_rate=0.5,
+                mcts_wins_as_p0=0, mcts_wins_as_p1=0, mcts_games=0,
                 total_games=0, skill_score=0.5, first_player_advantage=0.0
             )).skill_score,
             reverse=True
@@ -450,7 +456,7 @@ def main() -> int:
             key=lambda ind: skill_results.get(ind.genome.genome_id, SkillEvalResult(
                 genome_id=ind.genome.genome_id,
                 greedy_wins_as_p0=0, greedy_wins_as_p1=0, greedy_win_rate=0.5,
-                mcts_wins_as_p0=0, mcts_wins_as_p1=0, mcts_win_rate=0.5,
+                mcts_wins_as_p0=0, mcts_wins_as_p1=0, mcts_games=0,
                 total_games=0, skill_score=0.5, first_player_advantage=0.0
             )).skill_score,
             reverse=False  # Lower skill = higher rank for party
@@ -464,7 +470,7 @@ def main() -> int:
             if abs(skill_results.get(ind.genome.genome_id, SkillEvalResult(
                 genome_id=ind.genome.genome_id,
                 greedy_wins_as_p0=0, greedy_wins_as_p1=0, greedy_win_rate=0.5,
-                mcts_wins_as_p0=0, mcts_wins_as_p1=0, mcts_win_rate=0.5,
+                mcts_wins_as_p0=0, mcts_wins_as_p1=0, mcts_games=0,
                 total_games=0, skill_score=0.5, first_player_advantage=0.0
             )).first_player_advantage) <= 0.3
         ]
@@ -527,6 +533,7 @@ def main() -> int:
                 'mcts_win_rate': skill.mcts_win_rate,
                 'mcts_wins_as_p0': skill.mcts_wins_as_p0,
                 'mcts_wins_as_p1': skill.mcts_wins_as_p1,
+                'mcts_games': skill.mcts_games,
                 'skill_score': skill.skill_score,
                 'first_player_advantage': skill.first_player_advantage,
                 'total_games': skill.total_games,
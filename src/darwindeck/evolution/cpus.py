@@ -0,0 +1,65 @@
+"""CPU budget detection for sizing worker pools.
+
+os.cpu_count() reports every core on the host, ignoring the affinity mask
+and any cgroup CPU quota (Docker, Kubernetes, SLURM). Oversubscribing
+compute-bound simulation workers costs more in context switches than the
+extra processes gain, so pools are sized from the usable budget instead.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+_CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+
+def _cgroup_cpu_quota(root: Path = _CGROUP_ROOT) -> Optional[float]:
+    """Return the cgroup CPU quota in cores, or None if unlimited/unknown."""
+    try:
+        # cgroup v2: "<quota> <period>" or "max <period>"
+        cpu_max = root / "cpu.max"
+        if cpu_max.exists():
+            quota, period = cpu_max.read_text().split()[:2]
+            if quota == "max":
+                return None
+            return int(quota) / int(period)
+
+        # cgroup v1: quota of -1 means unlimited
+        quota_file = root / "cpu" / "cpu.cfs_quota_us"
+        period_file = root / "cpu" / "cpu.cfs_period_us"
+        if quota_file.exists() and period_file.exists():
+            quota_us = int(quota_file.read_text())
+            if quota_us <= 0:
+                return None
+            return quota_us / int(period_file.read_text())
+    except (OSError, ValueError, ZeroDivisionError):
+        return None
+    return None
+
+
+@lru_cache(maxsize=None)
+def available_cpus() -> int:
+    """Number of CPUs this process can actually use (at least 1).
+
+    Prefers os.process_cpu_count() (Python 3.13+), then the scheduler
+    affinity mask, then os.cpu_count(), and caps the result at the cgroup
+    CPU quota when one is set.
+    """
+    if hasattr(os, "process_cpu_count"):
+        count = os.process_cpu_count()
+    elif hasattr(os, "sched_getaffinity"):
+        count = len(os.sched_getaffinity(0))
+    else:
+        count = os.cpu_count()
+    count = count or 1
+
+    quota = _cgroup_cpu_quota()
+    if quota is not None:
+        count = min(count, max(1, int(quota)))
+
+    logger.info(f"Using {count} CPUs for worker pools")
+    return count
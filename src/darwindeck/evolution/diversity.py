@@ -61,7 +61,7 @@ def extract_features(genome: GameGenome) -> GenomeFeatures:
         has_trump = True
 
     # Win condition types
-    win_types = frozenset(wc.type for wc in genome.win_conditions)
+    win_types = genome.win_types
 
     # Collect all condition types used
     condition_types = set()
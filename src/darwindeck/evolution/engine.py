@@ -7,6 +7,7 @@ import logging
 import os
 from typing import List, Optional, Callable, Dict
 from dataclasses import dataclass, field
+from darwindeck.evolution.cpus import available_cpus
 from darwindeck.evolution.population import Population, Individual
 from darwindeck.evolution.skill_evaluation import evaluate_batch_skill, SkillEvalResult
 from darwindeck.evolution.operators import (
@@ -45,6 +46,8 @@ class EvolutionConfig:
     skill_eval_top_percent: float = 0.1  # Evaluate top 10% (matches elitism rate)
     skill_eval_games: int = 10  # Games per skill evaluation (fast: 10, thorough: 50)
     skill_eval_mcts_iterations: int = 100  # MCTS iterations for skill eval
+    # Skill eval in a worker pool (opt-in; serial is the tested path under Python 3.13 + CGo)
+    skill_eval_parallel: bool = False
     fpa_penalty_threshold: float = 0.3  # Penalize if |first_player_advantage| > this
     fpa_penalty_weight: float = 0.3  # Fitness multiplier for FPA penalty (0.3 = 30% reduction)
     low_skill_penalty_threshold: float = 0.6  # Penalize if skill_score < this
@@ -91,14 +94,14 @@ class EvolutionEngine:
             fitness_evaluator: Function to evaluate fitness (Individual -> Individual with fitness)
             mutation_pipeline: Mutation operators (default: standard pipeline)
             crossover_operator: Crossover operator (default: standard crossover)
-            num_workers: Number of parallel workers (default: os.cpu_count())
+            num_workers: Number of parallel workers (default: available_cpus())
         """
         self.config = config
-        # Cap default workers at cpu_count to balance performance and stability
+        # Cap default workers at the usable CPU budget (affinity and cgroup
+        # quota, not host cores) to balance performance and stability
         # Python 3.13 spawn context + CGo is unstable with many workers
         # Higher worker counts can be requested via EVOLUTION_WORKERS env var at user's risk
-        cpu_count = os.cpu_count() or 4
-        default_workers = cpu_count
+        default_workers = available_cpus()
         self.num_workers = num_workers or int(os.environ.get('EVOLUTION_WORKERS', default_workers))
 
         # Initialize parallel fitness evaluator with style preset
@@ -228,6 +231,10 @@ class EvolutionEngine:
 
         logger.info(f"Evaluation complete. Avg fitness: {self.population.get_average_fitness():.3f}")
 
+    def _skill_eval_workers(self) -> Optional[int]:
+        """Worker count for skill evaluation (None = serial unless opted in)."""
+        return self.num_workers if self.config.skill_eval_parallel else None
+
     def evaluate_skill_and_penalize(self, generation: int) -> None:
         """Run skill evaluation on top performers and penalize unfit games.
 
@@ -282,7 +289,7 @@ class EvolutionEngine:
                 num_games=self.config.skill_eval_games,
                 mcts_iterations=self.config.skill_eval_mcts_iterations,
                 timeout_sec=30.0,  # Shorter timeout for in-evolution eval
-                num_workers=self.num_workers,
+                num_workers=self._skill_eval_workers(),
                 progress_callback=progress
             )
 
@@ -572,7 +579,7 @@ class EvolutionEngine:
             num_games=num_games,
             mcts_iterations=mcts_iterations,
             timeout_sec=timeout_sec,
-            num_workers=self.num_workers,
+            num_workers=self._skill_eval_workers(),
             progress_callback=progress
         )
 
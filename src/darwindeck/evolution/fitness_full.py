@@ -170,7 +170,7 @@ def calculate_coherence_penalty(genome: GameGenome) -> float:
     """
     penalty = 0.0
 
-    win_types = {wc.type for wc in genome.win_conditions}
+    win_types = genome.win_types
     mode = genome.setup.tableau_mode
 
     # WAR (accumulation) conflicts with empty_hand (shedding)
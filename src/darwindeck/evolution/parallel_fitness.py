@@ -35,6 +35,7 @@ except ValueError:
 _MAX_TASKS_PER_CHILD = 50
 
 from darwindeck.genome.schema import GameGenome
+from darwindeck.evolution.cpus import available_cpus
 from darwindeck.genome.validator import GenomeValidator
 from darwindeck.evolution.coherence import SemanticCoherenceChecker
 from darwindeck.evolution.fitness_full import FitnessMetrics, FitnessEvaluator, SimulationResults
@@ -133,8 +134,7 @@ def _evaluate_task(task: EvaluationTask) -> FitnessMetrics:
         raise RuntimeError("Worker coherence checker not initialized")
 
     # STRUCTURAL VALIDATION: Check genome is valid before expensive simulation
-    validation_errors = GenomeValidator.validate(task.genome)
-    if validation_errors:
+    if not GenomeValidator.is_valid(task.genome):
         return FitnessMetrics(
             decision_density=0.0,
             comeback_potential=0.0,
@@ -205,8 +205,7 @@ def evaluate_genome_standalone(
     coherence_checker = SemanticCoherenceChecker()
 
     # STRUCTURAL VALIDATION
-    validation_errors = GenomeValidator.validate(genome)
-    if validation_errors:
+    if not GenomeValidator.is_valid(genome):
         return FitnessMetrics(
             decision_density=0.0, comeback_potential=0.0, tension_curve=0.0,
             interaction_frequency=0.0, rules_complexity=0.0, session_length=0.0,
@@ -252,7 +251,7 @@ class ParallelFitnessEvaluator:
         """
         self.evaluator_factory = evaluator_factory
         self.simulator_factory = simulator_factory or _create_simulator
-        self.num_workers = num_workers or mp.cpu_count()
+        self.num_workers = num_workers or available_cpus()
         # Initialize evaluator and simulator in main process
         self._evaluator = evaluator_factory()
         self._simulator = simulator_factory() if simulator_factory else GoSimulator()
@@ -287,8 +286,7 @@ class ParallelFitnessEvaluator:
         results: List[FitnessMetrics] = []
         for genome in genomes:
             # STRUCTURAL VALIDATION
-            validation_errors = GenomeValidator.validate(genome)
-            if validation_errors:
+            if not GenomeValidator.is_valid(genome):
                 results.append(FitnessMetrics(
                     decision_density=0.0, comeback_potential=0.0, tension_curve=0.0,
                     interaction_frequency=0.0, rules_complexity=0.0, session_length=0.0,
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Callable, Optional, TYPE_CHECKING
 
 try:
     import anthropic
 except ImportError:
     anthropic = None  # type: ignore
 
+from darwindeck.genome.schema import (
+    DrawPhase, PlayPhase, DiscardPhase, BettingPhase,
+    TrickPhase, ClaimPhase, Location
+)
+
 if TYPE_CHECKING:
     from darwindeck.genome.schema import GameGenome
 
@@ -69,7 +76,7 @@ def select_applicable_defaults(genome: "GameGenome") -> list[EdgeCaseDefault]:
     defaults = []
 
     # Check win condition types
-    win_types = {wc.type for wc in genome.win_conditions}
+    win_types = genome.win_types
 
     # Deck exhaustion - skip if it's a win condition
     if not win_types & {"deck_empty", "last_card"}:
@@ -188,6 +195,82 @@ class GenomeValidator:
         )
 
 
+def _describe_draw(phase: DrawPhase) -> tuple[str, str]:
+    source = "deck" if phase.source == Location.DECK else "discard pile"
+    if phase.count == 1:
+        desc = f"Draw 1 card from the {source}"
+    else:
+        desc = f"Draw {phase.count} cards from the {source}"
+    if not phase.mandatory:
+        desc += " (optional)"
+    return ("Draw", desc)
+
+
+def _describe_play(phase: PlayPhase) -> tuple[str, str]:
+    target = "discard pile" if phase.target == Location.DISCARD else "tableau"
+    if phase.min_cards == phase.max_cards:
+        if phase.min_cards == 1:
+            desc = f"Play exactly 1 card to the {target}"
+        else:
+            desc = f"Play exactly {phase.min_cards} cards to the {target}"
+    elif phase.min_cards == 0:
+        desc = f"Play up to {phase.max_cards} cards to the {target} (optional)"
+    else:
+        desc = f"Play {phase.min_cards}-{phase.max_cards} cards to the {target}"
+    return ("Play", desc)
+
+
+def _describe_discard(phase: DiscardPhase) -> tuple[str, str]:
+    if phase.count == 1:
+        desc = "Discard 1 card"
+    else:
+        desc = f"Discard {phase.count} cards"
+    if not phase.mandatory:
+        desc += " (optional)"
+    return ("Discard", desc)
+
+
+def _describe_betting(phase: BettingPhase) -> tuple[str, str]:
+    desc = f"Betting round (minimum bet: {phase.min_bet} chips, max {phase.max_raises} raises)"
+    return ("Betting", desc)
+
+
+def _describe_trick(phase: TrickPhase) -> tuple[str, str]:
+    desc = "Play one card to the trick. "
+    if phase.lead_suit_required:
+        desc += "Must follow suit if able. "
+    if phase.high_card_wins:
+        desc += "Highest card wins the trick."
+    else:
+        desc += "Lowest card wins the trick."
+    # Note: Scoring happens in _extract_scoring_rules
+    return ("Trick", desc)
+
+
+def _describe_claim(phase: ClaimPhase) -> tuple[str, str]:
+    desc = f"Play {phase.min_cards}-{phase.max_cards} cards face-down and claim a rank. "
+    if phase.sequential_rank:
+        desc += "Claims must follow sequence (A, 2, 3, ..., K). "
+    if phase.allow_challenge:
+        desc += "Opponents may challenge your claim."
+    return ("Claim", desc)
+
+
+def _describe_unknown(phase: object) -> tuple[str, str]:
+    return ("Unknown", "Perform the phase action")
+
+
+# Phase type -> (name, description) builder, looked up by exact type
+_PHASE_DESCRIBERS: dict[type, Callable[[Any], tuple[str, str]]] = {
+    DrawPhase: _describe_draw,
+    PlayPhase: _describe_play,
+    DiscardPhase: _describe_discard,
+    BettingPhase: _describe_betting,
+    TrickPhase: _describe_trick,
+    ClaimPhase: _describe_claim,
+}
+
+
 class GenomeExtractor:
     """Deterministic extraction of rules from genome fields."""
 
@@ -273,11 +356,6 @@ class GenomeExtractor:
 
     def _extract_phases(self, genome: "GameGenome") -> list[tuple[str, str]]:
         """Extract turn phases as (name, description) tuples."""
-        from darwindeck.genome.schema import (
-            DrawPhase, PlayPhase, DiscardPhase, BettingPhase,
-            TrickPhase, ClaimPhase, Location
-        )
-
         phases = []
         for i, phase in enumerate(genome.turn_structure.phases, 1):
             name, desc = self._describe_phase(phase)
@@ -286,68 +364,7 @@ class GenomeExtractor:
 
     def _describe_phase(self, phase) -> tuple[str, str]:
         """Convert a phase to (name, description)."""
-        from darwindeck.genome.schema import (
-            DrawPhase, PlayPhase, DiscardPhase, BettingPhase,
-            TrickPhase, ClaimPhase, Location
-        )
-
-        if isinstance(phase, DrawPhase):
-            source = "deck" if phase.source == Location.DECK else "discard pile"
-            if phase.count == 1:
-                desc = f"Draw 1 card from the {source}"
-            else:
-                desc = f"Draw {phase.count} cards from the {source}"
-            if not phase.mandatory:
-                desc += " (optional)"
-            return ("Draw", desc)
-
-        elif isinstance(phase, PlayPhase):
-            target = "discard pile" if phase.target == Location.DISCARD else "tableau"
-            if phase.min_cards == phase.max_cards:
-                if phase.min_cards == 1:
-                    desc = f"Play exactly 1 card to the {target}"
-                else:
-                    desc = f"Play exactly {phase.min_cards} cards to the {target}"
-            elif phase.min_cards == 0:
-                desc = f"Play up to {phase.max_cards} cards to the {target} (optional)"
-            else:
-                desc = f"Play {phase.min_cards}-{phase.max_cards} cards to the {target}"
-            return ("Play", desc)
-
-        elif isinstance(phase, DiscardPhase):
-            if phase.count == 1:
-                desc = "Discard 1 card"
-            else:
-                desc = f"Discard {phase.count} cards"
-            if not phase.mandatory:
-                desc += " (optional)"
-            return ("Discard", desc)
-
-        elif isinstance(phase, BettingPhase):
-            desc = f"Betting round (minimum bet: {phase.min_bet} chips, max {phase.max_raises} raises)"
-            return ("Betting", desc)
-
-        elif isinstance(phase, TrickPhase):
-            desc = "Play one card to the trick. "
-            if phase.lead_suit_required:
-                desc += "Must follow suit if able. "
-            if phase.high_card_wins:
-                desc += "Highest card wins the trick."
-            else:
-                desc += "Lowest card wins the trick."
-            # Note: Scoring happens in _extract_scoring_rules
-            return ("Trick", desc)
-
-        elif isinstance(phase, ClaimPhase):
-            desc = f"Play {phase.min_cards}-{phase.max_cards} cards face-down and claim a rank. "
-            if phase.sequential_rank:
-                desc += "Claims must follow sequence (A, 2, 3, ..., K). "
-            if phase.allow_challenge:
-                desc += "Opponents may challenge your claim."
-            return ("Claim", desc)
-
-        else:
-            return ("Unknown", "Perform the phase action")
+        return _PHASE_DESCRIBERS.get(type(phase), _describe_unknown)(phase)
 
     def _extract_scoring_rules(self, genome: "GameGenome") -> list[str]:
         """Extract scoring rules, including implicit trick-taking scoring."""
@@ -533,12 +550,79 @@ Return ONLY the overview text, no quotes or formatting."""
             return None
 
 
+# Markdown section templates as Python expressions over `s` (RulebookSections).
+# Every emitted line is newline-terminated; the renderer drops the final one.
+_TITLE_EXPR = r'f"# {s.game_name}\n\n"'
+_OVERVIEW_EXPR = r'f"## Overview\n{s.overview}\n\n"'
+_COMPONENTS_EXPR = r'"## Components\n" + "".join([f"- {c}\n" for c in s.components]) + "\n"'
+_SETUP_EXPR = (
+    r'"## Setup\n" + "".join([f"{i}. {step}\n" for i, step in enumerate(s.setup_steps, 1)]) + "\n"'
+)
+_OBJECTIVE_EXPR = r'f"## Objective\n{s.objective}\n\n"'
+_TURN_STRUCTURE_EXPR = (
+    r'f"## Turn Structure\nEach turn consists of {len(s.phases)} phase(s):\n\n"'
+    r' + "".join([f"### {name}\n{desc}\n\n" for name, desc in s.phases])'
+)
+_SCORING_EXPR = r'"## Scoring\n" + "".join([f"{rule}\n\n" for rule in s.scoring_rules])'
+_SPECIAL_RULES_EXPR = (
+    r'"## Special Rules\n" + "".join([f"{rule}\n\n" for rule in s.special_rules])'
+)
+_EDGE_CASES_EXPR = r'"## Edge Cases\n" + "".join([f"{rule}\n\n" for rule in s.edge_cases])'
+_QUICK_REFERENCE_EXPR = r'f"## Quick Reference\n{s.quick_reference}\n\n"'
+
+# (has_overview, has_scoring, has_special_rules, has_quick_reference) -> renderer
+_RENDERERS: dict[tuple[bool, bool, bool, bool], Callable[[RulebookSections], str]] = {}
+
+
+def _compile_renderer(
+    has_overview: bool,
+    has_scoring: bool,
+    has_special_rules: bool,
+    has_quick_reference: bool,
+) -> Callable[[RulebookSections], str]:
+    """Build a render function specialized to one rulebook shape.
+
+    Optional sections are decided here, once per shape, so the generated
+    function is a single branch-free concatenation.
+    """
+    exprs = [_TITLE_EXPR]
+    if has_overview:
+        exprs.append(_OVERVIEW_EXPR)
+    exprs += [_COMPONENTS_EXPR, _SETUP_EXPR, _OBJECTIVE_EXPR, _TURN_STRUCTURE_EXPR]
+    if has_scoring:
+        exprs.append(_SCORING_EXPR)
+    if has_special_rules:
+        exprs.append(_SPECIAL_RULES_EXPR)
+    exprs.append(_EDGE_CASES_EXPR)
+    if has_quick_reference:
+        exprs.append(_QUICK_REFERENCE_EXPR)
+
+    body = ",\n        ".join(exprs)
+    source = f"def render(s):\n    return \"\".join((\n        {body},\n    ))[:-1]\n"
+    namespace: dict[str, Any] = {}
+    exec(compile(source, "<rulebook-renderer>", "exec"), namespace)
+    return namespace["render"]
+
+
+def _genome_fingerprint(genome: "GameGenome") -> bytes:
+    """Content hash of a genome.
+
+    Genomes are trees of frozen dataclasses, so their repr is a canonical
+    rendering of every field.
+    """
+    return hashlib.blake2b(repr(genome).encode(), digest_size=16).digest()
+
+
 class RulebookGenerator:
     """Generates complete rulebooks from genomes."""
 
+    # Max rendered rulebooks kept per generator (LRU eviction)
+    CACHE_SIZE = 4096
+
     def __init__(self):
         self.validator = GenomeValidator()
         self.extractor = GenomeExtractor()
+        self._cache: OrderedDict[tuple[bytes, bool], str] = OrderedDict()
 
     def generate(self, genome: "GameGenome", use_llm: bool = True) -> str:
         """Generate a complete rulebook for a genome.
@@ -553,6 +637,13 @@ class RulebookGenerator:
         Raises:
             ValueError: If genome fails validation
         """
+        # Elite genomes recur across generations; reuse their rulebook
+        key = (_genome_fingerprint(genome), use_llm)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
         # Validate genome first
         validation = self.validator.validate(genome)
         if not validation.valid:
@@ -571,72 +662,25 @@ class RulebookGenerator:
             sections = enhancer.enhance(sections, genome)
 
         # Render to markdown
-        return self._render_markdown(sections)
+        markdown = self._render_markdown(sections)
+
+        # Don't pin a fallback rulebook when LLM enhancement was skipped or failed
+        if not use_llm or sections.overview:
+            self._cache[key] = markdown
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        return markdown
 
     def _render_markdown(self, sections: RulebookSections) -> str:
         """Render sections to markdown format."""
-        lines = []
-
-        # Title
-        lines.append(f"# {sections.game_name}")
-        lines.append("")
-
-        # Overview (if present)
-        if sections.overview:
-            lines.append("## Overview")
-            lines.append(sections.overview)
-            lines.append("")
-
-        # Components
-        lines.append("## Components")
-        for component in sections.components:
-            lines.append(f"- {component}")
-        lines.append("")
-
-        # Setup
-        lines.append("## Setup")
-        for i, step in enumerate(sections.setup_steps, 1):
-            lines.append(f"{i}. {step}")
-        lines.append("")
-
-        # Objective
-        lines.append("## Objective")
-        lines.append(sections.objective)
-        lines.append("")
-
-        # Turn Structure
-        lines.append("## Turn Structure")
-        lines.append(f"Each turn consists of {len(sections.phases)} phase(s):")
-        lines.append("")
-        for name, desc in sections.phases:
-            lines.append(f"### {name}")
-            lines.append(desc)
-            lines.append("")
-
-        # Scoring (if any)
-        if sections.scoring_rules:
-            lines.append("## Scoring")
-            for rule in sections.scoring_rules:
-                lines.append(rule)
-                lines.append("")
-
-        # Special Rules (if any)
-        if sections.special_rules:
-            lines.append("## Special Rules")
-            for rule in sections.special_rules:
-                lines.append(rule)
-                lines.append("")
-
-        # Edge Cases
-        lines.append("## Edge Cases")
-        for edge_case in sections.edge_cases:
-            lines.append(edge_case)
-            lines.append("")
-
-        # Quick Reference (if present)
-        if sections.quick_reference:
-            lines.append("## Quick Reference")
-            lines.append(sections.quick_reference)
-            lines.append("")
-
-        return "\n".join(lines)
+        shape = (
+            bool(sections.overview),
+            bool(sections.scoring_rules),
+            bool(sections.special_rules),
+            bool(sections.quick_reference),
+        )
+        render = _RENDERERS.get(shape)
+        if render is None:
+            render = _RENDERERS[shape] = _compile_renderer(*shape)
+        return render(sections)
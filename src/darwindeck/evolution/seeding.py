@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import random
+from dataclasses import replace
 from typing import List, Set, Optional
 from darwindeck.genome.schema import GameGenome
 from darwindeck.evolution.naming import generate_unique_name
@@ -55,19 +56,7 @@ def create_seed_population(
         # Give each copy a unique genome_id
         new_name = generate_unique_name(used_names)
         used_names.add(new_name)
-        genome_copy = genome.__class__(
-            schema_version=genome.schema_version,
-            genome_id=new_name,
-            generation=genome.generation,
-            setup=genome.setup,
-            turn_structure=genome.turn_structure,
-            special_effects=genome.special_effects,
-            win_conditions=genome.win_conditions,
-            scoring_rules=genome.scoring_rules,
-            max_turns=genome.max_turns,
-            min_turns=genome.min_turns,
-            player_count=genome.player_count,
-        )
+        genome_copy = replace(genome, genome_id=new_name)
         population.append(Individual(genome=genome_copy, fitness=0.0, evaluated=False))
 
     # 2. Add mutated variants
@@ -87,19 +76,8 @@ def create_seed_population(
         # Update genome_id with random name
         new_name = generate_unique_name(used_names)
         used_names.add(new_name)
-        mutated_copy = mutated.__class__(
-            schema_version=mutated.schema_version,
-            genome_id=new_name,
-            generation=0,  # Reset generation for seed population
-            setup=mutated.setup,
-            turn_structure=mutated.turn_structure,
-            special_effects=mutated.special_effects,
-            win_conditions=mutated.win_conditions,
-            scoring_rules=mutated.scoring_rules,
-            max_turns=mutated.max_turns,
-            min_turns=mutated.min_turns,
-            player_count=mutated.player_count,
-        )
+        # Reset generation for seed population
+        mutated_copy = replace(mutated, genome_id=new_name, generation=0)
         population.append(Individual(genome=mutated_copy, fitness=0.0, evaluated=False))
 
     # Shuffle population
@@ -197,19 +175,7 @@ def create_seed_population_from_genomes(
         genome = base_genomes[i % len(base_genomes)]
         new_name = generate_unique_name(used_names)
         used_names.add(new_name)
-        genome_copy = genome.__class__(
-            schema_version=genome.schema_version,
-            genome_id=new_name,
-            generation=genome.generation,
-            setup=genome.setup,
-            turn_structure=genome.turn_structure,
-            special_effects=genome.special_effects,
-            win_conditions=genome.win_conditions,
-            scoring_rules=genome.scoring_rules,
-            max_turns=genome.max_turns,
-            min_turns=genome.min_turns,
-            player_count=genome.player_count,
-        )
+        genome_copy = replace(genome, genome_id=new_name)
         population.append(Individual(genome=genome_copy, fitness=0.0, evaluated=False))
 
     # 2. Add mutated variants
@@ -225,19 +191,7 @@ def create_seed_population_from_genomes(
 
         new_name = generate_unique_name(used_names)
         used_names.add(new_name)
-        mutated_copy = mutated.__class__(
-            schema_version=mutated.schema_version,
-            genome_id=new_name,
-            generation=0,
-            setup=mutated.setup,
-            turn_structure=mutated.turn_structure,
-            special_effects=mutated.special_effects,
-            win_conditions=mutated.win_conditions,
-            scoring_rules=mutated.scoring_rules,
-            max_turns=mutated.max_turns,
-            min_turns=mutated.min_turns,
-            player_count=mutated.player_count,
-        )
+        mutated_copy = replace(mutated, genome_id=new_name, generation=0)
         population.append(Individual(genome=mutated_copy, fitness=0.0, evaluated=False))
 
     random.shuffle(population)
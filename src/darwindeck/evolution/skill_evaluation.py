@@ -7,18 +7,80 @@ Measures skill gap using two AI comparisons:
 Both run in both directions to eliminate first-player bias.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Callable, Dict
+from collections import OrderedDict, deque
+import queue
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Callable, Dict, TYPE_CHECKING
+import atexit
 import logging
+import math
+import multiprocessing as mp
+from multiprocessing.pool import Pool
+from multiprocessing.shared_memory import SharedMemory
+import os
+import shelve
 import time
 
 from darwindeck.genome.schema import GameGenome
-from darwindeck.simulation.go_simulator import GoSimulator
+from darwindeck.genome.bytecode import BytecodeCompiler
+from darwindeck.genome.examples import create_war_genome
+from darwindeck.genome.serialization import genome_content_hash
+from darwindeck.evolution.cpus import available_cpus
+from darwindeck.evolution.fitness_full import SimulationResults
+
+if TYPE_CHECKING:
+    from darwindeck.simulation.go_simulator import GoSimulator
 
 logger = logging.getLogger(__name__)
 
+# Workers fork from a warm forkserver instead of re-importing everything like
+# 'spawn'. Only pure-Python modules are preloaded: the Go runtime starts threads
+# as soon as libcardsim is loaded, so the forkserver must never load it (forking
+# a process that hosts the Go runtime is unsafe). Each worker loads it after fork.
+try:
+    _mp_context = mp.get_context('forkserver')
+    _mp_context.set_forkserver_preload([
+        'flatbuffers',
+        'darwindeck.genome.schema',
+        'darwindeck.genome.bytecode',
+        'darwindeck.genome.examples',
+        'darwindeck.evolution.fitness_full',
+    ])
+except ValueError:
+    _mp_context = mp.get_context('spawn')
+
+# Pool kept alive across evaluate_batch_skill calls (one per generation)
+_pool: Optional[Pool] = None
+_pool_size = 0
+_pool_threads = 1
+# Workers post each task's key here when they start it; recreated with the
+# pool, since a worker killed mid-put can leave a queue's lock held
+_pool_started: Optional["mp.queues.Queue"] = None
+
+# Grace period past a chunk's timeout budget before its worker is presumed
+# stuck inside Go (which cannot be interrupted) and the pool is recycled
+_STALL_SLACK_SEC = 30.0
+
+# Per-worker simulator, created once by _worker_init so CGo setup is paid once
+_worker_simulator: Optional["GoSimulator"] = None
+_worker_started: Optional["mp.queues.Queue"] = None
+# Why _worker_init failed, reported by the worker's first task
+_worker_init_error: Optional[str] = None
+
+# Completed evaluations keyed by _skill_cache_key. Evolution re-sends
+# identical rules (elites, neutral mutations) every generation. Persisted to
+# $EVOLUTION_CACHE_DIR/skill_cache.db when that variable is set; only the
+# parent process touches the on-disk store. The in-memory copy is an LRU
+# bounded at _SKILL_CACHE_SIZE entries so long runs don't grow it forever.
+_SKILL_CACHE_SIZE = 4096
+_skill_cache: "OrderedDict[str, SkillEvalResult]" = OrderedDict()
+# Bumped whenever SkillEvalResult's fields change, so stale pickles in the
+# on-disk store are never unpickled into the new layout
+_SKILL_CACHE_VERSION = 2
+
 
-@dataclass
+@dataclass(slots=True)
 class SkillEvalResult:
     """Result of two-tier skill evaluation for a single genome."""
     genome_id: str
@@ -29,21 +91,140 @@ class SkillEvalResult:
     # MCTS vs Random results
     mcts_wins_as_p0: int      # MCTS wins when playing as Player 0
     mcts_wins_as_p1: int      # MCTS wins when playing as Player 1
-    mcts_win_rate: float      # Combined MCTS win rate (0.0-1.0)
+    mcts_games: int           # MCTS games played (both seats)
     # Combined
     total_games: int          # Total games played (greedy + mcts)
     skill_score: float        # Combined skill metric
     first_player_advantage: float  # 0.0 = balanced, 1.0 = P0 always wins, -1.0 = P1 always wins
     timed_out: bool = False   # True if evaluation was cut short
 
+    @property
+    def mcts_win_rate(self) -> float:
+        """Combined MCTS win rate (0.0-1.0), 0.5 when no MCTS games ran."""
+        if not self.mcts_games:
+            return 0.5
+        return (self.mcts_wins_as_p0 + self.mcts_wins_as_p1) / self.mcts_games
 
-@dataclass
-class _SkillEvalTask:
-    """Task for parallel skill evaluation."""
-    genome: GameGenome
+
+class _SkillEvalTask(NamedTuple):
+    """A chunk of genomes evaluated together by one worker.
+
+    Genomes travel as compiled bytecode, which pickles far smaller than the
+    GameGenome dataclass tree; a genome that fails to compile is sent as-is
+    so the worker reports the failure the usual way. For pool workers the
+    batch's bytecode is published once in the shared-memory block named by
+    shm_name, and programs hold (offset, length) spans into it instead.
+    """
+    genome_ids: tuple[str, ...]
+    programs: tuple["GameGenome | bytes | tuple[int, int]", ...]
     num_games: int
     mcts_iterations: int
+    mcts_type: str
     timeout_sec: float
+    decisive_bounds: Optional[tuple[float, float]] = None
+    mcts_threads: int = 1
+    shm_name: Optional[str] = None
+    # None evaluates both seats; 0 or 1 evaluates only the skilled AI in
+    # that seat, and the worker returns _SeatHalf results for the parent
+    # to merge
+    seat: Optional[int] = None
+
+
+class _SeatHalf(NamedTuple):
+    """One seat's share of a genome's evaluation.
+
+    greedy and mcts are None when the tier never ran (timeout or a
+    recycled worker).
+    """
+    seat: int
+    greedy: Optional[SimulationResults]
+    mcts: Optional[SimulationResults]
+
+
+def _wilson_interval(wins: int, games: int, z: float = 1.96) -> tuple[float, float]:
+    """Wilson score interval for a win rate (95% by default)."""
+    if games == 0:
+        return (0.0, 1.0)
+    p = wins / games
+    denom = 1 + z * z / games
+    centre = (p + z * z / (2 * games)) / denom
+    half = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / denom
+    return (centre - half, centre + half)
+
+
+def _is_decisive(wins: int, games: int, bounds: tuple[float, float]) -> bool:
+    """True if the win rate is confidently below bounds[0] or above bounds[1]."""
+    low, high = _wilson_interval(wins, games)
+    return high <= bounds[0] or low >= bounds[1]
+
+
+def _skill_cache_key(
+    genome: GameGenome,
+    num_games: int,
+    mcts_iterations: int,
+    decisive_bounds: Optional[tuple[float, float]] = None,
+    mcts_threads: int = 1,
+    mcts_type: Optional[str] = None
+) -> str:
+    """Cache key: genome rules plus the evaluation parameters."""
+    key = f"v{_SKILL_CACHE_VERSION}:{genome_content_hash(genome)}:{num_games}:{mcts_iterations}"
+    if decisive_bounds:
+        key += f":{decisive_bounds[0]}-{decisive_bounds[1]}"
+    if mcts_threads > 1:
+        key += f":t{mcts_threads}"
+    if mcts_type is not None and mcts_type != _mcts_type_for(mcts_iterations):
+        key += f":{mcts_type}"
+    return key
+
+
+def _skill_cache_path() -> Optional[Path]:
+    """On-disk cache location, or None when persistence is disabled."""
+    cache_dir = os.environ.get("EVOLUTION_CACHE_DIR")
+    return Path(cache_dir) / "skill_cache.db" if cache_dir else None
+
+
+def _remember(key: str, result: "SkillEvalResult") -> None:
+    """Add a result to the in-memory LRU, evicting the oldest when full."""
+    _skill_cache[key] = result
+    _skill_cache.move_to_end(key)
+    if len(_skill_cache) > _SKILL_CACHE_SIZE:
+        _skill_cache.popitem(last=False)
+
+
+def _cache_get(key: str) -> Optional["SkillEvalResult"]:
+    """Look up a cached result in memory, then on disk."""
+    result = _skill_cache.get(key)
+    if result is not None:
+        _skill_cache.move_to_end(key)
+        return result
+    path = _skill_cache_path()
+    if path is not None and path.parent.exists():
+        try:
+            with shelve.open(str(path), flag="r") as db:
+                result = db.get(key)
+        except Exception:
+            # Missing or unreadable store is just a miss
+            return None
+        if result is not None:
+            _remember(key, result)
+    return result
+
+
+def _cache_put(results: Dict[str, "SkillEvalResult"]) -> None:
+    """Store completed (not timed-out) results, opening the on-disk store once."""
+    completed = {key: result for key, result in results.items() if not result.timed_out}
+    if not completed:
+        return
+    for key, result in completed.items():
+        _remember(key, result)
+    path = _skill_cache_path()
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with shelve.open(str(path)) as db:
+                db.update(completed)
+        except Exception as e:
+            logger.warning(f"Could not persist skill cache entries: {e}")
 
 
 def evaluate_skill(
@@ -51,25 +232,74 @@ def evaluate_skill(
     num_games: int = 100,
     mcts_iterations: int = 100,
     timeout_sec: float = 60.0,
-    progress_callback: Optional[Callable[[str], None]] = None
+    progress_callback: Optional[Callable[[str], None]] = None,
+    simulator: Optional["GoSimulator"] = None,
+    decisive_bounds: Optional[tuple[float, float]] = None,
+    block_games: int = 10,
+    mcts_threads: int = 1,
+    mcts_type: Optional[str] = None
 ) -> SkillEvalResult:
     """Run two-tier skill evaluation: Greedy vs Random, then MCTS vs Random.
 
     Each tier runs num_games/2 in each direction to eliminate first-player bias.
     Total games = num_games * 2 (half for greedy, half for mcts).
 
+    Results are cached by genome rules (not genome_id), so re-evaluating an
+    identical genome returns immediately.
+
     Args:
         genome: Game genome to evaluate
         num_games: Games per tier (split between directions), total = 2x this
         mcts_iterations: MCTS search iterations per move (default: 100)
         timeout_sec: Maximum time for entire evaluation
         progress_callback: Optional callback for progress updates
+        simulator: Simulator to reuse (default: a fresh GoSimulator)
+        decisive_bounds: Optional (weak, strong) MCTS win-rate thresholds.
+            When set, the MCTS tier stops early once the 95% Wilson interval
+            lies entirely below weak or above strong; total_games then
+            reports the games actually played.
+        block_games: MCTS games per early-stop check (split across seats)
+        mcts_threads: Root-parallel MCTS trees per move, each searching
+            mcts_iterations / mcts_threads (1 = a single tree)
+        mcts_type: MCTS AI type to play (default: picked from mcts_iterations)
 
     Returns:
         SkillEvalResult with greedy and mcts win rates
     """
-    start_time = time.time()
-    simulator = GoSimulator()
+    key = _skill_cache_key(
+        genome, num_games, mcts_iterations, decisive_bounds, mcts_threads, mcts_type
+    )
+    cached = _cache_get(key)
+    if cached is not None:
+        return replace(cached, genome_id=genome.genome_id)
+
+    result = _evaluate_skill_uncached(
+        genome.genome_id, genome, num_games, mcts_iterations, timeout_sec, progress_callback,
+        simulator, decisive_bounds, block_games, mcts_threads, mcts_type
+    )
+    _cache_put({key: result})
+    return result
+
+
+def _evaluate_skill_uncached(
+    genome_id: str,
+    genome: "GameGenome | bytes",
+    num_games: int,
+    mcts_iterations: int,
+    timeout_sec: float,
+    progress_callback: Optional[Callable[[str], None]] = None,
+    simulator: Optional["GoSimulator"] = None,
+    decisive_bounds: Optional[tuple[float, float]] = None,
+    block_games: int = 10,
+    mcts_threads: int = 1,
+    mcts_type: Optional[str] = None
+) -> SkillEvalResult:
+    """Run the evaluation described in evaluate_skill, bypassing the cache.
+
+    genome may be a GameGenome or its compiled bytecode.
+    """
+    deadline = time.monotonic() + timeout_sec
+    simulator = simulator or _new_simulator()
 
     games_per_direction = num_games // 2
 
@@ -77,87 +307,123 @@ def evaluate_skill(
     if progress_callback:
         progress_callback("Running Greedy vs Random...")
 
-    # Greedy as P0
-    greedy_p0 = simulator.simulate_asymmetric(
+    # Greedy from both seats in a single simulator call
+    greedy_p0, greedy_p1 = simulator.simulate_symmetric(
         genome=genome,
-        num_games=games_per_direction,
-        p0_ai_type="greedy",
-        p1_ai_type="random"
+        games_per_direction=games_per_direction,
+        ai_type="greedy",
+        time_budget_sec=timeout_sec,
     )
 
-    # Check timeout
-    if time.time() - start_time > timeout_sec:
-        return _make_timeout_result(genome.genome_id, greedy_p0, None, None, None, games_per_direction)
-
-    # Greedy as P1
-    greedy_p1 = simulator.simulate_asymmetric(
-        genome=genome,
-        num_games=games_per_direction,
-        p0_ai_type="random",
-        p1_ai_type="greedy"
-    )
-
-    if time.time() - start_time > timeout_sec:
-        return _make_timeout_result(genome.genome_id, greedy_p0, greedy_p1, None, None, games_per_direction)
+    if time.monotonic() > deadline:
+        return _make_timeout_result(genome_id, greedy_p0, greedy_p1, None, None)
 
     # === Tier 2: MCTS vs Random ===
     if progress_callback:
         progress_callback("Running MCTS vs Random...")
 
-    # Determine MCTS AI type based on iterations
-    if mcts_iterations >= 2000:
-        mcts_type = "mcts2000"
-    elif mcts_iterations >= 1000:
-        mcts_type = "mcts1000"
-    elif mcts_iterations >= 500:
-        mcts_type = "mcts500"
-    else:
-        mcts_type = "mcts"  # mcts100
+    mcts_type = mcts_type or _mcts_type_for(mcts_iterations)
 
-    # MCTS as P0
-    mcts_p0 = simulator.simulate_asymmetric(
-        genome=genome,
-        num_games=games_per_direction,
-        p0_ai_type=mcts_type,
-        p1_ai_type="random",
-        mcts_iterations=mcts_iterations
-    )
+    # MCTS from both seats. With decisive_bounds, games run in small blocks
+    # (both seats per block, so stopping early keeps the seat balance) and
+    # stop once the win rate is confidently outside the bounds.
+    # Go is given the remaining budget and stops starting games once it is
+    # spent, so counts come from the games actually played per seat.
+    mcts_wins_p0 = mcts_wins_p1 = mcts_errors = 0
+    mcts_games_p0 = mcts_games_p1 = 0
+    mcts_games_per_direction = 0
+    timed_out = False
+    block = max(1, block_games // 2) if decisive_bounds else games_per_direction
+    while mcts_games_per_direction < games_per_direction:
+        n = min(block, games_per_direction - mcts_games_per_direction)
+        mcts_p0, mcts_p1 = simulator.simulate_symmetric(
+            genome=genome,
+            games_per_direction=n,
+            ai_type=mcts_type,
+            mcts_iterations=mcts_iterations,
+            mcts_threads=mcts_threads,
+            time_budget_sec=max(0.0, deadline - time.monotonic())
+        )
+        mcts_wins_p0 += mcts_p0.player0_wins
+        mcts_wins_p1 += mcts_p1.player1_wins
+        mcts_errors += mcts_p0.errors + mcts_p1.errors
+        mcts_games_p0 += mcts_p0.total_games
+        mcts_games_p1 += mcts_p1.total_games
+        mcts_games_per_direction += n
 
-    if time.time() - start_time > timeout_sec:
-        return _make_timeout_result(genome.genome_id, greedy_p0, greedy_p1, mcts_p0, None, games_per_direction)
+        if mcts_p0.total_games < n or mcts_p1.total_games < n:
+            timed_out = True
+            break
+        if decisive_bounds and _is_decisive(
+            mcts_wins_p0 + mcts_wins_p1, mcts_games_p0 + mcts_games_p1, decisive_bounds
+        ):
+            break
+        if mcts_games_per_direction < games_per_direction and time.monotonic() > deadline:
+            timed_out = True
+            break
 
-    # MCTS as P1
-    mcts_p1 = simulator.simulate_asymmetric(
-        genome=genome,
-        num_games=games_per_direction,
-        p0_ai_type="random",
-        p1_ai_type=mcts_type,
-        mcts_iterations=mcts_iterations
+    return _combine_skill_results(
+        genome_id, greedy_p0, greedy_p1, (mcts_games_p0, mcts_games_p1),
+        mcts_wins_p0, mcts_wins_p1, mcts_errors, timed_out
     )
 
-    # Combine results
+
+# (minimum iterations, MCTS AI type), strongest first
+_MCTS_TYPES = (
+    (2000, "mcts2000"),
+    (1000, "mcts1000"),
+    (500, "mcts500"),
+    (0, "mcts"),  # mcts100
+)
+
+
+def _mcts_type_for(mcts_iterations: int) -> str:
+    """Determine MCTS AI type based on iterations.
+
+    Batch evaluation resolves this once and carries it in each task.
+    """
+    return next(ai_type for minimum, ai_type in _MCTS_TYPES if mcts_iterations >= minimum)
+
+
+def _combine_skill_results(
+    genome_id: str,
+    greedy_p0: SimulationResults,
+    greedy_p1: SimulationResults,
+    mcts_games: tuple[int, int],
+    mcts_wins_p0: int,
+    mcts_wins_p1: int,
+    mcts_errors: int,
+    timed_out: bool
+) -> SkillEvalResult:
+    """Combine both tiers' raw counts into a SkillEvalResult.
+
+    Game counts come from the results (and mcts_games, the MCTS games
+    played as P0 and as P1) rather than the requested counts, since a
+    time budget can cut a direction short.
+    """
     greedy_wins_p0 = greedy_p0.player0_wins
     greedy_wins_p1 = greedy_p1.player1_wins
-    mcts_wins_p0 = mcts_p0.player0_wins
-    mcts_wins_p1 = mcts_p1.player1_wins
 
-    total_greedy_games = games_per_direction * 2
-    total_mcts_games = games_per_direction * 2
+    total_greedy_games = greedy_p0.total_games + greedy_p1.total_games
+    total_mcts_games = mcts_games[0] + mcts_games[1]
     total_games = total_greedy_games + total_mcts_games
 
     # Check for errors
     greedy_errors = greedy_p0.errors + greedy_p1.errors
-    mcts_errors = mcts_p0.errors + mcts_p1.errors
 
-    if greedy_errors >= total_greedy_games and mcts_errors >= total_mcts_games:
+    # No games at all means the budget ran out before this genome was
+    # reached, so the neutral result must not be cached as a real one
+    if total_games == 0 or (
+        greedy_errors >= total_greedy_games and mcts_errors >= total_mcts_games
+    ):
         return SkillEvalResult(
-            genome_id=genome.genome_id,
+            genome_id=genome_id,
             greedy_wins_as_p0=0, greedy_wins_as_p1=0, greedy_win_rate=0.5,
-            mcts_wins_as_p0=0, mcts_wins_as_p1=0, mcts_win_rate=0.5,
+            mcts_wins_as_p0=0, mcts_wins_as_p1=0, mcts_games=0,
             total_games=total_games,
             skill_score=0.5,
             first_player_advantage=0.0,
-            timed_out=False
+            timed_out=timed_out or total_games == 0
         )
 
     # Calculate win rates
@@ -171,43 +437,208 @@ def evaluate_skill(
     # Calculate first player advantage
     # Compare P0 win rate vs P1 win rate across all tests
     # Positive = P0 advantage, Negative = P1 advantage, 0 = balanced
-    p0_win_rate = (greedy_wins_p0 + mcts_wins_p0) / (games_per_direction * 2) if games_per_direction > 0 else 0.5
-    p1_win_rate = (greedy_wins_p1 + mcts_wins_p1) / (games_per_direction * 2) if games_per_direction > 0 else 0.5
+    p0_games = greedy_p0.total_games + mcts_games[0]
+    p1_games = greedy_p1.total_games + mcts_games[1]
+    p0_win_rate = (greedy_wins_p0 + mcts_wins_p0) / p0_games if p0_games > 0 else 0.5
+    p1_win_rate = (greedy_wins_p1 + mcts_wins_p1) / p1_games if p1_games > 0 else 0.5
     # Scale to -1..1 range: (p0 - p1) where both are 0..1
     first_player_advantage = p0_win_rate - p1_win_rate
 
     return SkillEvalResult(
-        genome_id=genome.genome_id,
+        genome_id=genome_id,
         greedy_wins_as_p0=greedy_wins_p0,
         greedy_wins_as_p1=greedy_wins_p1,
         greedy_win_rate=greedy_win_rate,
         mcts_wins_as_p0=mcts_wins_p0,
         mcts_wins_as_p1=mcts_wins_p1,
-        mcts_win_rate=mcts_win_rate,
+        mcts_games=total_mcts_games,
         total_games=total_games,
         skill_score=skill_score,
         first_player_advantage=first_player_advantage,
-        timed_out=False
+        timed_out=timed_out
+    )
+
+
+def _merge_seat_halves(
+    genome_id: str,
+    as_p0: _SeatHalf,
+    as_p1: _SeatHalf,
+    games_per_direction: int
+) -> SkillEvalResult:
+    """Combine a genome's two seat halves into a SkillEvalResult."""
+    if as_p0.mcts is None or as_p1.mcts is None:
+        return _make_timeout_result(
+            genome_id, as_p0.greedy, as_p1.greedy, as_p0.mcts, as_p1.mcts
+        )
+    return _combine_skill_results(
+        genome_id, as_p0.greedy, as_p1.greedy,
+        (as_p0.mcts.total_games, as_p1.mcts.total_games),
+        as_p0.mcts.player0_wins, as_p1.mcts.player1_wins,
+        as_p0.mcts.errors + as_p1.mcts.errors,
+        min(as_p0.mcts.total_games, as_p1.mcts.total_games) < games_per_direction
+        or as_p0.greedy.total_games + as_p1.greedy.total_games < 2 * games_per_direction
+    )
+
+
+def _evaluate_seat_chunk(
+    genomes: tuple["GameGenome | bytes", ...],
+    num_games: int,
+    mcts_iterations: int,
+    mcts_type: str,
+    timeout_sec: float,
+    simulator: "GoSimulator",
+    mcts_threads: int = 1,
+    seats: tuple[int, ...] = (0, 1)
+) -> List[List[_SeatHalf]]:
+    """Evaluate several genomes from the given seats.
+
+    Every genome's greedy directions go to Go as a single batch, since
+    greedy games are cheap next to the CGo crossing. MCTS then
+    runs one genome at a time: timeout_sec is per genome, and each genome's
+    MCTS directions get its own remaining budget (timeout_sec less its share
+    of the greedy batch), so a slow genome cannot use up a later one's time.
+    Go stops starting games once a budget is spent.
+
+    Returns one list of halves (in seats order) per genome.
+    """
+    start = time.monotonic()
+    games_per_direction = num_games // 2
+
+    def schedule(genome, ai_type: str, iterations: int) -> list:
+        return [
+            (genome, [ai_type, "random"] if seat == 0 else ["random", ai_type],
+             games_per_direction, iterations)
+            for seat in seats
+        ]
+
+    # Greedy does no search, so Go ignores the iteration count
+    greedy = simulator.simulate_schedule(
+        [item for genome in genomes for item in schedule(genome, "greedy", 0)],
+        time_budget_sec=timeout_sec * len(genomes)
+    )
+
+    budget = timeout_sec - (time.monotonic() - start) / len(genomes)
+    if budget <= 0:
+        mcts = [None] * len(greedy)
+    else:
+        mcts = [
+            result
+            for genome in genomes
+            for result in simulator.simulate_schedule(
+                schedule(genome, mcts_type, mcts_iterations), mcts_threads,
+                time_budget_sec=budget
+            )
+        ]
+
+    halves = [
+        _SeatHalf(seats[k % len(seats)], g, m) for k, (g, m) in enumerate(zip(greedy, mcts))
+    ]
+    return [halves[i * len(seats):(i + 1) * len(seats)] for i in range(len(genomes))]
+
+
+def _evaluate_skill_chunk(
+    genome_ids: tuple[str, ...],
+    genomes: tuple["GameGenome | bytes", ...],
+    num_games: int,
+    mcts_iterations: int,
+    mcts_type: str,
+    timeout_sec: float,
+    simulator: "GoSimulator",
+    mcts_threads: int = 1
+) -> List[SkillEvalResult]:
+    """Evaluate several genomes from both seats (see _evaluate_seat_chunk)."""
+    halves = _evaluate_seat_chunk(
+        genomes, num_games, mcts_iterations, mcts_type, timeout_sec, simulator, mcts_threads
+    )
+    return [
+        _merge_seat_halves(genome_id, as_p0, as_p1, num_games // 2)
+        for genome_id, (as_p0, as_p1) in zip(genome_ids, halves)
+    ]
+
+
+def evaluate_skill_adaptive(
+    genome: GameGenome,
+    num_games: int = 100,
+    ladder: tuple[int, ...] = (100, 500, 2000),
+    screen_games: int = 20,
+    inconclusive: tuple[float, float] = (0.15, 0.85),
+    timeout_sec: float = 60.0,
+    simulator: Optional["GoSimulator"] = None
+) -> SkillEvalResult:
+    """Skill evaluation that only pays for strong MCTS on ambiguous genomes.
+
+    The first rung of the ladder screens with screen_games at the cheapest
+    iteration count. Each following rung runs the full num_games at the next
+    iteration count, but only while the MCTS win rate stays inside the
+    inconclusive band (exclusive). Most genomes are obviously lopsided or
+    chaotic after the cheap screen.
+
+    Args:
+        genome: Game genome to evaluate
+        num_games: Games per tier for escalated rungs
+        ladder: Increasing MCTS iteration counts
+        screen_games: Games per tier for the first rung
+        inconclusive: (low, high) MCTS win rates that trigger escalation
+        timeout_sec: Wall-time budget across all rungs
+        simulator: Simulator to reuse (default: a fresh GoSimulator)
+
+    Returns:
+        Result from the highest rung that was run
+    """
+    start_time = time.monotonic()
+    simulator = simulator or _new_simulator()
+
+    low, high = inconclusive
+    result = evaluate_skill(
+        genome=genome,
+        num_games=screen_games,
+        mcts_iterations=ladder[0],
+        timeout_sec=timeout_sec,
+        simulator=simulator
     )
+    for mcts_iterations in ladder[1:]:
+        if result.timed_out or not (low < result.mcts_win_rate < high):
+            break
+        remaining = timeout_sec - (time.monotonic() - start_time)
+        if remaining <= 0:
+            return replace(result, timed_out=True)
+        result = evaluate_skill(
+            genome=genome,
+            num_games=num_games,
+            mcts_iterations=mcts_iterations,
+            timeout_sec=remaining,
+            simulator=simulator
+        )
+
+    return result
+
 
+def _make_timeout_result(genome_id, greedy_p0, greedy_p1, mcts_p0, mcts_p1) -> SkillEvalResult:
+    """Create a partial result when timeout occurs.
 
-def _make_timeout_result(genome_id, greedy_p0, greedy_p1, mcts_p0, mcts_p1, games_per_direction) -> SkillEvalResult:
-    """Create a partial result when timeout occurs."""
+    Game counts come from the results that ran, since Go stops a direction
+    early once its time budget is spent.
+    """
     greedy_wins_p0 = greedy_p0.player0_wins if greedy_p0 else 0
     greedy_wins_p1 = greedy_p1.player1_wins if greedy_p1 else 0
     mcts_wins_p0 = mcts_p0.player0_wins if mcts_p0 else 0
     mcts_wins_p1 = mcts_p1.player1_wins if mcts_p1 else 0
 
-    greedy_games = (games_per_direction if greedy_p0 else 0) + (games_per_direction if greedy_p1 else 0)
-    mcts_games = (games_per_direction if mcts_p0 else 0) + (games_per_direction if mcts_p1 else 0)
+    greedy_games_p0 = greedy_p0.total_games if greedy_p0 else 0
+    greedy_games_p1 = greedy_p1.total_games if greedy_p1 else 0
+    mcts_games_p0 = mcts_p0.total_games if mcts_p0 else 0
+    mcts_games_p1 = mcts_p1.total_games if mcts_p1 else 0
+
+    greedy_games = greedy_games_p0 + greedy_games_p1
+    mcts_games = mcts_games_p0 + mcts_games_p1
 
     greedy_win_rate = (greedy_wins_p0 + greedy_wins_p1) / greedy_games if greedy_games > 0 else 0.5
     mcts_win_rate = (mcts_wins_p0 + mcts_wins_p1) / mcts_games if mcts_games > 0 else 0.5
     skill_score = greedy_win_rate * 0.5 + mcts_win_rate * 0.5
 
     # Calculate first player advantage from available data
-    p0_games = (games_per_direction if greedy_p0 else 0) + (games_per_direction if mcts_p0 else 0)
-    p1_games = (games_per_direction if greedy_p1 else 0) + (games_per_direction if mcts_p1 else 0)
+    p0_games = greedy_games_p0 + mcts_games_p0
+    p1_games = greedy_games_p1 + mcts_games_p1
     p0_win_rate = (greedy_wins_p0 + mcts_wins_p0) / p0_games if p0_games > 0 else 0.5
     p1_win_rate = (greedy_wins_p1 + mcts_wins_p1) / p1_games if p1_games > 0 else 0.5
     first_player_advantage = p0_win_rate - p1_win_rate
@@ -219,7 +650,7 @@ def _make_timeout_result(genome_id, greedy_p0, greedy_p1, mcts_p0, mcts_p1, game
         greedy_win_rate=greedy_win_rate,
         mcts_wins_as_p0=mcts_wins_p0,
         mcts_wins_as_p1=mcts_wins_p1,
-        mcts_win_rate=mcts_win_rate,
+        mcts_games=mcts_games,
         total_games=greedy_games + mcts_games,
         skill_score=skill_score,
         first_player_advantage=first_player_advantage,
@@ -227,14 +658,293 @@ def _make_timeout_result(genome_id, greedy_p0, greedy_p1, mcts_p0, mcts_p1, game
     )
 
 
-def _evaluate_skill_task(task: _SkillEvalTask) -> SkillEvalResult:
-    """Worker function for parallel evaluation."""
-    return evaluate_skill(
-        genome=task.genome,
-        num_games=task.num_games,
-        mcts_iterations=task.mcts_iterations,
-        timeout_sec=task.timeout_sec
-    )
+def _new_simulator() -> "GoSimulator":
+    """Create a simulator, loading libcardsim on first use.
+
+    The import is deferred so pool workers can configure the Go runtime in
+    _worker_init before the library starts it.
+    """
+    from darwindeck.simulation.go_simulator import GoSimulator
+    return GoSimulator()
+
+
+def _worker_init(worker_counter, threads_per_worker: int = 1, started_queue=None) -> None:
+    """Initialize a pool worker with its long-lived simulator.
+
+    Each worker is pinned to its own threads_per_worker cores (where the OS
+    supports affinity) and the Go runtime is limited to that many threads,
+    so N workers run N x threads_per_worker busy threads instead of
+    N x GOMAXPROCS contending for the same cores. A throwaway game is
+    played before the first task so its timing excludes runtime warm-up.
+
+    Failures are recorded rather than raised: Pool replaces a worker whose
+    initializer raises without ever running a task, so the parent would
+    wait forever. The worker's first task reports the error instead.
+    """
+    global _worker_simulator, _worker_started, _worker_init_error
+    _worker_started = started_queue
+    with worker_counter.get_lock():
+        worker_index = worker_counter.value
+        worker_counter.value += 1
+
+    if hasattr(os, 'sched_setaffinity'):
+        cpus = sorted(os.sched_getaffinity(0))
+        first = worker_index * threads_per_worker
+        own = {cpus[(first + k) % len(cpus)] for k in range(threads_per_worker)}
+        try:
+            os.sched_setaffinity(0, own)
+        except OSError as e:
+            logger.debug(f"Could not pin skill worker {worker_index}: {e}")
+
+    # Read by the Go runtime when libcardsim is loaded below
+    os.environ['GOMAXPROCS'] = str(threads_per_worker)
+    try:
+        _worker_simulator = _new_simulator()
+    except Exception as e:
+        _worker_init_error = f"{type(e).__name__}: {e}"
+        return
+    _warm_up(_worker_simulator)
+
+
+def _warm_up(simulator: "GoSimulator") -> None:
+    """Play one cheap MCTS game to pay library loading and Go runtime start-up.
+
+    The first call into a fresh worker is several times slower than later
+    ones, which would otherwise count against the first genome's timeout.
+    """
+    try:
+        simulator.simulate_asymmetric(
+            create_war_genome(), num_games=1, p0_ai_type="mcts", p1_ai_type="random",
+            mcts_iterations=1
+        )
+    except Exception as e:
+        logger.debug(f"Skill worker warm-up failed: {e}")
+    finally:
+        # The warm-up genome's id may be shared by an evolved descendant
+        simulator.clear_bytecode_cache()
+
+
+def _share_programs(
+    programs: Dict[int, "GameGenome | bytes"]
+) -> tuple[Optional[SharedMemory], Dict[int, "GameGenome | tuple[int, int]"]]:
+    """Copy compiled programs into one shared-memory block.
+
+    Returns the block (None if nothing compiled; the caller must unlink it)
+    and, per index, an (offset, length) span into it or the uncompiled
+    GameGenome.
+    """
+    compiled = {i: p for i, p in programs.items() if isinstance(p, bytes)}
+    shared: Dict[int, "GameGenome | tuple[int, int]"] = {
+        i: p for i, p in programs.items() if not isinstance(p, bytes)
+    }
+    if not compiled:
+        return None, shared
+
+    block = SharedMemory(create=True, size=sum(len(p) for p in compiled.values()))
+    offset = 0
+    for i, program in compiled.items():
+        block.buf[offset:offset + len(program)] = program
+        shared[i] = (offset, len(program))
+        offset += len(program)
+    return block, shared
+
+
+def _load_programs(task: _SkillEvalTask) -> _SkillEvalTask:
+    """Resolve a task's shared-memory spans into bytecode."""
+    if task.shm_name is None:
+        return task
+    block = SharedMemory(name=task.shm_name)
+    try:
+        programs = tuple(
+            bytes(block.buf[p[0]:p[0] + p[1]]) if isinstance(p, tuple) else p
+            for p in task.programs
+        )
+    finally:
+        block.close()
+    return task._replace(programs=programs, shm_name=None)
+
+
+def _run_skill_task(
+    task: _SkillEvalTask, simulator: "GoSimulator"
+) -> "List[SkillEvalResult] | List[_SeatHalf]":
+    """Evaluate a chunk, bypassing the cache.
+
+    Fixed-length evaluations share one greedy simulator call across the
+    whole chunk (see _evaluate_seat_chunk); early-stopping evaluations need per-genome control and
+    run one genome at a time. Single-seat tasks return _SeatHalf results.
+    """
+    task = _load_programs(task)
+    if task.seat is not None:
+        return [halves[0] for halves in _evaluate_seat_chunk(
+            task.programs, task.num_games, task.mcts_iterations, task.mcts_type,
+            task.timeout_sec, simulator, task.mcts_threads, (task.seat,)
+        )]
+    if task.decisive_bounds is None:
+        return _evaluate_skill_chunk(
+            task.genome_ids, task.programs, task.num_games, task.mcts_iterations,
+            task.mcts_type, task.timeout_sec, simulator, task.mcts_threads
+        )
+
+    results = []
+    for genome_id, genome in zip(task.genome_ids, task.programs):
+        # Mutants keep their parent's genome_id, so id-keyed bytecode must
+        # not outlive the genome that compiled it
+        simulator.clear_bytecode_cache()
+        results.append(_evaluate_skill_uncached(
+            genome_id=genome_id,
+            genome=genome,
+            num_games=task.num_games,
+            mcts_iterations=task.mcts_iterations,
+            timeout_sec=task.timeout_sec,
+            simulator=simulator,
+            decisive_bounds=task.decisive_bounds,
+            mcts_threads=task.mcts_threads,
+            mcts_type=task.mcts_type
+        ))
+    return results
+
+
+def _evaluate_skill_task(
+    indexed_task: tuple[List[int], _SkillEvalTask]
+) -> tuple[List[int], "List[SkillEvalResult] | List[_SeatHalf]"]:
+    """Worker function for parallel evaluation.
+
+    Returns the task's batch indices with its results so completion-order
+    output can be reordered (indices rather than genome_ids, since mutants
+    share ids). The parent filters cache hits and stores results; workers
+    never touch the cache. The task's first index is posted to the started
+    queue, with its seat, so the parent can time the task from when it
+    actually began.
+    """
+    if _worker_simulator is None:
+        raise RuntimeError(f"Worker simulator not initialized: {_worker_init_error}")
+    indices, task = indexed_task
+    if _worker_started is not None:
+        _worker_started.put((indices[0], task.seat))
+    return (indices, _run_skill_task(task, _worker_simulator))
+
+
+def _get_pool(num_workers: int, threads_per_worker: int = 1) -> Pool:
+    """Return the shared worker pool, (re)creating it for a new shape."""
+    global _pool, _pool_size, _pool_threads, _pool_started
+    if _pool is None or _pool_size != num_workers or _pool_threads != threads_per_worker:
+        _shutdown_pool()
+        _pool_started = _mp_context.Queue()
+        _pool = _mp_context.Pool(
+            processes=num_workers,
+            initializer=_worker_init,
+            initargs=(_mp_context.Value('i', 0), threads_per_worker, _pool_started)
+        )
+        _pool_size = num_workers
+        _pool_threads = threads_per_worker
+    return _pool
+
+
+def _shutdown_pool() -> None:
+    """Terminate the shared worker pool, if any."""
+    global _pool, _pool_size, _pool_threads, _pool_started
+    if _pool is not None:
+        _pool.terminate()
+        _pool.join()
+        _pool = None
+        _pool_size = 0
+        _pool_threads = 1
+    if _pool_started is not None:
+        _pool_started.close()
+        _pool_started.cancel_join_thread()
+        _pool_started = None
+
+
+atexit.register(_shutdown_pool)
+
+
+def _dispatch_pool_tasks(
+    tasks: List[tuple[List[int], _SkillEvalTask]],
+    num_workers: int,
+    threads_per_worker: int = 1
+):
+    """Run chunk tasks on the shared pool, yielding (indices, results) as they finish.
+
+    Keeps up to 2 * num_workers tasks submitted so workers never wait on the
+    parent, and collects results in completion order. Workers report when
+    they start a task; a task still running _STALL_SLACK_SEC past its chunk
+    budget has a worker stuck inside Go, so the pool is recycled, that
+    chunk's genomes get timed-out results, and the other outstanding tasks
+    are resubmitted to the fresh pool.
+
+    Workers that cannot run tasks fail fast instead of hanging: a task that
+    raises (including a worker whose simulator failed to load) shuts the
+    pool down and re-raises, and so does going _STALL_SLACK_SEC with no
+    task starting or finishing (workers dying before they start).
+    """
+    queued = deque(tasks)
+    # [task, AsyncResult, start time or None until a worker picks it up]
+    in_flight: List[list] = []
+    pool = _get_pool(num_workers, threads_per_worker)
+    last_progress = time.monotonic()
+
+    while queued or in_flight:
+        while queued and len(in_flight) < 2 * num_workers:
+            task = queued.popleft()
+            in_flight.append([task, pool.apply_async(_evaluate_skill_task, (task,)), None])
+
+        in_flight[0][1].wait(timeout=1.0)
+
+        now = time.monotonic()
+        while True:
+            try:
+                started_key = _pool_started.get_nowait()
+            except queue.Empty:
+                break
+            for entry in in_flight:
+                (indices, task), _, started = entry
+                if (indices[0], task.seat) == started_key and started is None:
+                    entry[2] = last_progress = now
+
+        still_running = []
+        for entry in in_flight:
+            if not entry[1].ready():
+                still_running.append(entry)
+                continue
+            last_progress = now
+            try:
+                output = entry[1].get()
+            except Exception:
+                # Whatever broke this task (e.g. libcardsim failing to load)
+                # will break the rest, so don't keep the pool around
+                _shutdown_pool()
+                raise
+            yield output
+        in_flight = still_running
+
+        idle = now - last_progress > _STALL_SLACK_SEC
+        if in_flight and idle and all(entry[2] is None for entry in in_flight):
+            _shutdown_pool()
+            raise RuntimeError(
+                f"Skill-eval pool workers started no task in {_STALL_SLACK_SEC:.0f}s"
+            )
+
+        now = time.monotonic()
+        stalled, healthy = [], []
+        for entry in in_flight:
+            (indices, task), _, started = entry
+            budget = task.timeout_sec * len(indices) + _STALL_SLACK_SEC
+            (stalled if started is not None and now - started > budget else healthy).append(entry)
+        if stalled:
+            logger.warning(f"Recycling skill-eval pool: {len(stalled)} task(s) stalled")
+            _shutdown_pool()
+            pool = _get_pool(num_workers, threads_per_worker)
+            for (indices, task), _, _ in stalled:
+                if task.seat is not None:
+                    yield (indices, [_SeatHalf(task.seat, None, None) for _ in indices])
+                    continue
+                yield (indices, [
+                    _make_timeout_result(genome_id, None, None, None, None)
+                    for genome_id in task.genome_ids
+                ])
+            queued.extendleft(reversed([entry[0] for entry in healthy]))
+            in_flight = []
+            last_progress = now
 
 
 def evaluate_batch_skill(
@@ -243,22 +953,38 @@ def evaluate_batch_skill(
     mcts_iterations: int = 100,
     timeout_sec: float = 60.0,
     num_workers: Optional[int] = None,
-    progress_callback: Optional[Callable[[int, int], None]] = None
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    decisive_bounds: Optional[tuple[float, float]] = None,
+    mcts_threads: Optional[int] = None
 ) -> List[SkillEvalResult]:
-    """Evaluate skill gap for multiple genomes serially.
+    """Evaluate skill gap for multiple genomes.
 
     Uses two-tier evaluation: Greedy vs Random + MCTS vs Random.
 
-    Due to Python 3.13 multiprocessing + CGo compatibility issues,
-    evaluation runs serially. The Go engine provides internal parallelism.
+    With num_workers > 1, genomes are split into one chunk per worker and
+    evaluated in a persistent forkserver process pool that is reused across
+    calls; otherwise they run as a single chunk in this process. Each chunk
+    runs its greedy tier in one Go call and gives every genome its own MCTS
+    time budget. When there are fewer genomes than workers, each seat
+    direction becomes its own task so both halves of a genome run on
+    separate cores.
+
+    Serial evaluation is the default and the path known to work under
+    Python 3.13. The pool is opt-in (EvolutionConfig.skill_eval_parallel)
+    because Python 3.13 multiprocessing combined with CGo has been unstable
+    in the past.
 
     Args:
         genomes: List of genomes to evaluate
         num_games: Games per tier per genome (total = 2x this)
         mcts_iterations: MCTS search iterations (default: 100)
         timeout_sec: Timeout per genome
-        num_workers: Ignored (serial evaluation)
+        num_workers: Worker processes (None or 1 = serial)
         progress_callback: Called with (completed, total) for progress
+        decisive_bounds: Optional early-stop thresholds (see evaluate_skill)
+        mcts_threads: Root-parallel MCTS trees per move (see evaluate_skill).
+            None gives each pool worker its share of spare cores, or 1 when
+            evaluating serially.
 
     Returns:
         List of SkillEvalResult, one per genome (same order)
@@ -266,17 +992,102 @@ def evaluate_batch_skill(
     if not genomes:
         return []
 
-    results: List[SkillEvalResult] = []
+    if mcts_threads is None:
+        if num_workers is not None and num_workers > 1:
+            mcts_threads = max(1, available_cpus() // num_workers)
+        else:
+            mcts_threads = 1
 
-    for i, genome in enumerate(genomes):
-        result = evaluate_skill(
-            genome=genome,
-            num_games=num_games,
-            mcts_iterations=mcts_iterations,
-            timeout_sec=timeout_sec
-        )
-        results.append(result)
-        if progress_callback:
-            progress_callback(i + 1, len(genomes))
+    # Serve cache hits up front so only unseen genomes reach the simulator
+    keys = [
+        _skill_cache_key(g, num_games, mcts_iterations, decisive_bounds, mcts_threads)
+        for g in genomes
+    ]
+    results_by_index: Dict[int, SkillEvalResult] = {}
+    pending: List[int] = []
+    # Identical offspring in one batch (crossover clones, neutral mutations)
+    # are evaluated once; copies[i] lists later indices sharing i's key
+    first_index: Dict[str, int] = {}
+    copies: Dict[int, List[int]] = {}
+    for i, (genome, key) in enumerate(zip(genomes, keys)):
+        cached = _cache_get(key)
+        if cached is not None:
+            results_by_index[i] = replace(cached, genome_id=genome.genome_id)
+        elif key in first_index:
+            copies[first_index[key]].append(i)
+        else:
+            first_index[key] = i
+            copies[i] = []
+            pending.append(i)
 
-    return results
+    completed = len(results_by_index)
+    if completed and progress_callback:
+        progress_callback(completed, len(genomes))
+
+    mcts_type = _mcts_type_for(mcts_iterations)
+
+    # One chunk per worker (strided so slow and fast genomes mix). Serial
+    # evaluation is one chunk.
+    serial = num_workers is None or num_workers <= 1 or len(pending) == 1
+    num_chunks = 1 if serial else min(num_workers, len(pending))
+    compiler = BytecodeCompiler()
+    programs: Dict[int, "GameGenome | bytes"] = {}
+    for i in pending:
+        try:
+            programs[i] = compiler.compile_genome(genomes[i])
+        except Exception:
+            programs[i] = genomes[i]
+
+    # Pool workers read bytecode from one shared block rather than each
+    # task carrying its own copy through the pipe
+    block, task_programs = (None, programs) if serial else _share_programs(programs)
+    tasks = []
+    for c in range(num_chunks if pending else 0):
+        indices = pending[c::num_chunks]
+        tasks.append((indices, _SkillEvalTask(
+            tuple(genomes[i].genome_id for i in indices),
+            tuple(task_programs[i] for i in indices),
+            num_games, mcts_iterations, mcts_type, timeout_sec, decisive_bounds, mcts_threads,
+            block.name if block is not None else None
+        )))
+
+    # Too few genomes to occupy every worker: run each seat as its own task
+    # and merge the halves below. Early stopping needs both seats together.
+    if not serial and decisive_bounds is None and len(pending) < num_workers:
+        tasks = [
+            (indices, task._replace(seat=seat))
+            for indices, task in tasks
+            for seat in (0, 1)
+        ]
+    halves: Dict[int, List[Optional[_SeatHalf]]] = {}
+
+    if serial:
+        outputs = ((indices, _run_skill_task(task, _new_simulator())) for indices, task in tasks)
+    else:
+        outputs = _dispatch_pool_tasks(tasks, num_workers, mcts_threads)
+
+    try:
+        for indices, chunk_results in outputs:
+            for i, result in zip(indices, chunk_results):
+                if isinstance(result, _SeatHalf):
+                    pair = halves.setdefault(i, [None, None])
+                    pair[result.seat] = result
+                    if None in pair:
+                        continue
+                    result = _merge_seat_halves(
+                        genomes[i].genome_id, pair[0], pair[1], num_games // 2
+                    )
+                results_by_index[i] = result
+                for j in copies[i]:
+                    results_by_index[j] = replace(result, genome_id=genomes[j].genome_id)
+                completed += 1 + len(copies[i])
+            if progress_callback:
+                progress_callback(completed, len(genomes))
+    finally:
+        if block is not None:
+            block.close()
+            block.unlink()
+
+    _cache_put({keys[i]: results_by_index[i] for i in pending})
+
+    return [results_by_index[i] for i in range(len(genomes))]
@@ -169,6 +169,82 @@ HAND_EVAL_METHOD_MAP = {
     HandEvaluationMethod.CARD_COUNT: 4,
 }
 
+# ConditionType to OpCode
+CONDITION_TYPE_TO_OPCODE = {
+    ConditionType.HAND_SIZE: OpCode.CHECK_HAND_SIZE,
+    ConditionType.CARD_IS_RANK: OpCode.CHECK_CARD_RANK,  # Card is specific rank (wild cards)
+    # Card matches reference's rank / suit
+    ConditionType.CARD_MATCHES_RANK: OpCode.CHECK_CARD_MATCHES_RANK,
+    ConditionType.CARD_MATCHES_SUIT: OpCode.CHECK_CARD_MATCHES_SUIT,
+    ConditionType.CARD_BEATS_TOP: OpCode.CHECK_CARD_BEATS_TOP,  # Card beats reference (President)
+    ConditionType.LOCATION_SIZE: OpCode.CHECK_LOCATION_SIZE,
+    ConditionType.SEQUENCE_ADJACENT: OpCode.CHECK_SEQUENCE,
+    ConditionType.HAS_SET_OF_N: OpCode.CHECK_HAS_SET_OF_N,
+    ConditionType.HAS_RUN_OF_N: OpCode.CHECK_HAS_RUN_OF_N,
+    ConditionType.HAS_MATCHING_PAIR: OpCode.CHECK_HAS_MATCHING_PAIR,
+}
+
+# Operator encoding (comparison opcodes offset to start at 0)
+OPERATOR_TO_CODE = {
+    Operator.EQ: OpCode.OP_EQ - 50,
+    Operator.NE: OpCode.OP_NE - 50,
+    Operator.LT: OpCode.OP_LT - 50,
+    Operator.GT: OpCode.OP_GT - 50,
+    Operator.LE: OpCode.OP_LE - 50,
+    Operator.GE: OpCode.OP_GE - 50,
+}
+
+# Location encoding
+LOCATION_TO_CODE = {
+    Location.DECK: 0,
+    Location.HAND: 1,
+    Location.DISCARD: 2,
+    Location.TABLEAU: 3,
+    Location.OPPONENT_HAND: 4,
+    Location.OPPONENT_DISCARD: 5,
+}
+
+# Condition values: ranks as 0-12 (Ace=0, King=12), suits as 0-3
+CONDITION_VALUE_TO_INT = {
+    **{rank: i for i, rank in enumerate([
+        Rank.ACE, Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE,
+        Rank.SIX, Rank.SEVEN, Rank.EIGHT, Rank.NINE, Rank.TEN,
+        Rank.JACK, Rank.QUEEN, Rank.KING,
+    ])},
+    **SUIT_TO_BYTE,
+}
+
+# Condition reference encoding. Two contexts use references differently:
+# - Card comparisons (CARD_BEATS_TOP, etc.): Reference identifies which card to compare
+#   - 1 = top_discard (top of discard pile)
+#   - 2 = last_played / tableau_top (top of tableau)
+# - Location checks (LOCATION_SIZE): Reference identifies which location to check
+#   - Uses Location codes: 0=deck, 1=hand, 2=discard, 3=tableau
+REFERENCE_TO_CODE = {
+    # Card references (for CARD_BEATS_TOP, CARD_MATCHES_RANK, etc.)
+    "top_discard": 1,
+    "last_played": 2,
+    "tableau_top": 2,  # Alias for last_played
+    "valid_plays": 3,
+    # Location references (for LOCATION_SIZE)
+    "deck": 0,
+    "hand": 1,
+    "discard": 2,
+    "tableau": 3,
+}
+
+# Win condition type encoding
+WIN_TYPE_TO_CODE = {
+    "empty_hand": 0,
+    "high_score": 1,
+    "first_to_score": 2,
+    "capture_all": 3,
+    "low_score": 4,        # Hearts: lowest score wins
+    "all_hands_empty": 5,  # Trick-taking: hand ends when all empty
+    "best_hand": 6,        # Poker: best poker hand wins
+    "most_captured": 7,    # Scopa: most captured cards wins
+}
+
 
 def compile_card_scoring(rules: tuple) -> bytes:
     """Compile card scoring rules to bytecode.
@@ -481,6 +557,9 @@ class BytecodeCompiler:
     def __init__(self, genome: GameGenome = None):
         self.offset = BytecodeHeader.HEADER_SIZE  # After header (39 bytes)
         self.genome = genome
+        # Encoded conditions, keyed by the (frozen, hashable) condition itself;
+        # seed games share condition objects and mutants keep most of theirs
+        self._condition_cache: dict = {}
 
     def compile(self) -> bytes:
         """Compile the genome to bytecode (requires genome passed to constructor)."""
@@ -599,15 +678,26 @@ class BytecodeCompiler:
         return result
 
     def _compile_condition(self, cond: ConditionOrCompound) -> bytes:
+        """Encode condition to bytecode, reusing earlier encodings."""
+        try:
+            return self._condition_cache[cond]
+        except KeyError:
+            encoded = self._condition_cache[cond] = self._encode_condition(cond)
+            return encoded
+        except TypeError:
+            # Unhashable value (e.g. a list); encode without caching
+            return self._encode_condition(cond)
+
+    def _encode_condition(self, cond: ConditionOrCompound) -> bytes:
         """Encode condition to bytecode."""
         if isinstance(cond, CompoundCondition):
             # Compound condition: logic + count + nested conditions
             logic_op = OpCode.AND if cond.logic == "AND" else OpCode.OR
             count = len(cond.conditions)
-            result = struct.pack("!BI", logic_op, count)
-            for nested in cond.conditions:
-                result += self._compile_condition(nested)
-            return result
+            return b"".join([
+                struct.pack("!BI", logic_op, count),
+                *(self._compile_condition(nested) for nested in cond.conditions),
+            ])
         else:
             # Simple condition: [OpCode:1][Operator:1][Value:4][Reference:1]
             opcode = self._condition_type_to_opcode(cond.type)
@@ -728,14 +818,7 @@ class BytecodeCompiler:
 
     def _suit_to_code(self, suit) -> int:
         """Map Suit enum to code."""
-        from darwindeck.genome.schema import Suit
-        mapping = {
-            Suit.HEARTS: 0,
-            Suit.DIAMONDS: 1,
-            Suit.CLUBS: 2,
-            Suit.SPADES: 3,
-        }
-        return mapping.get(suit, 255)
+        return SUIT_TO_BYTE.get(suit, 255)
 
     def _compile_win_conditions(self, conditions: List[WinCondition]) -> bytes:
         """Encode win conditions."""
@@ -758,43 +841,15 @@ class BytecodeCompiler:
     # Helper mappings
     def _condition_type_to_opcode(self, cond_type: ConditionType) -> int:
         """Map ConditionType to OpCode."""
-        mapping = {
-            ConditionType.HAND_SIZE: OpCode.CHECK_HAND_SIZE,
-            ConditionType.CARD_IS_RANK: OpCode.CHECK_CARD_RANK,  # Card is specific rank (wild cards)
-            ConditionType.CARD_MATCHES_RANK: OpCode.CHECK_CARD_MATCHES_RANK,  # Card matches reference's rank
-            ConditionType.CARD_MATCHES_SUIT: OpCode.CHECK_CARD_MATCHES_SUIT,  # Card matches reference's suit
-            ConditionType.CARD_BEATS_TOP: OpCode.CHECK_CARD_BEATS_TOP,  # Card beats reference (President)
-            ConditionType.LOCATION_SIZE: OpCode.CHECK_LOCATION_SIZE,
-            ConditionType.SEQUENCE_ADJACENT: OpCode.CHECK_SEQUENCE,
-            ConditionType.HAS_SET_OF_N: OpCode.CHECK_HAS_SET_OF_N,
-            ConditionType.HAS_RUN_OF_N: OpCode.CHECK_HAS_RUN_OF_N,
-            ConditionType.HAS_MATCHING_PAIR: OpCode.CHECK_HAS_MATCHING_PAIR,
-        }
-        return mapping.get(cond_type, 0)
+        return CONDITION_TYPE_TO_OPCODE.get(cond_type, 0)
 
     def _operator_to_code(self, op: Operator) -> int:
         """Map Operator to code."""
-        mapping = {
-            Operator.EQ: OpCode.OP_EQ - 50,
-            Operator.NE: OpCode.OP_NE - 50,
-            Operator.LT: OpCode.OP_LT - 50,
-            Operator.GT: OpCode.OP_GT - 50,
-            Operator.LE: OpCode.OP_LE - 50,
-            Operator.GE: OpCode.OP_GE - 50,
-        }
-        return mapping.get(op, 0)
+        return OPERATOR_TO_CODE.get(op, 0)
 
     def _location_to_code(self, loc: Location) -> int:
         """Map Location to code."""
-        mapping = {
-            Location.DECK: 0,
-            Location.HAND: 1,
-            Location.DISCARD: 2,
-            Location.TABLEAU: 3,
-            Location.OPPONENT_HAND: 4,
-            Location.OPPONENT_DISCARD: 5,
-        }
-        return mapping.get(loc, 0)
+        return LOCATION_TO_CODE.get(loc, 0)
 
     def _value_to_int(self, value) -> int:
         """Convert condition value to integer.
@@ -805,63 +860,14 @@ class BytecodeCompiler:
         - Suit enum: convert to 0-3 (Hearts=0, Spades=3)
         - None/other: return 0
         """
-        from darwindeck.genome.schema import Rank, Suit
-
         if isinstance(value, int):
             return value
-
-        if isinstance(value, Rank):
-            rank_order = [Rank.ACE, Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE,
-                          Rank.SIX, Rank.SEVEN, Rank.EIGHT, Rank.NINE, Rank.TEN,
-                          Rank.JACK, Rank.QUEEN, Rank.KING]
-            try:
-                return rank_order.index(value)
-            except ValueError:
-                return 0
-
-        if isinstance(value, Suit):
-            suit_order = [Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS, Suit.SPADES]
-            try:
-                return suit_order.index(value)
-            except ValueError:
-                return 0
-
-        return 0
+        return CONDITION_VALUE_TO_INT.get(value, 0)
 
     def _reference_to_code(self, ref: str) -> int:
-        """Map reference string to code.
-
-        Two contexts use references differently:
-        - Card comparisons (CARD_BEATS_TOP, etc.): Reference identifies which card to compare
-          - 1 = top_discard (top of discard pile)
-          - 2 = last_played / tableau_top (top of tableau)
-        - Location checks (LOCATION_SIZE): Reference identifies which location to check
-          - Uses Location codes: 0=deck, 1=hand, 2=discard, 3=tableau
-        """
-        mapping = {
-            # Card references (for CARD_BEATS_TOP, CARD_MATCHES_RANK, etc.)
-            "top_discard": 1,
-            "last_played": 2,
-            "tableau_top": 2,  # Alias for last_played
-            "valid_plays": 3,
-            # Location references (for LOCATION_SIZE)
-            "deck": 0,
-            "hand": 1,
-            "discard": 2,
-            "tableau": 3,
-        }
-        return mapping.get(ref, 0)
+        """Map reference string to code (see REFERENCE_TO_CODE)."""
+        return REFERENCE_TO_CODE.get(ref, 0)
 
     def _win_type_to_code(self, win_type: str) -> int:
         """Map win condition type to code."""
-        mapping = {
-            "empty_hand": 0,
-            "high_score": 1,
-            "first_to_score": 2,
-            "capture_all": 3,
-            "low_score": 4,        # Hearts: lowest score wins
-            "all_hands_empty": 5,  # Trick-taking: hand ends when all empty
-            "best_hand": 6,        # Poker: best poker hand wins
-            "most_captured": 7,    # Scopa: most captured cards wins
-        }
-        return mapping.get(win_type, 0)
+        return WIN_TYPE_TO_CODE.get(win_type, 0)
@@ -57,7 +57,7 @@ class Operator(Enum):
     GE = ">="
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Condition:
     """Single condition predicate."""
 
@@ -67,7 +67,7 @@ class Condition:
     reference: Optional[str] = None  # "top_discard", "last_played", etc.
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompoundCondition:
     """Combine conditions with AND/OR logic."""
 
@@ -1,6 +1,11 @@
-"""Example game genomes for testing."""
+"""Example game genomes for testing.
 
-from typing import List
+Genomes are frozen, so each factory builds its genome once and returns the
+same instance on every call; derive variants with dataclasses.replace.
+"""
+
+from functools import cache
+from typing import Callable, Dict, Iterator, List, Optional
 from darwindeck.genome.schema import (
     GameGenome,
     SetupRules,
@@ -11,6 +16,7 @@ from darwindeck.genome.schema import (
     TrickPhase,
     BettingPhase,
     BiddingPhase,
+    ClaimPhase,
     ContractScoring,
     WinCondition,
     Location,
@@ -37,47 +43,83 @@ from darwindeck.genome.schema import (
 from darwindeck.genome.conditions import Condition, ConditionType, Operator, CompoundCondition
 
 
-def create_war_genome() -> GameGenome:
-    """Create War card game genome.
+# Conditions used by several seed games (frozen, so safe to share)
+_MATCHES_TOP_SUIT = Condition(type=ConditionType.CARD_MATCHES_SUIT, reference="top_discard")
+_MATCHES_TOP_RANK = Condition(type=ConditionType.CARD_MATCHES_RANK, reference="top_discard")
+_CARD_IS_EIGHT = Condition(type=ConditionType.CARD_IS_RANK, value=Rank.EIGHT)
+_HAND_NONEMPTY = Condition(type=ConditionType.HAND_SIZE, operator=Operator.GT, value=0)
+_HAND_UNDER_FIVE = Condition(type=ConditionType.HAND_SIZE, operator=Operator.LT, value=5)
+
+
+@cache
+def _trick_phase(
+    trump: Optional[Suit],
+    breaking: Optional[Suit] = None,
+    breaking_rule: BreakingRule = BreakingRule.NONE
+) -> TrickPhase:
+    """Follow-suit, high-card-wins trick phase, shared by games with the same rules."""
+    return TrickPhase(
+        lead_suit_required=True,
+        trump_suit=trump,
+        high_card_wins=True,
+        breaking_suit=breaking,
+        breaking_rule=breaking_rule,
+    )
 
-    War is a pure luck game with:
-    - Zero meaningful decisions
-    - Simple card comparison
-    - Winner-takes-all mechanics
+
+def _build_war_like(genome_id: str, phases: tuple, starting_chips: int = 0, **extra) -> GameGenome:
+    """Shared War skeleton: 26 cards each, WAR tableau, capture every card to win.
+
+    War variants differ only in their turn phases, chips and any extra
+    GameGenome fields.
     """
     return GameGenome(
         schema_version="1.0",
-        genome_id="war-baseline",
+        genome_id=genome_id,
         generation=0,
         setup=SetupRules(
             cards_per_player=26,
             initial_deck="standard_52",
             initial_discard_count=0,
+            starting_chips=starting_chips,
             tableau_mode=TableauMode.WAR,
         ),
-        turn_structure=TurnStructure(
-            phases=[
-                PlayPhase(
-                    target=Location.TABLEAU,
-                    min_cards=1,
-                    max_cards=1,
-                    mandatory=True,
-                    pass_if_unable=False
-                )
-            ]
+        turn_structure=TurnStructure(phases=phases),
+        special_effects=(),
+        win_conditions=(
+            WinCondition(type="capture_all"),
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(
-                type="capture_all"
-            )
-        ],
-        scoring_rules=[],
+        scoring_rules=(),
         max_turns=1000,
-        player_count=2
+        player_count=2,
+        **extra
     )
 
 
+@cache
+def create_war_genome() -> GameGenome:
+    """Create War card game genome.
+
+    War is a pure luck game with:
+    - Zero meaningful decisions
+    - Simple card comparison
+    - Winner-takes-all mechanics
+    """
+    return _build_war_like(
+        "war-baseline",
+        phases=(
+            PlayPhase(
+                target=Location.TABLEAU,
+                min_cards=1,
+                max_cards=1,
+                mandatory=True,
+                pass_if_unable=False
+            ),
+        ),
+    )
+
+
+@cache
 def create_hearts_genome() -> GameGenome:
     """Create classic 4-player Hearts genome with explicit scoring.
 
@@ -98,20 +140,15 @@ def create_hearts_genome() -> GameGenome:
             initial_discard_count=0,  # Full deck distribution
         ),
         turn_structure=TurnStructure(
-            phases=[
-                TrickPhase(
-                    lead_suit_required=True,   # Must follow suit if able
-                    trump_suit=None,            # No trump in Hearts
-                    high_card_wins=True,        # High card wins
-                    breaking_suit=Suit.HEARTS,  # Hearts cannot be led until broken
-                    breaking_rule=BreakingRule.CANNOT_LEAD_UNTIL_BROKEN,
-                )
-            ],
+            phases=(
+                # No trump; Hearts cannot be led until broken
+                _trick_phase(None, Suit.HEARTS, BreakingRule.CANNOT_LEAD_UNTIL_BROKEN),
+            ),
             is_trick_based=True,
             tricks_per_hand=13,  # 13 tricks per hand
         ),
-        special_effects=[],
-        win_conditions=[
+        special_effects=(),
+        win_conditions=(
             WinCondition(
                 type="low_score",  # Lowest score wins (avoid hearts)
                 threshold=100,     # Game ends at 100 points
@@ -121,8 +158,8 @@ def create_hearts_genome() -> GameGenome:
             WinCondition(
                 type="all_hands_empty",
             )
-        ],
-        scoring_rules=[],
+        ),
+        scoring_rules=(),
         # Explicit card scoring
         card_scoring=(
             CardScoringRule(
@@ -142,6 +179,7 @@ def create_hearts_genome() -> GameGenome:
     )
 
 
+@cache
 def create_crazy_eights_genome() -> GameGenome:
     """Create Crazy 8s card game genome.
 
@@ -167,7 +205,7 @@ def create_crazy_eights_genome() -> GameGenome:
             initial_discard_count=1  # Start with one card in discard
         ),
         turn_structure=TurnStructure(
-            phases=[
+            phases=(
                 # Draw from deck (optional - simpler than conditional draw)
                 DrawPhase(
                     source=Location.DECK,
@@ -179,20 +217,11 @@ def create_crazy_eights_genome() -> GameGenome:
                     target=Location.DISCARD,
                     valid_play_condition=CompoundCondition(
                         logic="OR",
-                        conditions=[
-                            Condition(
-                                type=ConditionType.CARD_MATCHES_SUIT,
-                                reference="top_discard"
-                            ),
-                            Condition(
-                                type=ConditionType.CARD_MATCHES_RANK,
-                                reference="top_discard"
-                            ),
-                            Condition(
-                                type=ConditionType.CARD_IS_RANK,
-                                value=Rank.EIGHT  # 8s are wild
-                            )
-                        ]
+                        conditions=(
+                            _MATCHES_TOP_SUIT,
+                            _MATCHES_TOP_RANK,
+                            _CARD_IS_EIGHT  # 8s are wild
+                        )
                     ),
                     min_cards=1,
                     max_cards=4,  # Can play multiple cards of same rank
@@ -211,18 +240,19 @@ def create_crazy_eights_genome() -> GameGenome:
                     mandatory=False,
                     pass_if_unable=True
                 )
-            ]
+            )
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="empty_hand")
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            WinCondition(type="empty_hand"),
+        ),
+        scoring_rules=(),
         max_turns=500,  # Increased from 200 - shedding games need more turns
         player_count=2
     )
 
 
+@cache
 def create_gin_rummy_genome() -> GameGenome:
     """Create simplified Gin Rummy genome.
 
@@ -243,7 +273,7 @@ def create_gin_rummy_genome() -> GameGenome:
             initial_discard_count=1  # Start discard pile
         ),
         turn_structure=TurnStructure(
-            phases=[
+            phases=(
                 # Draw from deck (simplified - no choice of discard pile)
                 DrawPhase(
                     source=Location.DECK,
@@ -255,14 +285,14 @@ def create_gin_rummy_genome() -> GameGenome:
                     target=Location.TABLEAU,
                     valid_play_condition=CompoundCondition(
                         logic="OR",
-                        conditions=[
+                        conditions=(
                             # Simplified: allow playing sets or runs (minimal validation)
                             Condition(
                                 type=ConditionType.HAND_SIZE,
                                 operator=Operator.GE,
                                 value=3  # Must have at least 3 cards to form a meld
-                            )
-                        ]
+                            ),
+                        )
                     ),
                     min_cards=0,  # Playing melds is optional
                     max_cards=10,
@@ -274,20 +304,21 @@ def create_gin_rummy_genome() -> GameGenome:
                     count=1,
                     mandatory=True
                 )
-            ]
+            )
         ),
-        special_effects=[],
-        win_conditions=[
+        special_effects=(),
+        win_conditions=(
             WinCondition(
                 type="empty_hand"  # Simplified win condition
-            )
-        ],
-        scoring_rules=[],  # TODO: Add scoring when ScoringRule class is implemented
+            ),
+        ),
+        scoring_rules=(),  # TODO: Add scoring when ScoringRule class is implemented
         max_turns=100,
         player_count=2
     )
 
 
+@cache
 def create_old_maid_genome() -> GameGenome:
     """Create Old Maid card game genome.
 
@@ -307,7 +338,7 @@ def create_old_maid_genome() -> GameGenome:
             initial_discard_count=1  # Remove one card to create odd
         ),
         turn_structure=TurnStructure(
-            phases=[
+            phases=(
                 # Draw from opponent's hand (core Old Maid mechanic)
                 DrawPhase(
                     source=Location.OPPONENT_HAND,
@@ -320,18 +351,19 @@ def create_old_maid_genome() -> GameGenome:
                     count=2,
                     mandatory=False  # Only if you have a pair
                 )
-            ]
+            )
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="empty_hand")
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            WinCondition(type="empty_hand"),
+        ),
+        scoring_rules=(),
         max_turns=100,
         player_count=2
     )
 
 
+@cache
 def create_go_fish_genome() -> GameGenome:
     """Create Go Fish card game genome.
 
@@ -355,7 +387,7 @@ def create_go_fish_genome() -> GameGenome:
             initial_discard_count=0
         ),
         turn_structure=TurnStructure(
-            phases=[
+            phases=(
                 # Draw from deck
                 DrawPhase(
                     source=Location.DECK,
@@ -390,10 +422,10 @@ def create_go_fish_genome() -> GameGenome:
                     count=1,
                     mandatory=False
                 )
-            ]
+            )
         ),
-        special_effects=[],
-        win_conditions=[
+        special_effects=(),
+        win_conditions=(
             # Primary: highest score (most books) wins
             # This ensures ScoreLeaderDetector is used for tension tracking
             WinCondition(
@@ -402,13 +434,14 @@ def create_go_fish_genome() -> GameGenome:
             ),
             # Fallback: if deck runs out and hands empty, game ends
             WinCondition(type="empty_hand"),
-        ],
-        scoring_rules=[],
+        ),
+        scoring_rules=(),
         max_turns=200,
         player_count=2
     )
 
 
+@cache
 def create_betting_war_genome() -> GameGenome:
     """Create Betting War card game genome.
 
@@ -418,52 +451,36 @@ def create_betting_war_genome() -> GameGenome:
     - Winner takes opponent's chips over time
     - Starting chips: 500, min bet: 10
     """
-    return GameGenome(
-        schema_version="1.0",
-        genome_id="betting-war",
-        generation=0,
-        setup=SetupRules(
-            cards_per_player=26,
-            initial_deck="standard_52",
-            initial_discard_count=0,
-            starting_chips=500,
-            tableau_mode=TableauMode.WAR,
-        ),
-        turn_structure=TurnStructure(
-            phases=[
-                BettingPhase(
-                    min_bet=10,
-                    max_raises=2,
-                    showdown_method=ShowdownMethod.HIGHEST_CARD,
+    return _build_war_like(
+        "betting-war",
+        phases=(
+            BettingPhase(
+                min_bet=10,
+                max_raises=2,
+                showdown_method=ShowdownMethod.HIGHEST_CARD,
+            ),
+            PlayPhase(
+                target=Location.TABLEAU,
+                valid_play_condition=Condition(
+                    type=ConditionType.LOCATION_SIZE,
+                    reference="hand",
+                    operator=Operator.GT,
+                    value=0
                 ),
-                PlayPhase(
-                    target=Location.TABLEAU,
-                    valid_play_condition=Condition(
-                        type=ConditionType.LOCATION_SIZE,
-                        reference="hand",
-                        operator=Operator.GT,
-                        value=0
-                    ),
-                    min_cards=1,
-                    max_cards=1,
-                    mandatory=True,
-                    pass_if_unable=False
-                )
-            ]
+                min_cards=1,
+                max_cards=1,
+                mandatory=True,
+                pass_if_unable=False
+            )
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="capture_all")
-        ],
-        scoring_rules=[],
-        max_turns=1000,
-        player_count=2,
+        starting_chips=500,
         hand_evaluation=HandEvaluation(
             method=HandEvaluationMethod.HIGH_CARD,
         ),
     )
 
 
+@cache
 def create_cheat_genome() -> GameGenome:
     """Create I Doubt It / Cheat / BS card game genome.
 
@@ -477,8 +494,6 @@ def create_cheat_genome() -> GameGenome:
       - Claim was FALSE: claimer takes the discard pile
     - First player to empty their hand wins
     """
-    from darwindeck.genome.schema import ClaimPhase
-
     return GameGenome(
         schema_version="1.0",
         genome_id="cheat",
@@ -489,7 +504,7 @@ def create_cheat_genome() -> GameGenome:
             initial_discard_count=0
         ),
         turn_structure=TurnStructure(
-            phases=[
+            phases=(
                 # Claim phase - play cards face-down with a claimed rank
                 ClaimPhase(
                     min_cards=1,
@@ -497,19 +512,20 @@ def create_cheat_genome() -> GameGenome:
                     sequential_rank=True,  # Must claim A, 2, 3, ..., K, A, ...
                     allow_challenge=True,
                     pile_penalty=True  # Loser of challenge takes pile
-                )
-            ]
+                ),
+            )
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="empty_hand")
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            WinCondition(type="empty_hand"),
+        ),
+        scoring_rules=(),
         max_turns=2000,  # Games can be long with pile pickups and random challenges
         player_count=2
     )
 
 
+@cache
 def create_scopa_genome() -> GameGenome:
     """Create Scopa (Italian capturing game) genome.
 
@@ -535,15 +551,11 @@ def create_scopa_genome() -> GameGenome:
             tableau_mode=TableauMode.MATCH_RANK,
         ),
         turn_structure=TurnStructure(
-            phases=[
+            phases=(
                 # Play card to capture or add to tableau
                 PlayPhase(
                     target=Location.TABLEAU,
-                    valid_play_condition=Condition(
-                        type=ConditionType.HAND_SIZE,
-                        operator=Operator.GT,
-                        value=0
-                    ),
+                    valid_play_condition=_HAND_NONEMPTY,
                     min_cards=1,
                     max_cards=1,
                     mandatory=True,
@@ -560,18 +572,19 @@ def create_scopa_genome() -> GameGenome:
                         value=0
                     )
                 )
-            ]
+            )
+        ),
+        special_effects=(),
+        win_conditions=(
+            WinCondition(type="most_captured"),
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="most_captured")
-        ],
-        scoring_rules=[],
+        scoring_rules=(),
         max_turns=100,
         player_count=2
     )
 
 
+@cache
 def create_draw_poker_genome() -> GameGenome:
     """Create Draw Poker card game genome.
 
@@ -661,7 +674,7 @@ def create_draw_poker_genome() -> GameGenome:
             starting_chips=1000,
         ),
         turn_structure=TurnStructure(
-            phases=[
+            phases=(
                 # Pre-draw betting round
                 BettingPhase(
                     min_bet=20,
@@ -679,19 +692,15 @@ def create_draw_poker_genome() -> GameGenome:
                     source=Location.DECK,
                     count=3,
                     mandatory=False,
-                    condition=Condition(
-                        type=ConditionType.HAND_SIZE,
-                        operator=Operator.LT,
-                        value=5
-                    )
+                    condition=_HAND_UNDER_FIVE
                 ),
-            ]
+            )
         ),
-        special_effects=[],
-        win_conditions=[
+        special_effects=(),
+        win_conditions=(
             WinCondition(type="best_hand"),
-        ],
-        scoring_rules=[],
+        ),
+        scoring_rules=(),
         max_turns=20,
         player_count=2,
         hand_evaluation=HandEvaluation(
@@ -701,6 +710,7 @@ def create_draw_poker_genome() -> GameGenome:
     )
 
 
+@cache
 def create_scotch_whist_genome() -> GameGenome:
     """Create Scotch Whist (Catch the Ten) card game genome.
 
@@ -726,18 +736,14 @@ def create_scotch_whist_genome() -> GameGenome:
             trump_suit=Suit.SPADES  # Spades has good distribution
         ),
         turn_structure=TurnStructure(
-            phases=[
-                TrickPhase(
-                    lead_suit_required=True,
-                    trump_suit=Suit.SPADES,
-                    high_card_wins=True
-                )
-            ],
+            phases=(
+                _trick_phase(Suit.SPADES),
+            ),
             is_trick_based=True,
             tricks_per_hand=13
         ),
-        special_effects=[],
-        win_conditions=[
+        special_effects=(),
+        win_conditions=(
             WinCondition(
                 type="most_tricks",  # Most tricks wins - simpler and more balanced
                 threshold=0
@@ -746,13 +752,14 @@ def create_scotch_whist_genome() -> GameGenome:
                 type="all_hands_empty",
                 threshold=0
             )
-        ],
-        scoring_rules=[],
+        ),
+        scoring_rules=(),
         max_turns=200,
         player_count=2
     )
 
 
+@cache
 def create_knockout_whist_genome() -> GameGenome:
     """Create Knock-Out Whist card game genome.
 
@@ -781,18 +788,14 @@ def create_knockout_whist_genome() -> GameGenome:
             trump_suit=Suit.HEARTS
         ),
         turn_structure=TurnStructure(
-            phases=[
-                TrickPhase(
-                    lead_suit_required=True,
-                    trump_suit=Suit.HEARTS,
-                    high_card_wins=True
-                )
-            ],
+            phases=(
+                _trick_phase(Suit.HEARTS),
+            ),
             is_trick_based=True,
             tricks_per_hand=7
         ),
-        special_effects=[],
-        win_conditions=[
+        special_effects=(),
+        win_conditions=(
             WinCondition(
                 type="most_tricks",  # Most tricks wins
                 threshold=0
@@ -801,13 +804,14 @@ def create_knockout_whist_genome() -> GameGenome:
                 type="all_hands_empty",
                 threshold=0
             )
-        ],
-        scoring_rules=[],
+        ),
+        scoring_rules=(),
         max_turns=100,
         player_count=4
     )
 
 
+@cache
 def create_blackjack_genome() -> GameGenome:
     """Create Blackjack/21 card game genome.
 
@@ -845,7 +849,7 @@ def create_blackjack_genome() -> GameGenome:
             starting_chips=500,
         ),
         turn_structure=TurnStructure(
-            phases=[
+            phases=(
                 # Bet before seeing full hand
                 BettingPhase(
                     min_bet=25,
@@ -857,22 +861,18 @@ def create_blackjack_genome() -> GameGenome:
                     source=Location.DECK,
                     count=1,
                     mandatory=False,
-                    condition=Condition(
-                        type=ConditionType.HAND_SIZE,
-                        operator=Operator.LT,
-                        value=5  # Max 5 cards (5-card charlie)
-                    )
+                    condition=_HAND_UNDER_FIVE  # Max 5 cards (5-card charlie)
                 ),
-            ]
+            )
         ),
-        special_effects=[],
-        win_conditions=[
+        special_effects=(),
+        win_conditions=(
             WinCondition(
                 type="high_score",
                 threshold=21
             ),
-        ],
-        scoring_rules=[],
+        ),
+        scoring_rules=(),
         max_turns=20,
         player_count=2,
         hand_evaluation=HandEvaluation(
@@ -884,6 +884,7 @@ def create_blackjack_genome() -> GameGenome:
     )
 
 
+@cache
 def create_fan_tan_genome() -> GameGenome:
     """Create Fan Tan / Sevens card game genome.
 
@@ -910,17 +911,17 @@ def create_fan_tan_genome() -> GameGenome:
             sequence_direction=SequenceDirection.BOTH,
         ),
         turn_structure=TurnStructure(
-            phases=[
+            phases=(
                 # Play a card - 6s, 7s, 8s are key cards
                 PlayPhase(
                     target=Location.TABLEAU,
                     valid_play_condition=CompoundCondition(
                         logic="OR",
-                        conditions=[
+                        conditions=(
                             Condition(type=ConditionType.CARD_IS_RANK, value=Rank.SIX),
                             Condition(type=ConditionType.CARD_IS_RANK, value=Rank.SEVEN),
-                            Condition(type=ConditionType.CARD_IS_RANK, value=Rank.EIGHT),
-                        ]
+                            _CARD_IS_EIGHT,
+                        )
                     ),
                     min_cards=1,
                     max_cards=1,
@@ -930,11 +931,7 @@ def create_fan_tan_genome() -> GameGenome:
                 # Play any other card to discard
                 PlayPhase(
                     target=Location.DISCARD,
-                    valid_play_condition=Condition(
-                        type=ConditionType.HAND_SIZE,
-                        operator=Operator.GT,
-                        value=0
-                    ),
+                    valid_play_condition=_HAND_NONEMPTY,
                     min_cards=1,
                     max_cards=1,
                     mandatory=False,
@@ -952,18 +949,19 @@ def create_fan_tan_genome() -> GameGenome:
                         value=0
                     )
                 )
-            ]
+            )
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="empty_hand")
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            WinCondition(type="empty_hand"),
+        ),
+        scoring_rules=(),
         max_turns=150,
         player_count=2
     )
 
 
+@cache
 def create_president_genome() -> GameGenome:
     """Create President / Daifugō card game genome.
 
@@ -990,13 +988,13 @@ def create_president_genome() -> GameGenome:
             initial_discard_count=0
         ),
         turn_structure=TurnStructure(
-            phases=[
+            phases=(
                 # Play to beat top card or start new round
                 PlayPhase(
                     target=Location.TABLEAU,
                     valid_play_condition=CompoundCondition(
                         logic="OR",
-                        conditions=[
+                        conditions=(
                             # Tableau empty - can play anything
                             Condition(
                                 type=ConditionType.LOCATION_SIZE,
@@ -1010,25 +1008,26 @@ def create_president_genome() -> GameGenome:
                                 reference="tableau",
                                 value="two_high"  # Special ranking: 2 is highest
                             )
-                        ]
+                        )
                     ),
                     min_cards=1,
                     max_cards=1,
                     mandatory=True,
                     pass_if_unable=True  # Pass starts new round
-                )
-            ]
+                ),
+            )
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="empty_hand")
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            WinCondition(type="empty_hand"),
+        ),
+        scoring_rules=(),
         max_turns=300,  # Longer for 4 players
         player_count=4
     )
 
 
+@cache
 def create_spades_genome() -> GameGenome:
     """Create Spades card game genome with bidding.
 
@@ -1049,23 +1048,18 @@ def create_spades_genome() -> GameGenome:
             trump_suit=Suit.SPADES
         ),
         turn_structure=TurnStructure(
-            phases=[
+            phases=(
                 BiddingPhase(min_bid=1, max_bid=13, allow_nil=True),
-                TrickPhase(
-                    lead_suit_required=True,
-                    trump_suit=Suit.SPADES,
-                    high_card_wins=True,
-                    breaking_suit=Suit.SPADES  # Can't lead spades until broken
-                ),
-            ],
+                _trick_phase(Suit.SPADES, Suit.SPADES),  # Can't lead spades until broken
+            ),
             is_trick_based=True,
             tricks_per_hand=13
         ),
-        special_effects=[],
-        win_conditions=[
+        special_effects=(),
+        win_conditions=(
             WinCondition(type="score_threshold", threshold=500),
-        ],
-        scoring_rules=[],
+        ),
+        scoring_rules=(),
         contract_scoring=ContractScoring(
             points_per_trick_bid=10,
             overtrick_points=1,
@@ -1080,6 +1074,7 @@ def create_spades_genome() -> GameGenome:
     )
 
 
+@cache
 def create_partnership_spades_genome() -> GameGenome:
     """Create Partnership Spades card game genome with bidding.
 
@@ -1110,28 +1105,23 @@ def create_partnership_spades_genome() -> GameGenome:
             trump_suit=Suit.SPADES
         ),
         turn_structure=TurnStructure(
-            phases=[
+            phases=(
                 BiddingPhase(min_bid=1, max_bid=13, allow_nil=True),
-                TrickPhase(
-                    lead_suit_required=True,
-                    trump_suit=Suit.SPADES,
-                    high_card_wins=True,
-                    breaking_suit=Suit.SPADES  # Can't lead spades until broken
-                ),
-            ],
+                _trick_phase(Suit.SPADES, Suit.SPADES),  # Can't lead spades until broken
+            ),
             is_trick_based=True,
             tricks_per_hand=13  # 13 tricks per hand
         ),
-        special_effects=[],
-        win_conditions=[
+        special_effects=(),
+        win_conditions=(
             WinCondition(
                 type="score_threshold",
                 threshold=500,  # First team to 500 points wins
                 comparison=WinComparison.HIGHEST,
                 trigger_mode=TriggerMode.THRESHOLD_GATE,
             ),
-        ],
-        scoring_rules=[],
+        ),
+        scoring_rules=(),
         contract_scoring=ContractScoring(
             points_per_trick_bid=10,
             overtrick_points=1,
@@ -1149,6 +1139,7 @@ def create_partnership_spades_genome() -> GameGenome:
     )
 
 
+@cache
 def create_uno_genome() -> GameGenome:
     """
     Uno-style game with special effects.
@@ -1169,15 +1160,15 @@ def create_uno_genome() -> GameGenome:
             initial_discard_count=1,  # Start with one card face up
             custom_printed_deck=True,  # Effects are printed on the cards (no memorization)
         ),
-        turn_structure=TurnStructure(phases=[
+        turn_structure=TurnStructure(phases=(
             PlayPhase(
                 target=Location.DISCARD,
                 valid_play_condition=CompoundCondition(
                     logic="OR",
-                    conditions=[
-                        Condition(type=ConditionType.CARD_MATCHES_RANK, reference="top_discard"),
-                        Condition(type=ConditionType.CARD_MATCHES_SUIT, reference="top_discard"),
-                    ]
+                    conditions=(
+                        _MATCHES_TOP_RANK,
+                        _MATCHES_TOP_SUIT,
+                    )
                 ),
                 min_cards=1,
                 max_cards=1,
@@ -1189,22 +1180,23 @@ def create_uno_genome() -> GameGenome:
                 count=1,
                 mandatory=False,  # Can choose not to draw
             ),
-        ]),
-        special_effects=[
+        )),
+        special_effects=(
             SpecialEffect(Rank.TWO, EffectType.DRAW_CARDS, TargetSelector.NEXT_PLAYER, 2),
             SpecialEffect(Rank.JACK, EffectType.SKIP_NEXT, TargetSelector.NEXT_PLAYER, 1),
             SpecialEffect(Rank.QUEEN, EffectType.REVERSE_DIRECTION, TargetSelector.ALL_OPPONENTS, 1),
             SpecialEffect(Rank.KING, EffectType.EXTRA_TURN, TargetSelector.NEXT_PLAYER, 1),
-        ],
-        win_conditions=[
+        ),
+        win_conditions=(
             WinCondition(type="empty_hand"),
-        ],
-        scoring_rules=[],
+        ),
+        scoring_rules=(),
         max_turns=500,  # Increased from 200 - shedding games need more turns
         player_count=2,
     )
 
 
+@cache
 def create_simple_poker_genome() -> GameGenome:
     """Create Simple Poker card game genome with betting.
 
@@ -1294,19 +1286,19 @@ def create_simple_poker_genome() -> GameGenome:
             starting_chips=1000,  # Enable betting
         ),
         turn_structure=TurnStructure(
-            phases=[
+            phases=(
                 BettingPhase(
                     min_bet=10,
                     max_raises=3,
                     showdown_method=ShowdownMethod.HAND_EVALUATION,
                 ),
-            ],
+            ),
         ),
-        special_effects=[],
-        win_conditions=[
+        special_effects=(),
+        win_conditions=(
             WinCondition(type="best_hand"),  # Best poker hand wins at showdown
-        ],
-        scoring_rules=[],
+        ),
+        scoring_rules=(),
         max_turns=10,  # Poker hands are quick
         player_count=2,
         hand_evaluation=HandEvaluation(
@@ -1352,30 +1344,45 @@ def get_seed_genomes() -> List[GameGenome]:
     - Draw Poker: Hand improvement
     - Blackjack: Hand value targeting
     """
-    return [
-        # Luck-based
-        create_war_genome(),
-        create_betting_war_genome(),
-        # Trick-taking
-        create_hearts_genome(),
-        create_scotch_whist_genome(),
-        create_knockout_whist_genome(),
-        create_spades_genome(),
-        create_partnership_spades_genome(),  # First team game
-        # Shedding/Matching
-        create_crazy_eights_genome(),
-        create_old_maid_genome(),
-        create_president_genome(),
-        create_fan_tan_genome(),
-        create_uno_genome(),
-        # Set Collection
-        create_gin_rummy_genome(),
-        create_go_fish_genome(),
-        # Betting
-        create_simple_poker_genome(),
-        # Other Mechanics
-        create_cheat_genome(),
-        create_scopa_genome(),
-        create_draw_poker_genome(),
-        create_blackjack_genome(),
-    ]
+    return list(iter_seed_genomes())
+
+
+# Seed games by genome_id, in seeding order. Factories build on first use,
+# so callers that need one game never construct the rest.
+_SEED_FACTORIES: Dict[str, Callable[[], GameGenome]] = {
+    # Luck-based
+    "war-baseline": create_war_genome,
+    "betting-war": create_betting_war_genome,
+    # Trick-taking
+    "hearts-classic": create_hearts_genome,
+    "scotch-whist": create_scotch_whist_genome,
+    "knockout-whist": create_knockout_whist_genome,
+    "spades": create_spades_genome,
+    "partnership-spades": create_partnership_spades_genome,  # First team game
+    # Shedding/Matching
+    "crazy-eights": create_crazy_eights_genome,
+    "old-maid": create_old_maid_genome,
+    "president": create_president_genome,
+    "fan-tan": create_fan_tan_genome,
+    "uno-style": create_uno_genome,
+    # Set Collection
+    "gin-rummy-simplified": create_gin_rummy_genome,
+    "go-fish": create_go_fish_genome,
+    # Betting
+    "simple-poker": create_simple_poker_genome,
+    # Other Mechanics
+    "cheat": create_cheat_genome,
+    "scopa": create_scopa_genome,
+    "draw-poker": create_draw_poker_genome,
+    "blackjack": create_blackjack_genome,
+}
+
+
+def iter_seed_genomes() -> Iterator[GameGenome]:
+    """Yield the seed genomes in order, building each only when reached."""
+    return (factory() for factory in _SEED_FACTORIES.values())
+
+
+def get_seed_genome(genome_id: str) -> GameGenome:
+    """Get one seed genome by genome_id (KeyError if there is none)."""
+    return _SEED_FACTORIES[genome_id]()
@@ -1,9 +1,10 @@
 """JSON serialization for GameGenome."""
 
+import hashlib
 import json
 from enum import Enum
 from typing import Any, Dict, List, Optional
-from dataclasses import asdict
+from dataclasses import asdict, replace
 
 from darwindeck.genome.schema import (
     GameGenome, SetupRules, TurnStructure, WinCondition,
@@ -49,6 +50,17 @@ def genome_to_json(genome: GameGenome, indent: int = 2) -> str:
     return json.dumps(genome_to_dict(genome), indent=indent)
 
 
+def genome_content_hash(genome: GameGenome) -> str:
+    """Hex digest identifying a genome's rules, ignoring genome_id and generation.
+
+    Genomes are trees of frozen dataclasses, so their repr is a canonical
+    rendering of every field (unlike the JSON form, which is lossy for some
+    phase types).
+    """
+    anonymous = replace(genome, genome_id="", generation=0)
+    return hashlib.blake2b(repr(anonymous).encode(), digest_size=16).hexdigest()
+
+
 def genome_from_dict(data: Dict[str, Any]) -> GameGenome:
     """Create GameGenome from dict."""
     return GameGenome(
@@ -1,6 +1,6 @@
 """Genome validation to catch invalid field combinations."""
 
-from typing import List, Set
+from typing import Callable, Iterable, Iterator, List, Set, Tuple
 from darwindeck.genome.schema import (
     GameGenome, BettingPhase, HandEvaluationMethod, TableauMode,
     ShowdownMethod, TrickPhase, PlayPhase, DiscardPhase, DrawPhase,
@@ -10,6 +10,134 @@ from darwindeck.genome.schema import (
 # Standard deck size
 STANDARD_DECK_SIZE = 52
 
+SCORE_WINS = frozenset({"high_score", "low_score", "first_to_score"})
+CAPTURE_WINS = frozenset({"capture_all", "most_captured"})
+CAPTURE_TABLEAU_MODES = frozenset({TableauMode.WAR, TableauMode.MATCH_RANK})
+CARD_PLAY_PHASES = (TrickPhase, PlayPhase, DiscardPhase, DrawPhase)
+
+# Error messages; templates are only formatted when their check fires
+_MSG_DECK_TOO_SMALL = "Setup requires {needed} cards but deck only has {deck}"
+_MSG_SCORE_WIN = "Score-based win condition requires card_scoring or scoring_rules"
+_MSG_BEST_HAND = "best_hand win condition requires hand_evaluation with PATTERN_MATCH"
+_MSG_BETTING_CHIPS = "BettingPhase requires setup.starting_chips > 0"
+_MSG_SHOWDOWN_EVAL = "BettingPhase with HAND_EVALUATION showdown requires hand_evaluation"
+_MSG_CAPTURE_WIN = "Capture win condition requires tableau_mode WAR or MATCH_RANK"
+_MSG_HAND_PATTERN = (
+    "HandPattern '{name}': same_rank_groups sum ({group_sum}) "
+    "exceeds required_count ({required})"
+)
+_MSG_NO_CARD_PLAY = (
+    "Game has no card play phases "
+    "(needs TrickPhase, PlayPhase, DiscardPhase, or DrawPhase)"
+)
+_MSG_MIN_BET = (
+    "BettingPhase min_bet ({min_bet}) is too high relative to "
+    "starting_chips ({starting}) - limits meaningful betting"
+)
+_MSG_TOO_FEW_TEAMS = "Team mode requires at least 2 teams, got {count}"
+_MSG_EMPTY_TEAM = "Team {team} is empty"
+_MSG_PLAYER_RANGE = "Player index {player} out of range [0, {count})"
+_MSG_DUPLICATE_PLAYER = "Duplicate player {player} appears in multiple teams"
+_MSG_UNASSIGNED = "Players not assigned to any team: {players}"
+_MSG_BIDDING_TRICKS = "BiddingPhase requires at least one TrickPhase (contracts need tricks)"
+_MSG_CONTRACT_BIDDING = "ContractScoring requires BiddingPhase"
+
+
+def _cards_needed(genome: GameGenome) -> int:
+    """Cards dealt at setup, including the initial discard."""
+    return (
+        genome.setup.cards_per_player * genome.player_count
+        + genome.setup.initial_discard_count
+    )
+
+
+def _has_pattern_eval(genome: GameGenome) -> bool:
+    """True if hands are ranked by pattern matching."""
+    return (
+        genome.hand_evaluation is not None
+        and genome.hand_evaluation.method == HandEvaluationMethod.PATTERN_MATCH
+    )
+
+
+def _showdown_errors(genome: GameGenome) -> List[str]:
+    """One error per HAND_EVALUATION showdown, which needs hand_evaluation."""
+    return [
+        _MSG_SHOWDOWN_EVAL
+        for phase in genome.phases_of(BettingPhase)
+        if phase.showdown_method == ShowdownMethod.HAND_EVALUATION
+    ]
+
+
+def _hand_pattern_errors(genome: GameGenome) -> Iterator[str]:
+    """Patterns whose same_rank_groups need more cards than required_count.
+
+    Evolved genomes often repeat a pattern, so each problem is reported once.
+    """
+    reported: Set[Tuple[str, int, int]] = set()
+    for pattern in genome.hand_evaluation.patterns:
+        required = pattern.required_count
+        if pattern.same_rank_groups and required:
+            group_sum = sum(pattern.same_rank_groups)
+            key = (pattern.name, group_sum, required)
+            if group_sum > required and key not in reported:
+                reported.add(key)
+                yield _MSG_HAND_PATTERN.format(
+                    name=pattern.name, group_sum=group_sum, required=required
+                )
+
+
+# Checks 0-7 as (applies, errors) pairs, in check order. Errors are only
+# built for rules that fire.
+_Rule = Tuple[Callable[[GameGenome], bool], Callable[[GameGenome], Iterable[str]]]
+
+_RULES: Tuple[_Rule, ...] = (
+    # Check 0: Setup requires valid number of cards
+    (
+        lambda g: _cards_needed(g) > STANDARD_DECK_SIZE,
+        lambda g: (_MSG_DECK_TOO_SMALL.format(
+            needed=_cards_needed(g), deck=STANDARD_DECK_SIZE
+        ),),
+    ),
+    # Check 1: Score-based wins require scoring rules
+    (
+        lambda g: bool(g.win_types & SCORE_WINS)
+        and not (g.card_scoring or g.scoring_rules),
+        lambda g: (_MSG_SCORE_WIN,),
+    ),
+    # Check 2: best_hand win requires hand_evaluation with PATTERN_MATCH
+    (
+        lambda g: "best_hand" in g.win_types and not _has_pattern_eval(g),
+        lambda g: (_MSG_BEST_HAND,),
+    ),
+    # Check 3: Betting phase requires starting_chips > 0
+    (
+        lambda g: bool(g.phases_of(BettingPhase))
+        and g.setup.starting_chips <= 0,
+        lambda g: (_MSG_BETTING_CHIPS,),
+    ),
+    # Check 4: Betting showdown=HAND_EVALUATION requires hand_evaluation
+    (
+        lambda g: g.hand_evaluation is None and bool(g.phases_of(BettingPhase)),
+        _showdown_errors,
+    ),
+    # Check 5: Capture wins require capture mechanic
+    (
+        lambda g: bool(g.win_types & CAPTURE_WINS)
+        and g.setup.tableau_mode not in CAPTURE_TABLEAU_MODES,
+        lambda g: (_MSG_CAPTURE_WIN,),
+    ),
+    # Check 6: HandPattern constraints must be internally consistent
+    (
+        lambda g: g.hand_evaluation is not None and bool(g.hand_evaluation.patterns),
+        _hand_pattern_errors,
+    ),
+    # Check 7: Game must have card play phases (not just betting)
+    (
+        lambda g: not any(g.phases_of(t) for t in CARD_PLAY_PHASES),
+        lambda g: (_MSG_NO_CARD_PLAY,),
+    ),
+)
+
 
 class GenomeValidator:
     """Validates genome consistency at parse time."""
@@ -17,132 +145,54 @@ class GenomeValidator:
     @staticmethod
     def validate(genome: GameGenome) -> List[str]:
         """Return list of validation errors (empty = valid)."""
-        errors: List[str] = []
-
-        # Check 0: Setup requires valid number of cards
-        cards_needed = genome.setup.cards_per_player * genome.player_count
-        cards_needed += genome.setup.initial_discard_count
-        if cards_needed > STANDARD_DECK_SIZE:
-            errors.append(
-                f"Setup requires {cards_needed} cards but deck only has {STANDARD_DECK_SIZE}"
-            )
-
-        # Get win condition types
-        win_types = {wc.type for wc in genome.win_conditions}
-
-        # Check 1: Score-based wins require scoring rules
-        score_wins = {"high_score", "low_score", "first_to_score"}
-        if win_types & score_wins:
-            has_scoring = bool(genome.card_scoring) or bool(genome.scoring_rules)
-            if not has_scoring:
-                errors.append(
-                    "Score-based win condition requires card_scoring or scoring_rules"
-                )
+        return list(GenomeValidator._iter_errors(genome))
 
-        # Check 2: best_hand win requires hand_evaluation with PATTERN_MATCH
-        if "best_hand" in win_types:
-            has_pattern_eval = (
-                genome.hand_evaluation is not None
-                and genome.hand_evaluation.method == HandEvaluationMethod.PATTERN_MATCH
-            )
-            if not has_pattern_eval:
-                errors.append(
-                    "best_hand win condition requires hand_evaluation with PATTERN_MATCH"
-                )
+    @staticmethod
+    def is_valid(genome: GameGenome) -> bool:
+        """Return True if the genome passes validation.
 
-        # Check 3: Betting phase requires starting_chips > 0
-        has_betting = any(
-            isinstance(p, BettingPhase)
-            for p in genome.turn_structure.phases
-        )
-        if has_betting and genome.setup.starting_chips <= 0:
-            errors.append(
-                "BettingPhase requires setup.starting_chips > 0"
-            )
-
-        # Check 4: Betting showdown=HAND_EVALUATION requires hand_evaluation
-        for phase in genome.turn_structure.phases:
-            if isinstance(phase, BettingPhase):
-                if phase.showdown_method == ShowdownMethod.HAND_EVALUATION:
-                    if genome.hand_evaluation is None:
-                        errors.append(
-                            "BettingPhase with HAND_EVALUATION showdown requires hand_evaluation"
-                        )
-
-        # Check 5: Capture wins require capture mechanic
-        capture_wins = {"capture_all", "most_captured"}
-        if win_types & capture_wins:
-            has_capture = genome.setup.tableau_mode in {TableauMode.WAR, TableauMode.MATCH_RANK}
-            if not has_capture:
-                errors.append(
-                    "Capture win condition requires tableau_mode WAR or MATCH_RANK"
-                )
+        Stops at the first error, so callers that only need a pass/fail
+        answer (fitness filtering) skip the remaining checks on broken
+        genomes.
+        """
+        return next(GenomeValidator._iter_errors(genome), None) is None
 
-        # Check 6: HandPattern constraints must be internally consistent
-        if genome.hand_evaluation and genome.hand_evaluation.patterns:
-            for pattern in genome.hand_evaluation.patterns:
-                if pattern.same_rank_groups and pattern.required_count:
-                    group_sum = sum(pattern.same_rank_groups)
-                    if group_sum > pattern.required_count:
-                        errors.append(
-                            f"HandPattern '{pattern.name}': same_rank_groups sum "
-                            f"({group_sum}) exceeds required_count ({pattern.required_count})"
-                        )
-
-        # Check 7: Game must have card play phases (not just betting)
-        card_play_phases = (TrickPhase, PlayPhase, DiscardPhase, DrawPhase)
-        has_card_play = any(
-            isinstance(p, card_play_phases)
-            for p in genome.turn_structure.phases
-        )
-        if not has_card_play:
-            errors.append(
-                "Game has no card play phases (needs TrickPhase, PlayPhase, DiscardPhase, or DrawPhase)"
-            )
+    @staticmethod
+    def _iter_errors(genome: GameGenome) -> Iterator[str]:
+        """Yield validation errors lazily, in check order."""
+        for applies, errors in _RULES:
+            if applies(genome):
+                yield from errors(genome)
 
         # Check 8: Betting min_bet should allow meaningful play
-        for phase in genome.turn_structure.phases:
-            if isinstance(phase, BettingPhase):
-                starting = genome.setup.starting_chips
-                if starting > 0 and phase.min_bet > 0:
-                    # If min_bet > starting_chips / 2, players can only bet once
-                    # This allows 50/100 (2 bets possible) but catches 67/100 (1 bet)
-                    if phase.min_bet > starting // 2:
-                        errors.append(
-                            f"BettingPhase min_bet ({phase.min_bet}) is too high "
-                            f"relative to starting_chips ({starting}) - limits meaningful betting"
-                        )
+        starting = genome.setup.starting_chips
+        for phase in genome.phases_of(BettingPhase):
+            if starting > 0 and phase.min_bet > 0:
+                # If min_bet > starting_chips / 2, players can only bet once
+                # This allows 50/100 (2 bets possible) but catches 67/100 (1 bet)
+                if phase.min_bet > starting // 2:
+                    yield _MSG_MIN_BET.format(min_bet=phase.min_bet, starting=starting)
 
         # Check 9: Team configuration validation
-        GenomeValidator._validate_teams(genome, errors)
+        yield from GenomeValidator._validate_teams(genome)
 
         # Check 10: Bidding configuration validation
-        errors.extend(GenomeValidator._validate_bidding(genome))
-
-        return errors
+        yield from GenomeValidator._validate_bidding(genome)
 
     @staticmethod
-    def _validate_bidding(genome: GameGenome) -> List[str]:
+    def _validate_bidding(genome: GameGenome) -> Iterator[str]:
         """Validate bidding phase configuration."""
-        errors: List[str] = []
-
-        has_bidding_phase = any(
-            isinstance(p, BiddingPhase) for p in genome.turn_structure.phases
-        )
-        has_trick_phase = any(
-            isinstance(p, TrickPhase) for p in genome.turn_structure.phases
-        )
+        has_bidding_phase = bool(genome.phases_of(BiddingPhase))
+        has_trick_phase = bool(genome.phases_of(TrickPhase))
 
         if has_bidding_phase and not has_trick_phase:
-            errors.append("BiddingPhase requires at least one TrickPhase (contracts need tricks)")
+            yield _MSG_BIDDING_TRICKS
 
         if genome.contract_scoring is not None and not has_bidding_phase:
-            errors.append("ContractScoring requires BiddingPhase")
-
-        return errors
+            yield _MSG_CONTRACT_BIDDING
 
     @staticmethod
-    def _validate_teams(genome: GameGenome, errors: List[str]) -> None:
+    def _validate_teams(genome: GameGenome) -> Iterator[str]:
         """Validate team configuration if team_mode is enabled."""
         if not genome.team_mode:
             return  # Skip validation if team_mode is False
@@ -151,30 +201,28 @@ class GenomeValidator:
 
         # Must have at least 2 teams
         if len(genome.teams) < 2:
-            errors.append(f"Team mode requires at least 2 teams, got {len(genome.teams)}")
+            yield _MSG_TOO_FEW_TEAMS.format(count=len(genome.teams))
             return
 
-        # Collect all player indices
-        all_players: Set[int] = set()
+        # Track assigned players as bits of one int
+        assigned = 0
         for team_idx, team in enumerate(genome.teams):
             if len(team) == 0:
-                errors.append(f"Team {team_idx} is empty")
+                yield _MSG_EMPTY_TEAM.format(team=team_idx)
                 continue
             for player_idx in team:
                 # Check for out-of-range
-                if player_idx < 0 or player_idx >= num_players:
-                    errors.append(
-                        f"Player index {player_idx} out of range [0, {num_players})"
-                    )
-                # Check for duplicates
-                if player_idx in all_players:
-                    errors.append(
-                        f"Duplicate player {player_idx} appears in multiple teams"
-                    )
-                all_players.add(player_idx)
+                if not 0 <= player_idx < num_players:
+                    yield _MSG_PLAYER_RANGE.format(player=player_idx, count=num_players)
+                # Check for duplicates (negative indices have no bit)
+                if player_idx >= 0:
+                    bit = 1 << player_idx
+                    if assigned & bit:
+                        yield _MSG_DUPLICATE_PLAYER.format(player=player_idx)
+                    assigned |= bit
 
         # Check all players are assigned
-        expected_players = set(range(num_players))
-        missing = expected_players - all_players
-        if missing:
-            errors.append(f"Players not assigned to any team: {sorted(missing)}")
+        missing_mask = ((1 << num_players) - 1) & ~assigned
+        if missing_mask:
+            missing = [i for i in range(num_players) if missing_mask >> i & 1]
+            yield _MSG_UNASSIGNED.format(players=missing)
@@ -2,27 +2,42 @@
 
 from __future__ import annotations
 
-from typing import Union
+from typing import Optional, Union
 
 from darwindeck.simulation.state import GameState, Card
 from darwindeck.simulation.movegen import LegalMove, BettingMove, BettingAction
-from darwindeck.genome.schema import GameGenome, Location, PlayPhase, BettingPhase, DiscardPhase, TrickPhase, ClaimPhase, DrawPhase
+from darwindeck.genome.schema import (
+    GameGenome, Location, Rank, Suit, PlayPhase, BettingPhase, DiscardPhase, TrickPhase,
+    ClaimPhase, DrawPhase,
+)
 from darwindeck.simulation.movegen import MOVE_CHALLENGE, MOVE_CLAIM_PASS, MOVE_DRAW, MOVE_DRAW_PASS
 
 
 # Unicode card symbols
 SUIT_SYMBOLS = {"H": "\u2665", "D": "\u2666", "C": "\u2663", "S": "\u2660"}
 
+# Display string for every (rank, suit) in the deck
+_CARD_STRINGS: dict[tuple[Rank, Suit], str] = {
+    (rank, suit): f"{rank.value}{SUIT_SYMBOLS.get(suit.value, suit.value)}"
+    for suit in Suit
+    for rank in Rank
+}
+
 
 def format_card(card: Card) -> str:
     """Format card with unicode suit symbol."""
-    suit_symbol = SUIT_SYMBOLS.get(card.suit.value, card.suit.value)
-    return f"{card.rank.value}{suit_symbol}"
+    return _CARD_STRINGS[card.rank, card.suit]
 
 
 class StateRenderer:
     """Renders visible game state to terminal."""
 
+    def __init__(self) -> None:
+        # A session renders the same genome every turn, so remember whether
+        # the last genome seen uses a discard pile.
+        self._discard_genome: Optional[GameGenome] = None
+        self._uses_discard = False
+
     def render(
         self,
         state: GameState,
@@ -31,19 +46,17 @@ class StateRenderer:
         debug: bool = False,
     ) -> str:
         """Render state from player's perspective."""
-        lines: list[str] = []
-
         # Header
-        lines.append(f"=== Turn {state.turn} ===")
-        lines.append("")
+        lines: list[str] = [f"=== Turn {state.turn} ===", ""]
 
         # Player's hand
-        hand = state.players[player_idx].hand
+        player = state.players[player_idx]
+        hand = player.hand
         if hand:
-            cards_str = "  ".join(
-                f"[{i+1}] {format_card(card)}"
-                for i, card in enumerate(hand)
-            )
+            cards_str = "  ".join([
+                f"[{i}] {format_card(card)}"
+                for i, card in enumerate(hand, 1)
+            ])
             lines.append(f"Your hand: {cards_str}")
         else:
             lines.append("Your hand: (empty)")
@@ -54,19 +67,17 @@ class StateRenderer:
             lines.append(f"Discard pile: {top}")
 
         # Show chips and pot if betting game
-        if state.players[player_idx].chips > 0 or state.pot > 0:
-            player_chips = state.players[player_idx].chips
-            lines.append(f"Your chips: {player_chips} | Pot: {state.pot}")
+        if player.chips > 0 or state.pot > 0:
+            lines.append(f"Your chips: {player.chips} | Pot: {state.pot}")
             if state.current_bet > 0:
                 lines.append(f"Current bet: {state.current_bet}")
 
         # Debug mode
         if debug:
-            lines.append("")
-            lines.append("--- Debug Info ---")
+            lines += ("", "--- Debug Info ---")
             for i, p in enumerate(state.players):
                 if i != player_idx:
-                    opp_cards = ", ".join(format_card(c) for c in p.hand)
+                    opp_cards = ", ".join([format_card(c) for c in p.hand])
                     lines.append(f"Player {i} hand: [{opp_cards}]")
             lines.append(f"Deck: {len(state.deck)} cards")
 
@@ -74,10 +85,13 @@ class StateRenderer:
 
     def _has_discard(self, genome: GameGenome) -> bool:
         """Check if genome uses discard pile."""
-        for phase in genome.turn_structure.phases:
-            if isinstance(phase, PlayPhase) and phase.target == Location.DISCARD:
-                return True
-        return False
+        if genome is not self._discard_genome:
+            self._uses_discard = any(
+                phase.target == Location.DISCARD
+                for phase in genome.phases_of(PlayPhase)
+            )
+            self._discard_genome = genome
+        return self._uses_discard
 
 
 class MovePresenter:
@@ -103,22 +117,22 @@ class MovePresenter:
         draw_moves: list[LegalMove] = []
         betting_moves: list[BettingMove] = []
 
+        # Phase type decides play vs discard vs trick vs claim vs draw;
+        # phase classes are never subclassed, so exact type lookup is safe
+        moves_by_phase_type: dict[type, list[LegalMove]] = {
+            DiscardPhase: discard_moves,
+            TrickPhase: trick_moves,
+            ClaimPhase: claim_moves,
+            DrawPhase: draw_moves,
+        }
+        phases = genome.turn_structure.phases
+
         for m in moves:
             if isinstance(m, BettingMove):
                 betting_moves.append(m)
             elif isinstance(m, LegalMove):
-                # Check phase type to distinguish play vs discard vs trick vs claim vs draw
-                phase = genome.turn_structure.phases[m.phase_index]
-                if isinstance(phase, DiscardPhase):
-                    discard_moves.append(m)
-                elif isinstance(phase, TrickPhase):
-                    trick_moves.append(m)
-                elif isinstance(phase, ClaimPhase):
-                    claim_moves.append(m)
-                elif isinstance(phase, DrawPhase):
-                    draw_moves.append(m)
-                else:
-                    play_moves.append(m)
+                phase_type = type(phases[m.phase_index])
+                moves_by_phase_type.get(phase_type, play_moves).append(m)
 
         offset = 0
 
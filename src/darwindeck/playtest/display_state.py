@@ -9,9 +9,10 @@ internals. DisplayState acts as a ViewModel that:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MoveOption:
     """Simplified move for display.
 
@@ -24,7 +25,7 @@ class MoveOption:
     move_type: str  # "card", "betting", "pass"
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplayState:
     """Intermediate representation for display rendering.
 
@@ -58,7 +59,9 @@ class DisplayState:
     moves: list[MoveOption]  # Simplified move representation
 
     # History
-    move_log: list[tuple[str, str]]  # [(direction, description), ...]
+    # [(direction, description), ...]; may be the session's live log, so
+    # read it while rendering rather than holding on to it
+    move_log: Sequence[tuple[str, str]]
 
     # Terminal info
     terminal_width: int
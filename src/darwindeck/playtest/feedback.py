@@ -6,10 +6,22 @@ import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterable, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
-@dataclass
+
+def _dumps_line(data: dict) -> bytes:
+    """Encode one compact JSONL record (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return (json.dumps(data, separators=(",", ":"), ensure_ascii=False) + "\n").encode()
+
+
+@dataclass(slots=True)
 class PlaytestResult:
     """Result of a playtest session."""
 
@@ -47,17 +59,44 @@ class PlaytestResult:
 
 
 class FeedbackCollector:
-    """Collects and saves playtest feedback."""
+    """Collects and saves playtest feedback.
+
+    Each save() opens and closes the file. Use save_many() for a batch, or
+    the collector as a context manager to keep the file open across saves.
+    """
 
     def __init__(self, output_path: Path | str):
         """Initialize with output file path."""
         self.output_path = Path(output_path)
+        self._fh: Optional[BinaryIO] = None
+        self._dir_ready = False
+
+    def __enter__(self) -> FeedbackCollector:
+        self._fh = self._open()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
 
     def save(self, result: PlaytestResult) -> None:
         """Save result to JSONL file (append)."""
-        # Ensure parent directory exists
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.save_many((result,))
+
+    def save_many(self, results: Iterable[PlaytestResult]) -> None:
+        """Append several results as JSONL with a single write."""
+        lines = [_dumps_line(result.to_dict()) for result in results]
+        if self._fh is not None:
+            self._fh.writelines(lines)
+            return
+
+        with self._open() as f:
+            f.writelines(lines)
 
-        # Append as JSONL
-        with open(self.output_path, "a") as f:
-            f.write(json.dumps(result.to_dict()) + "\n")
+    def _open(self) -> BinaryIO:
+        """Open the output file for appending, creating its directory once."""
+        if not self._dir_ready:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        return open(self.output_path, "ab")
@@ -6,13 +6,19 @@ and renders it using Rich's Panel, Text, and Live components.
 
 from __future__ import annotations
 
+import signal
 import time
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Hashable, Iterator, Optional, Sequence
 
 from rich.console import Console, Group
 from rich.live import Live
 from rich.panel import Panel
-from rich.text import Text
+from rich.style import Style
+from rich.text import Span, Text
 
 if TYPE_CHECKING:
     from darwindeck.playtest.display_state import DisplayState
@@ -20,8 +26,46 @@ if TYPE_CHECKING:
 # Constants
 SUIT_SYMBOLS = {"H": "\u2665", "D": "\u2666", "C": "\u2663", "S": "\u2660"}
 SUIT_COLORS = {"H": "red", "D": "red", "C": "default", "S": "default"}
+SUIT_SYMBOL_TO_COLOR = {SUIT_SYMBOLS[suit]: SUIT_COLORS[suit] for suit in SUIT_SYMBOLS}
 MIN_WIDE_WIDTH = 60
 MOVE_LOG_SIZE = 5
+_LOG_ARROWS = ("\u2192", "\u2190")  # indexed by "is opponent move"
+
+# DEC mode 2026: terminal holds output between these and paints it as one
+# frame (ignored by terminals without support)
+SYNC_OUTPUT_BEGIN = "\x1b[?2026h"
+SYNC_OUTPUT_END = "\x1b[?2026l"
+
+# Fixed panel styling, parsed once rather than per frame (Panel copies
+# its title before rendering, so these Texts are safe to share)
+_BORDER_STYLE = Style.parse("dim cyan")
+_BOLD = Style(bold=True)
+_BOLD_GREEN = Style(color="green", bold=True)
+_BOLD_YELLOW = Style(color="yellow", bold=True)
+_YELLOW = Style(color="yellow")
+_DIM = Style(dim=True)
+_DIM_CYAN = Style(color="cyan", dim=True)
+_DIM_GREEN = Style(color="green", dim=True)
+_DIM_ITALIC = Style(dim=True, italic=True)
+_SEP = "  |  "
+
+# A piece of styled text: plain string or (text, style)
+_Part = str | tuple[str, str | Style]
+_TITLE_OPPONENT = Text.from_markup("[dim]Opponent[/dim]")
+_TITLE_HAND = Text.from_markup("[dim]Your Hand[/dim]")
+_TITLE_DISCARD = Text.from_markup("[dim]Discard[/dim]")
+_TITLE_ACTIONS = Text.from_markup("[dim]Actions[/dim]")
+
+# Placeholder sections never change, so each is one shared Panel
+_EMPTY_HAND_PANEL = Panel(
+    Text("(empty hand)", style=_DIM_ITALIC), title=_TITLE_HAND, border_style=_BORDER_STYLE
+)
+_EMPTY_DISCARD_PANEL = Panel(
+    Text("(empty)", style=_DIM_ITALIC), title=_TITLE_DISCARD, border_style=_BORDER_STYLE
+)
+_NO_MOVES_PANEL = Panel(
+    Text("No moves available", style=_DIM_ITALIC), title=_TITLE_ACTIONS, border_style=_BORDER_STYLE
+)
 
 
 def format_card_rich(rank: str, suit: str) -> Text:
@@ -34,21 +78,88 @@ def format_card_rich(rank: str, suit: str) -> Text:
     Returns:
         Rich Text with styled rank and colored suit symbol
     """
+    return Text.assemble(*_card_parts(rank, suit))
+
+
+@lru_cache(maxsize=128)
+def _card_parts(rank: str, suit: str) -> tuple[_Part, _Part]:
+    """(text, style) parts for a card, for building into a larger Text."""
     symbol = SUIT_SYMBOLS.get(suit, suit)
     color = SUIT_COLORS.get(suit, "default")
+    return ((rank, _BOLD), (symbol, color))
+
 
-    text = Text()
-    text.append(rank, style="bold")
-    text.append(symbol, style=color)
-    return text
+@lru_cache(maxsize=16)
+def _game_title(name: str) -> Text:
+    """Parsed outer panel title; shared, as Panel copies its title."""
+    return Text.from_markup(f"[bold cyan]{name}[/bold cyan]")
+
+
+def _recent_moves(move_log: Sequence[tuple[str, str]]) -> Sequence[tuple[str, str]]:
+    """Last MOVE_LOG_SIZE entries of the log, without copying a short log.
+
+    The session already bounds its log to MOVE_LOG_SIZE, so the common
+    case hands back the log itself.
+    """
+    excess = len(move_log) - MOVE_LOG_SIZE
+    if excess <= 0:
+        return move_log
+    return list(islice(move_log, excess, None))
+
+
+# Bumped on every SIGWINCH so displays know when to re-read the width
+_resize_generation = 0
+_resize_watch_installed = False
+
+
+def _watch_resizes() -> None:
+    """Count terminal resizes via SIGWINCH, chaining any existing handler.
+
+    A no-op off POSIX or outside the main thread; widths are then read
+    from the console on every call.
+    """
+    global _resize_watch_installed
+    if _resize_watch_installed or not hasattr(signal, "SIGWINCH"):
+        return
+
+    previous = signal.getsignal(signal.SIGWINCH)
+
+    def on_resize(signum, frame) -> None:
+        global _resize_generation
+        _resize_generation += 1
+        if callable(previous):
+            previous(signum, frame)
+
+    try:
+        signal.signal(signal.SIGWINCH, on_resize)
+    except ValueError:
+        # signal handlers can only be set from the main thread
+        return
+    _resize_watch_installed = True
 
 
 class RichDisplay:
     """Rich-based terminal display with Live updates."""
 
+    # Max built panels kept per display (LRU eviction)
+    CACHE_SIZE = 8
+
     def __init__(self) -> None:
         """Initialize the display with a Rich Console."""
-        self.console = Console()
+        # Everything printed is styled explicitly, so skip the repr
+        # highlighter's regex pass over printed strings
+        self.console = Console(highlight=False)
+        # Recently built panels by render key; AI turns and re-prompts
+        # often redraw a state that was just rendered
+        self._panel_cache: OrderedDict[Hashable, Panel] = OrderedDict()
+        # Render key of the frame currently left on screen, if any
+        self._shown_key: Optional[Hashable] = None
+        # Last built move log, reused while the visible entries are unchanged
+        self._log_cache: Optional[tuple[tuple, Text]] = None
+        # Last width read from the console, valid while no resize happened
+        self._width = 0
+        self._width_stamp: Optional[tuple[Console, int]] = None
+        _watch_resizes()
 
     def render(self, state: "DisplayState") -> Panel:
         """Build complete display layout from DisplayState.
@@ -59,6 +170,45 @@ class RichDisplay:
         Returns:
             Rich Panel containing the complete layout
         """
+        return self._render_keyed(state, self._render_key(state))
+
+    def _render_keyed(self, state: "DisplayState", key: Hashable) -> Panel:
+        """Return the panel for state, built or from the cache."""
+        panel = self._panel_cache.get(key)
+        if panel is not None:
+            self._panel_cache.move_to_end(key)
+            return panel
+
+        panel = self._render_uncached(state)
+        self._panel_cache[key] = panel
+        if len(self._panel_cache) > self.CACHE_SIZE:
+            self._panel_cache.popitem(last=False)
+        return panel
+
+    @staticmethod
+    def _render_key(state: "DisplayState") -> Hashable:
+        """Hashable snapshot of everything render() draws from state."""
+        return (
+            state.game_name,
+            state.turn,
+            state.phase_name,
+            state.player_id,
+            tuple(state.hand_cards),
+            state.opponent_card_count,
+            state.opponent_chips,
+            state.opponent_bet,
+            state.player_chips,
+            state.player_bet,
+            state.pot,
+            state.current_bet,
+            state.discard_top,
+            tuple(state.moves),
+            tuple(_recent_moves(state.move_log)),
+            state.terminal_width < MIN_WIDE_WIDTH,
+        )
+
+    def _render_uncached(self, state: "DisplayState") -> Panel:
+        """Build the layout for state without consulting the cache."""
         if state.terminal_width < MIN_WIDE_WIDTH:
             return self._render_compact(state)
         return self._render_wide(state)
@@ -76,10 +226,14 @@ class RichDisplay:
         Returns:
             User input string
         """
-        # Clear screen and render the state
-        self.console.clear()
-        panel = self.render(state)
-        self.console.print(panel)
+        # Clear screen and render the state, unless it is already shown
+        key = self._render_key(state)
+        if key != self._shown_key:
+            panel = self._render_keyed(state, key)
+            with self._synchronized_output():
+                self.console.clear()
+                self.console.print(panel)
+            self._shown_key = key
 
         # Prompt for input outside Live context
         return self.console.input(f"[bold green]{prompt}[/bold green]")
@@ -91,11 +245,46 @@ class RichDisplay:
             state: The DisplayState to render
             duration: How long to show the AI turn (seconds)
         """
-        self.console.clear()
-        panel = self.render(state)
-
-        with Live(panel, console=self.console, transient=True, refresh_per_second=4):
+        # Building and drawing the frame counts toward the pause, so a slow
+        # terminal does not stretch every AI turn
+        deadline = time.perf_counter() + duration
+        key = self._render_key(state)
+        if key == self._shown_key:
+            # Same frame already on screen; just pause
             time.sleep(duration)
+            return
+
+        panel = self._render_keyed(state, key)
+
+        # Nothing animates during the pause, so draw once and skip the
+        # refresh thread
+        live = Live(panel, console=self.console, transient=True, auto_refresh=False)
+        with self._synchronized_output():
+            self.console.clear()
+            live.start(refresh=True)
+        try:
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+        finally:
+            live.stop()
+        # Transient Live erases its frame on exit
+        self._shown_key = None
+
+    @contextmanager
+    def _synchronized_output(self) -> Iterator[None]:
+        """Write everything printed inside as one frame.
+
+        Console output is buffered for the block and flushed in a single
+        write, and on terminals it is bracketed so it paints atomically.
+        """
+        sync = self.console.is_terminal
+        with self.console:
+            if sync:
+                self.console.out(SYNC_OUTPUT_BEGIN, end="", highlight=False)
+            try:
+                yield
+            finally:
+                if sync:
+                    self.console.out(SYNC_OUTPUT_END, end="", highlight=False)
 
     def show_message(self, message: str, style: str = "bold") -> None:
         """Show a standalone message (win/lose, errors).
@@ -104,7 +293,8 @@ class RichDisplay:
             message: The message to display
             style: Rich style string for the message
         """
-        self.console.print(f"[{style}]{message}[/{style}]")
+        # Printed literally: messages can contain brackets such as "[y/n]"
+        self.console.print(message, style=style, markup=False)
 
     def show_error(self, message: str) -> None:
         """Show error message in bold red.
@@ -112,15 +302,25 @@ class RichDisplay:
         Args:
             message: The error message to display
         """
-        self.console.print(f"[bold red]Error: {message}[/bold red]")
+        self.console.print(f"Error: {message}", style="bold red", markup=False)
 
     def get_terminal_width(self) -> int:
         """Get current terminal width.
 
+        Querying the console costs terminal-size syscalls on each call, so
+        the width is cached until the next SIGWINCH where that is available.
+
         Returns:
             Terminal width in characters
         """
-        return self.console.width
+        if not _resize_watch_installed:
+            return self.console.width
+
+        stamp = (self.console, _resize_generation)
+        if stamp != self._width_stamp:
+            self._width = self.console.width
+            self._width_stamp = stamp
+        return self._width
 
     def _render_wide(self, state: "DisplayState") -> Panel:
         """Render full-width layout with panels.
@@ -164,8 +364,8 @@ class RichDisplay:
 
         return Panel(
             group,
-            title=f"[bold cyan]{state.game_name}[/bold cyan]",
-            border_style="dim cyan",
+            title=_game_title(state.game_name),
+            border_style=_BORDER_STYLE,
         )
 
     def _render_compact(self, state: "DisplayState") -> Panel:
@@ -177,62 +377,65 @@ class RichDisplay:
         Returns:
             Rich Panel with simpler text-based layout
         """
-        text = Text()
+        # Parts are collected and assembled into one Text at the end;
+        # unstyled runs are joined into one string per part
+        parts: list[_Part] = [(f"Turn {state.turn}", _BOLD)]
 
         # Header line
-        text.append(f"Turn {state.turn}", style="bold")
-        text.append(f" | Phase: {state.phase_name}")
-        text.append(f" | You: P{state.player_id}\n")
+        plain = f" | Phase: {state.phase_name} | You: P{state.player_id}\n"
 
         # Chips/pot (if applicable)
         if state.player_chips > 0 or state.pot > 0:
-            text.append(f"Chips: {state.player_chips} | Pot: {state.pot}")
+            plain += f"Chips: {state.player_chips} | Pot: {state.pot}"
             if state.current_bet > 0:
-                text.append(f" | Bet: {state.current_bet}")
-            text.append("\n")
+                plain += f" | Bet: {state.current_bet}"
+            plain += "\n"
 
         # Opponent
-        text.append(f"Opponent: {state.opponent_card_count} cards")
+        plain += f"Opponent: {state.opponent_card_count} cards"
         if state.opponent_chips > 0:
-            text.append(f" | {state.opponent_chips} chips")
-        text.append("\n\n")
+            plain += f" | {state.opponent_chips} chips"
+        parts.append(plain + "\n\n")
 
         # Hand
-        text.append("Hand: ", style="bold")
-        for i, (rank, suit) in enumerate(state.hand_cards):
-            text.append(f"[{i+1}]", style="bold green")
-            text.append_text(format_card_rich(rank, suit))
-            text.append("  ")
-        text.append("\n")
+        parts.append(("Hand: ", _BOLD))
+        for i, (rank, suit) in enumerate(state.hand_cards, 1):
+            parts.append((f"[{i}]", _BOLD_GREEN))
+            parts.extend(_card_parts(rank, suit))
+            parts.append("  ")
 
         # Discard
         if state.discard_top is not None:
-            rank, suit = state.discard_top
-            text.append("Discard: ")
-            text.append_text(format_card_rich(rank, suit))
-            text.append("\n")
-
-        text.append("\n")
+            parts.append("\nDiscard: ")
+            parts.extend(_card_parts(*state.discard_top))
+        parts.append("\n\n")
 
         # Actions
-        text.append("Actions: ", style="bold")
+        parts.append(("Actions: ", _BOLD))
         for move in state.moves:
-            text.append(f"[{move.index}]", style="bold green")
-            text.append(f" {move.label}  ")
-        text.append("\n")
+            parts.append((f"[{move.index}]", _BOLD_GREEN))
+            parts.append(f" {move.label}  ")
 
         # Move log (condensed)
         if state.move_log:
-            text.append("\n")
-            recent = state.move_log[-MOVE_LOG_SIZE:]
-            for direction, description in recent:
-                arrow = "\u2190" if direction == "opponent" else "\u2192"
-                text.append(f"{arrow} {description}  ", style="dim")
+            parts.append("\n\n")
+            recent = _recent_moves(state.move_log)
+            parts.append((
+                "".join([
+                    f"{_LOG_ARROWS[direction == 'opponent']} {description}  "
+                    for direction, description in recent
+                ]),
+                _DIM,
+            ))
+        else:
+            parts.append("\n")
+
+        text = Text.assemble(*parts)
 
         return Panel(
             text,
-            title=f"[bold cyan]{state.game_name}[/bold cyan]",
-            border_style="dim cyan",
+            title=_game_title(state.game_name),
+            border_style=_BORDER_STYLE,
         )
 
     def _build_header(self, state: "DisplayState") -> Panel:
@@ -244,27 +447,25 @@ class RichDisplay:
         Returns:
             Panel containing header info
         """
-        text = Text()
-        text.append(f"Turn: {state.turn}", style="bold")
-        text.append("  |  ")
-        text.append(f"Phase: {state.phase_name}")
-        text.append("  |  ")
-        text.append(f"You: P{state.player_id}")
+        parts: list[_Part] = [
+            (f"Turn: {state.turn}", _BOLD),
+            f"{_SEP}Phase: {state.phase_name}{_SEP}You: P{state.player_id}",
+        ]
 
         # Add chips/pot info if applicable
         if state.player_chips > 0 or state.pot > 0:
-            text.append("\n")
-            text.append(f"Your chips: {state.player_chips}", style="bold yellow")
-            text.append("  |  ")
-            text.append(f"Pot: {state.pot}", style="bold green")
+            parts += [
+                "\n",
+                (f"Your chips: {state.player_chips}", _BOLD_YELLOW),
+                _SEP,
+                (f"Pot: {state.pot}", _BOLD_GREEN),
+            ]
             if state.current_bet > 0:
-                text.append("  |  ")
-                text.append(f"Current bet: {state.current_bet}")
+                parts.append(f"{_SEP}Current bet: {state.current_bet}")
             if state.player_bet > 0:
-                text.append("  |  ")
-                text.append(f"Your bet: {state.player_bet}")
+                parts.append(f"{_SEP}Your bet: {state.player_bet}")
 
-        return Panel(text, border_style="dim cyan")
+        return Panel(Text.assemble(*parts), border_style=_BORDER_STYLE)
 
     def _build_opponent_panel(self, state: "DisplayState") -> Panel:
         """Build the opponent info panel.
@@ -275,18 +476,15 @@ class RichDisplay:
         Returns:
             Panel containing opponent info
         """
-        text = Text()
-        text.append(f"Cards: {state.opponent_card_count}", style="bold")
+        parts: list[_Part] = [(f"Cards: {state.opponent_card_count}", _BOLD)]
 
         if state.opponent_chips > 0:
-            text.append("  |  ")
-            text.append(f"Chips: {state.opponent_chips}", style="yellow")
+            parts += [_SEP, (f"Chips: {state.opponent_chips}", _YELLOW)]
 
         if state.opponent_bet > 0:
-            text.append("  |  ")
-            text.append(f"Bet: {state.opponent_bet}")
+            parts.append(f"{_SEP}Bet: {state.opponent_bet}")
 
-        return Panel(text, title="[dim]Opponent[/dim]", border_style="dim cyan")
+        return Panel(Text.assemble(*parts), title=_TITLE_OPPONENT, border_style=_BORDER_STYLE)
 
     def _build_hand_panel(self, state: "DisplayState") -> Panel:
         """Build the player's hand panel with numbered cards.
@@ -298,16 +496,29 @@ class RichDisplay:
             Panel containing the player's hand
         """
         if not state.hand_cards:
-            text = Text("(empty hand)", style="dim italic")
-        else:
-            text = Text()
-            for i, (rank, suit) in enumerate(state.hand_cards):
-                text.append(f"[{i+1}]", style="bold green")
-                text.append(" ")
-                text.append_text(format_card_rich(rank, suit))
-                text.append("   ")
-
-        return Panel(text, title="[dim]Your Hand[/dim]", border_style="dim cyan")
+            return _EMPTY_HAND_PANEL
+
+        # Hands can hold a dozen or more cards, so the plain text is joined
+        # in one go and the spans are laid out alongside it
+        pieces: list[str] = []
+        spans: list[Span] = []
+        pos = 0
+        for i, (rank, suit) in enumerate(state.hand_cards, 1):
+            (rank_text, rank_style), (symbol, color) = _card_parts(rank, suit)
+            label = f"[{i}]"
+            end = pos + len(label)
+            spans.append(Span(pos, end, _BOLD_GREEN))
+            pos = end + 1
+            end = pos + len(rank_text)
+            spans.append(Span(pos, end, rank_style))
+            pos = end
+            end = pos + len(symbol)
+            spans.append(Span(pos, end, color))
+            pos = end + 3
+            pieces.append(f"{label} {rank_text}{symbol}   ")
+        text = Text("".join(pieces), spans=spans)
+
+        return Panel(text, title=_TITLE_HAND, border_style=_BORDER_STYLE)
 
     def _build_discard_panel(self, state: "DisplayState") -> Panel:
         """Build the discard pile panel.
@@ -319,13 +530,11 @@ class RichDisplay:
             Panel containing the top discard card
         """
         if state.discard_top is None:
-            text = Text("(empty)", style="dim italic")
-        else:
-            rank, suit = state.discard_top
-            text = Text("Top: ")
-            text.append_text(format_card_rich(rank, suit))
+            return _EMPTY_DISCARD_PANEL
+
+        text = Text.assemble("Top: ", *_card_parts(*state.discard_top))
 
-        return Panel(text, title="[dim]Discard[/dim]", border_style="dim cyan")
+        return Panel(text, title=_TITLE_DISCARD, border_style=_BORDER_STYLE)
 
     def _build_actions_panel(self, state: "DisplayState") -> Panel:
         """Build the actions panel with numbered options.
@@ -337,29 +546,28 @@ class RichDisplay:
             Panel containing available actions
         """
         if not state.moves:
-            text = Text("No moves available", style="dim italic")
-        else:
-            text = Text()
-            for move in state.moves:
-                text.append(f"[{move.index}]", style="bold green")
-                text.append(" ")
-                # Format card labels with colors
-                if move.move_type == "card" and len(move.label) >= 2:
-                    # Parse rank and suit from label (e.g., "A\u2665")
-                    rank = move.label[:-1]
-                    suit_symbol = move.label[-1]
-                    # Map symbol back to suit letter for coloring
-                    suit_map = {"\u2665": "H", "\u2666": "D", "\u2663": "C", "\u2660": "S"}
-                    suit = suit_map.get(suit_symbol, "")
-                    if suit:
-                        text.append_text(format_card_rich(rank, suit))
-                    else:
-                        text.append(move.label)
+            return _NO_MOVES_PANEL
+
+        parts: list[_Part] = []
+        for move in state.moves:
+            parts.append((f"[{move.index}]", _BOLD_GREEN))
+            parts.append(" ")
+            # Format card labels with colors
+            if move.move_type == "card" and len(move.label) >= 2:
+                # Label is rank + suit symbol (e.g., "A\u2665")
+                suit_symbol = move.label[-1]
+                color = SUIT_SYMBOL_TO_COLOR.get(suit_symbol)
+                if color is not None:
+                    parts.append((move.label[:-1], _BOLD))
+                    parts.append((suit_symbol, color))
                 else:
-                    text.append(move.label, style="bold" if move.move_type == "betting" else "")
-                text.append("   ")
+                    parts.append(move.label)
+            else:
+                parts.append((move.label, _BOLD if move.move_type == "betting" else ""))
+            parts.append("   ")
+        text = Text.assemble(*parts)
 
-        return Panel(text, title="[dim]Actions[/dim]", border_style="dim cyan")
+        return Panel(text, title=_TITLE_ACTIONS, border_style=_BORDER_STYLE)
 
     def _build_move_log(self, state: "DisplayState") -> Text:
         """Build the move log showing recent moves.
@@ -370,21 +578,26 @@ class RichDisplay:
         Returns:
             Text containing the move log
         """
-        text = Text()
-
         # Show last N moves
-        recent = state.move_log[-MOVE_LOG_SIZE:]
+        recent = tuple(_recent_moves(state.move_log))
+        if self._log_cache is not None and self._log_cache[0] == recent:
+            return self._log_cache[1]
 
+        text = Text()
         for direction, description in recent:
             if direction == "opponent":
-                text.append("\u2190 ", style="dim cyan")
-                text.append(f"AI {description}", style="dim")
+                text.append("\u2190 ", style=_DIM_CYAN)
+                text.append(f"AI {description}", style=_DIM)
             else:
-                text.append("\u2192 ", style="dim green")
-                text.append(f"You {description}", style="dim")
+                text.append("\u2192 ", style=_DIM_GREEN)
+                text.append(f"You {description}", style=_DIM)
             text.append("  ")
 
+        self._log_cache = (recent, text)
         return text
 
 
-__all__ = ["RichDisplay", "format_card_rich", "SUIT_SYMBOLS", "SUIT_COLORS", "MIN_WIDE_WIDTH", "MOVE_LOG_SIZE"]
+__all__ = [
+    "RichDisplay", "format_card_rich", "SUIT_SYMBOLS", "SUIT_COLORS",
+    "SUIT_SYMBOL_TO_COLOR", "MIN_WIDE_WIDTH", "MOVE_LOG_SIZE",
+]
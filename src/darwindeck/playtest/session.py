@@ -7,6 +7,7 @@ import random
 import sys
 from collections import deque
 from dataclasses import dataclass, field
+from itertools import compress, islice
 from pathlib import Path
 from typing import Optional, Callable
 
@@ -15,9 +16,9 @@ from typing import Union, List
 from darwindeck.genome.schema import GameGenome, Rank, Suit, BettingPhase
 from darwindeck.simulation.state import GameState, PlayerState, Card
 from darwindeck.simulation.movegen import (
-    LegalMove, BettingMove, BettingAction,
+    LegalMove, BettingMove, BettingAction, RANK_VALUES,
     generate_legal_moves, apply_move, apply_betting_move, check_win_conditions,
-    all_bets_matched, count_active_players, count_acting_players,
+    all_bets_matched,
 )
 from darwindeck.playtest.stuck import StuckDetector
 from darwindeck.playtest.display import StateRenderer, MovePresenter
@@ -28,6 +29,39 @@ from darwindeck.playtest.rich_display import RichDisplay, MOVE_LOG_SIZE
 from darwindeck.playtest.display_state import DisplayState, MoveOption
 
 
+# Standard 52-card deck in suit-major order; Cards are immutable, so every
+# session shuffles a copy of these same instances
+_STANDARD_DECK: tuple[Card, ...] = tuple(
+    Card(rank=rank, suit=suit) for suit in Suit for rank in Rank
+)
+
+# AI betting action priorities by hand strength (higher is preferred)
+_PRIORITY_STRONG: dict[BettingAction, int] = {
+    BettingAction.RAISE: 6,
+    BettingAction.BET: 5,
+    BettingAction.ALL_IN: 4,
+    BettingAction.CALL: 3,
+    BettingAction.CHECK: 2,
+    BettingAction.FOLD: 0,
+}
+_PRIORITY_MEDIUM: dict[BettingAction, int] = {
+    BettingAction.CHECK: 5,
+    BettingAction.CALL: 4,
+    BettingAction.BET: 3,
+    BettingAction.FOLD: 2,
+    BettingAction.RAISE: 1,
+    BettingAction.ALL_IN: 0,
+}
+_PRIORITY_WEAK: dict[BettingAction, int] = {
+    BettingAction.CHECK: 5,
+    BettingAction.FOLD: 4,
+    BettingAction.CALL: 2,
+    BettingAction.BET: 1,
+    BettingAction.RAISE: 0,
+    BettingAction.ALL_IN: 0,
+}
+
+
 @dataclass
 class SessionConfig:
     """Configuration for playtest session."""
@@ -68,7 +102,31 @@ class PlaytestSession:
         self.state: Optional[GameState] = None
 
         # Betting round state
-        self._needs_to_act: list[bool] = []
+        # Bit i set = player i still needs to act; None between rounds
+        self._needs_to_act: Optional[int] = None
+        # Hand strength per player with the hand it was computed for
+        self._hand_strength: dict[int, tuple[tuple[Card, ...], float]] = {}
+
+        # Legal moves for the state they were generated from; states are
+        # immutable, so they stay valid until self.state is replaced
+        self._moves_state: Optional[GameState] = None
+        self._moves: list[Union[LegalMove, BettingMove]] = []
+        # Likewise the win check result for the state it was computed on
+        self._win_state: Optional[GameState] = None
+        self._winner: Optional[int] = None
+
+        # Display name per phase index ("PlayPhase" -> "Play")
+        self._phase_names: tuple[str, ...] = tuple(
+            phase.__class__.__name__.replace("Phase", "")
+            for phase in genome.turn_structure.phases
+        )
+
+        # Display pieces from the last DisplayState, with the hand and
+        # move list they were built from (reused while those are unchanged)
+        self._shown_hand: Optional[tuple[Card, ...]] = None
+        self._hand_cards: list[tuple[str, str]] = []
+        self._options_for: Optional[tuple[list, tuple[Card, ...]]] = None
+        self._move_options: list[MoveOption] = []
 
     def _record_move(self, turn: int, player: str, move_data: dict) -> None:
         """Record move in history."""
@@ -80,23 +138,19 @@ class PlaytestSession:
 
     def _initialize_state(self) -> GameState:
         """Initialize game state from genome."""
-        # Create standard 52-card deck
-        deck: list[Card] = []
-        for suit in Suit:
-            for rank in Rank:
-                deck.append(Card(rank=rank, suit=suit))
+        # Fresh copy of the standard 52-card deck
+        deck = list(_STANDARD_DECK)
 
         # Shuffle with session seed
         self.rng.shuffle(deck)
 
-        # Deal to players
+        # Deal to players in consecutive blocks from the top of the deck
         cards_per_player = self.genome.setup.cards_per_player
-        hands: list[tuple[Card, ...]] = []
-
-        for i in range(self.genome.player_count):
-            hand = tuple(deck[:cards_per_player])
-            deck = deck[cards_per_player:]
-            hands.append(hand)
+        num_dealt = cards_per_player * self.genome.player_count
+        hands = [
+            tuple(deck[i * cards_per_player:(i + 1) * cards_per_player])
+            for i in range(self.genome.player_count)
+        ]
 
         # Get starting chips (0 for non-betting games)
         starting_chips = self.genome.setup.starting_chips
@@ -114,7 +168,7 @@ class PlaytestSession:
 
         return GameState(
             players=players,
-            deck=tuple(deck),
+            deck=tuple(deck[num_dealt:]),
             discard=(),
             turn=1,
             active_player=0,
@@ -138,12 +192,10 @@ class PlaytestSession:
             and not os.environ.get("FORCE_PLAIN_DISPLAY")
         )
 
+        # rich is a required dependency and already imported above, so
+        # there is no import failure to fall back from here
         if use_rich:
-            try:
-                return self._run_rich()
-            except ImportError:
-                # Fall back if rich not available
-                pass
+            return self._run_rich()
 
         return self._run_plain(output_fn)
 
@@ -170,38 +222,43 @@ class PlaytestSession:
         felt_broken = False
         stuck_reason: Optional[str] = None
 
+        # After an invalid input the state is unchanged: skip the checks
+        # (a repeat would count toward the stuck detector's repetition
+        # limit) and the board redraw, and just prompt again
+        retrying = False
         while True:
-            # Check for stuck
-            stuck_reason = self.stuck_detector.check(self.state)
-            if stuck_reason:
-                output_fn(f"\nGame stuck: {stuck_reason}")
-                winner = "stuck"
-                break
-
-            # Check win conditions
-            win_id = check_win_conditions(self.state, self.genome)
-            if win_id is not None:
-                if win_id == self.human_player_idx:
-                    winner = "human"
-                    output_fn("\n=== You Win! ===")
-                else:
-                    winner = "ai"
-                    output_fn("\n=== AI Wins ===")
-                break
+            if not retrying:
+                # Check for stuck
+                stuck_reason = self.stuck_detector.check(self.state)
+                if stuck_reason:
+                    output_fn(f"\nGame stuck: {stuck_reason}")
+                    winner = "stuck"
+                    break
 
-            # Display state
-            output_fn("")
-            output_fn(self.renderer.render(
-                self.state, self.genome, self.human_player_idx, self.config.debug
-            ))
+                # Check win conditions
+                win_id = self._check_win()
+                if win_id is not None:
+                    if win_id == self.human_player_idx:
+                        winner = "human"
+                        output_fn("\n=== You Win! ===")
+                    else:
+                        winner = "ai"
+                        output_fn("\n=== AI Wins ===")
+                    break
+
+                # Display state
+                output_fn("")
+                output_fn(self.renderer.render(
+                    self.state, self.genome, self.human_player_idx, self.config.debug
+                ))
+            retrying = False
 
             # Generate legal moves
-            moves = generate_legal_moves(self.state, self.genome)
+            moves = self._legal_moves()
 
             # Check if betting phase should auto-complete (no one can act)
             if not moves and self._should_auto_complete_betting():
-                self._advance_phase()
-                self._reset_betting_state()
+                self._end_betting_round()
                 continue
 
             # Get move based on current player
@@ -221,6 +278,7 @@ class PlaytestSession:
 
                 if result.error:
                     output_fn(result.error)
+                    retrying = True
                     continue
 
                 if result.is_pass:
@@ -280,6 +338,24 @@ class PlaytestSession:
             stuck_reason=stuck_reason,
         )
 
+    def _legal_moves(self) -> list[Union[LegalMove, BettingMove]]:
+        """Legal moves for the current state, generated once per state.
+
+        Input errors and other re-prompts loop back without changing the
+        state, so they reuse the moves already generated for it.
+        """
+        if self.state is not self._moves_state:
+            self._moves = generate_legal_moves(self.state, self.genome)
+            self._moves_state = self.state
+        return self._moves
+
+    def _check_win(self) -> Optional[int]:
+        """Winning player for the current state, checked once per state."""
+        if self.state is not self._win_state:
+            self._winner = check_win_conditions(self.state, self.genome)
+            self._win_state = self.state
+        return self._winner
+
     def _advance_turn(self) -> None:
         """Advance to next turn without applying a move."""
         if self.state:
@@ -304,25 +380,41 @@ class PlaytestSession:
         if not isinstance(phase, BettingPhase):
             return False
 
+        active, acting = self._count_players()
+
         # Check if no one can act and bets are matched
-        if count_acting_players(self.state) == 0 and all_bets_matched(self.state):
+        if acting == 0 and all_bets_matched(self.state):
             return True
 
         # Also complete if only one player remains
-        if count_active_players(self.state) <= 1:
+        if active <= 1:
             return True
 
         return False
 
+    def _count_players(self) -> tuple[int, int]:
+        """Count (active, acting) players in one pass over the players.
+
+        Same rules as movegen's count_active_players (not folded) and
+        count_acting_players (not folded, not all-in, chips left).
+        """
+        active = acting = 0
+        for player in self.state.players:
+            if not player.has_folded:
+                active += 1
+                if not player.is_all_in and player.chips > 0:
+                    acting += 1
+        return active, acting
+
     def _init_betting_round(self) -> None:
         """Initialize needs_to_act for a new betting round."""
         if not self.state:
             return
-        self._needs_to_act = []
-        for player in self.state.players:
+        self._needs_to_act = 0
+        for i, player in enumerate(self.state.players):
             # Player needs to act if they can act
-            can_act = not player.has_folded and not player.is_all_in and player.chips > 0
-            self._needs_to_act.append(can_act)
+            if not player.has_folded and not player.is_all_in and player.chips > 0:
+                self._needs_to_act |= 1 << i
 
     def _reset_needs_to_act_for_bet_increase(self, acting_player: int) -> None:
         """Reset needs_to_act when bet increases (BET/RAISE/ALL_IN with chips)."""
@@ -330,9 +422,9 @@ class PlaytestSession:
             return
         for i, player in enumerate(self.state.players):
             if i == acting_player:
-                self._needs_to_act[i] = False  # Acting player just acted
+                self._needs_to_act &= ~(1 << i)  # Acting player just acted
             elif not player.has_folded and not player.is_all_in and player.chips > 0:
-                self._needs_to_act[i] = True  # Everyone else must respond
+                self._needs_to_act |= 1 << i  # Everyone else must respond
 
     def _advance_to_next_acting_player(self) -> None:
         """Advance to the next player who needs to act."""
@@ -340,13 +432,16 @@ class PlaytestSession:
             return
 
         num_players = len(self.state.players)
-        next_player = (self.state.active_player + 1) % num_players
+        first = self.state.active_player + 1
 
-        # Find next player who needs to act
-        for _ in range(num_players):
-            if self._needs_to_act[next_player]:
-                break
-            next_player = (next_player + 1) % num_players
+        # Rotate the mask so bit 0 is the player after the active one; the
+        # lowest set bit is then the next player who needs to act
+        pending = self._needs_to_act or 0
+        rotated = ((pending >> first) | (pending << (num_players - first))) & (
+            (1 << num_players) - 1
+        )
+        offset = (rotated & -rotated).bit_length() - 1 if rotated else 0
+        next_player = (first + offset) % num_players
 
         self.state = self.state.copy_with(
             active_player=next_player,
@@ -359,11 +454,11 @@ class PlaytestSession:
             return
 
         # Initialize needs_to_act if not set
-        if not self._needs_to_act:
+        if self._needs_to_act is None:
             self._init_betting_round()
 
         # Mark current player as having acted
-        self._needs_to_act[player_idx] = False
+        self._needs_to_act &= ~(1 << player_idx)
 
         # If bet increased, everyone else needs to act again
         if move.action in (BettingAction.BET, BettingAction.RAISE):
@@ -372,77 +467,79 @@ class PlaytestSession:
             # ALL_IN may increase bet - reset others to act
             self._reset_needs_to_act_for_bet_increase(player_idx)
 
+        active, acting = self._count_players()
+
         # Check termination: only one player remains
-        if count_active_players(self.state) <= 1:
-            self._advance_phase()
-            self._reset_betting_state()
+        if active <= 1:
+            self._end_betting_round()
             return
 
         # Check termination: all remaining players are all-in (no one can act)
-        if count_acting_players(self.state) == 0:
-            self._advance_phase()
-            self._reset_betting_state()
+        if acting == 0:
+            self._end_betting_round()
             return
 
         # Check termination: everyone has acted and bets matched
-        if not any(self._needs_to_act) and all_bets_matched(self.state):
-            self._advance_phase()
-            self._reset_betting_state()
+        if not self._needs_to_act and all_bets_matched(self.state):
+            self._end_betting_round()
             return
 
         # Otherwise advance to next player who can act
         self._advance_to_next_acting_player()
 
-    def _advance_phase(self) -> None:
-        """Advance to the next phase in the turn structure."""
+    def _end_betting_round(self) -> None:
+        """Advance to the next phase and reset betting state for a new round.
+
+        Both transitions are applied in a single state copy.
+        """
         if not self.state:
             return
+        self.state = self.state.copy_with(
+            **self._next_phase_changes(), **self._betting_reset_changes()
+        )
+        # Clear needs_to_act for next betting round
+        self._needs_to_act = None
 
+    def _next_phase_changes(self) -> dict:
+        """State changes that move play to the next phase."""
         num_phases = len(self.genome.turn_structure.phases)
         next_phase = self.state.current_phase + 1
 
         if next_phase >= num_phases:
             # Wrap to first phase and advance turn
-            next_phase = 0
-            next_player = (self.state.active_player + 1) % len(self.state.players)
-            self.state = self.state.copy_with(
-                current_phase=next_phase,
-                active_player=next_player,
-                turn=self.state.turn + 1,
-            )
-        else:
-            # Just advance phase, keep same player
-            self.state = self.state.copy_with(
-                current_phase=next_phase,
-                turn=self.state.turn + 1,
+            return {
+                "current_phase": 0,
+                "active_player": (self.state.active_player + 1) % len(self.state.players),
+                "turn": self.state.turn + 1,
+            }
+        # Just advance phase, keep same player
+        return {"current_phase": next_phase, "turn": self.state.turn + 1}
+
+    def _betting_reset_changes(self) -> dict:
+        """State changes that clear all bets for a new betting round."""
+        changes: dict = {"current_bet": 0, "raise_count": 0}
+        # Only players with a bet out need a new PlayerState
+        if any(p.current_bet for p in self.state.players):
+            changes["players"] = tuple(
+                p.copy_with(current_bet=0) if p.current_bet else p
+                for p in self.state.players
             )
-
-    def _reset_betting_state(self) -> None:
-        """Reset betting state for new round."""
-        if not self.state:
-            return
-
-        # Reset player betting states
-        new_players = tuple(
-            p.copy_with(current_bet=0)
-            for p in self.state.players
-        )
-        self.state = self.state.copy_with(
-            players=new_players,
-            current_bet=0,
-            raise_count=0,
-        )
-        # Clear needs_to_act for next betting round
-        self._needs_to_act = []
+        return changes
 
     def _ai_select_move(self, moves: List[Union[LegalMove, BettingMove]]) -> Optional[Union[LegalMove, BettingMove]]:
         """Select move using AI strategy."""
         if not moves:
             return None
 
-        # Separate moves by type (genome may have multiple phase types)
-        card_moves = [m for m in moves if isinstance(m, LegalMove)]
-        betting_moves = [m for m in moves if isinstance(m, BettingMove)]
+        # Separate moves by type in one pass (genome may have multiple
+        # phase types)
+        card_moves: list[LegalMove] = []
+        betting_moves: list[BettingMove] = []
+        for m in moves:
+            if isinstance(m, LegalMove):
+                card_moves.append(m)
+            elif isinstance(m, BettingMove):
+                betting_moves.append(m)
 
         # Prioritize card plays over betting (card plays are core game actions)
         if card_moves:
@@ -473,36 +570,13 @@ class PlaytestSession:
         ai_player = 1 - self.human_player_idx
         hand_strength = self._evaluate_hand_strength(ai_player)
 
-        # Strong hand: aggressive play
+        # Strong hand: aggressive play; medium: cautious; weak: defensive
         if hand_strength > 0.7:
-            priority = {
-                BettingAction.RAISE: 6,
-                BettingAction.BET: 5,
-                BettingAction.ALL_IN: 4,
-                BettingAction.CALL: 3,
-                BettingAction.CHECK: 2,
-                BettingAction.FOLD: 0,
-            }
-        # Medium hand: cautious play
+            priority = _PRIORITY_STRONG
         elif hand_strength > 0.4:
-            priority = {
-                BettingAction.CHECK: 5,
-                BettingAction.CALL: 4,
-                BettingAction.BET: 3,
-                BettingAction.FOLD: 2,
-                BettingAction.RAISE: 1,
-                BettingAction.ALL_IN: 0,
-            }
-        # Weak hand: defensive play
+            priority = _PRIORITY_MEDIUM
         else:
-            priority = {
-                BettingAction.CHECK: 5,
-                BettingAction.FOLD: 4,
-                BettingAction.CALL: 2,
-                BettingAction.BET: 1,
-                BettingAction.RAISE: 0,
-                BettingAction.ALL_IN: 0,
-            }
+            priority = _PRIORITY_WEAK
 
         return max(moves, key=lambda m: priority.get(m.action, -1))
 
@@ -518,50 +592,52 @@ class PlaytestSession:
         if not hand:
             return 0.0
 
-        rank_values = {
-            "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7,
-            "8": 8, "9": 9, "10": 10, "J": 11, "Q": 12, "K": 13, "A": 14
-        }
+        # Hands are immutable tuples, so a betting round that leaves the
+        # hand alone reuses the last result
+        cached = self._hand_strength.get(player_id)
+        if cached is not None and cached[0] is hand:
+            return cached[1]
 
-        total = sum(rank_values.get(card.rank.value, 7) for card in hand)
+        # Look ranks up by _value_, the plain member attribute: .value is a
+        # property, and keying on the member calls the Python-level
+        # Enum.__hash__
+        total = sum(RANK_VALUES[card.rank._value_] for card in hand)
         avg = total / len(hand)
 
         # Normalize: 2 -> 0.0, 14 -> 1.0
-        return (avg - 2) / 12.0
+        strength = (avg - 2) / 12.0
+        self._hand_strength[player_id] = (hand, strength)
+        return strength
 
     def _greedy_select(self, moves: list[LegalMove]) -> LegalMove:
         """Greedy heuristic: prefer moves that play cards (reduce hand size)."""
         if not self.state:
             return moves[0]
 
+        ai_player = 1 - self.human_player_idx
+        hand = self.state.players[ai_player].hand
+
         # Score each move: prefer card plays, higher cards for captures
         def score_move(move: LegalMove) -> tuple[int, int]:
             # Prefer moves that play cards (card_index >= 0 means a card play)
-            plays_card = 1 if move.card_index >= 0 else 0
+            if move.card_index < 0:
+                return (0, 0)
 
             # For card plays, prefer higher-rank cards (for captures)
-            card_value = 0
-            if move.card_index >= 0:
-                ai_player = 1 - self.human_player_idx
-                hand = self.state.players[ai_player].hand
-                if move.card_index < len(hand):
-                    card = hand[move.card_index]
-                    # Rank value: 2=2, ..., A=14
-                    rank_values = {
-                        "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7,
-                        "8": 8, "9": 9, "10": 10, "J": 11, "Q": 12, "K": 13, "A": 14
-                    }
-                    card_value = rank_values.get(card.rank.value, 0)
-
-            return (plays_card, card_value)
-
-        # Sort moves by score (descending), pick best
-        scored = sorted(moves, key=score_move, reverse=True)
-        best_score = score_move(scored[0])
-
-        # Randomly pick among ties
-        ties = [m for m in scored if score_move(m) == best_score]
-        return self.rng.choice(ties)
+            if move.card_index < len(hand):
+                return (1, RANK_VALUES[hand[move.card_index].rank._value_])
+            return (1, 0)
+
+        # Score each move once and pick the best
+        scores = [score_move(m) for m in moves]
+        best_score = max(scores)
+
+        # Randomly pick among ties (in move order, as a stable sort would)
+        # without collecting them; randrange draws the same index choice()
+        # would, so seeded games are unchanged
+        pick = self.rng.randrange(scores.count(best_score))
+        ties = compress(moves, (score == best_score for score in scores))
+        return next(islice(ties, pick, None))
 
     def _run_rich(self) -> PlaytestResult:
         """Run the playtest session using Rich display.
@@ -586,32 +662,37 @@ class PlaytestSession:
         felt_broken = False
         stuck_reason: Optional[str] = None
 
+        # After an invalid input the state is unchanged: skip the checks
+        # (a repeat would count toward the stuck detector's repetition
+        # limit) and just prompt again
+        retrying = False
         while True:
-            # Check for stuck
-            stuck_reason = self.stuck_detector.check(self.state)
-            if stuck_reason:
-                display.show_error(f"Game stuck: {stuck_reason}")
-                winner = "stuck"
-                break
-
-            # Check win conditions
-            win_id = check_win_conditions(self.state, self.genome)
-            if win_id is not None:
-                if win_id == self.human_player_idx:
-                    winner = "human"
-                    display.show_message("=== You Win! ===", style="bold green")
-                else:
-                    winner = "ai"
-                    display.show_message("=== AI Wins ===", style="bold red")
-                break
+            if not retrying:
+                # Check for stuck
+                stuck_reason = self.stuck_detector.check(self.state)
+                if stuck_reason:
+                    display.show_error(f"Game stuck: {stuck_reason}")
+                    winner = "stuck"
+                    break
+
+                # Check win conditions
+                win_id = self._check_win()
+                if win_id is not None:
+                    if win_id == self.human_player_idx:
+                        winner = "human"
+                        display.show_message("=== You Win! ===", style="bold green")
+                    else:
+                        winner = "ai"
+                        display.show_message("=== AI Wins ===", style="bold red")
+                    break
+            retrying = False
 
             # Generate legal moves
-            moves = generate_legal_moves(self.state, self.genome)
+            moves = self._legal_moves()
 
             # Check if betting phase should auto-complete (no one can act)
             if not moves and self._should_auto_complete_betting():
-                self._advance_phase()
-                self._reset_betting_state()
+                self._end_betting_round()
                 continue
 
             # Get move based on current player
@@ -633,6 +714,7 @@ class PlaytestSession:
 
                 if result.error:
                     display.show_error(result.error)
+                    retrying = True
                     continue
 
                 if result.is_pass:
@@ -664,10 +746,6 @@ class PlaytestSession:
                 # AI turn
                 move = self._ai_select_move(moves)
 
-                # Build display state for AI turn display
-                terminal_width = display.get_terminal_width()
-                display_state = self._build_display_state(moves, move_log, terminal_width)
-
                 if move:
                     if isinstance(move, BettingMove):
                         move_log.append(("opponent", move.action.value.lower()))
@@ -693,7 +771,8 @@ class PlaytestSession:
                     self.stuck_detector.record_pass()
                     self._advance_turn()
 
-                # Show AI turn briefly
+                # Show AI turn briefly (built once, after the move is applied)
+                terminal_width = display.get_terminal_width()
                 display_state = self._build_display_state([], move_log, terminal_width)
                 display.show_ai_turn(display_state, duration=0.3)
 
@@ -730,13 +809,13 @@ class PlaytestSession:
             DisplayState for rendering
         """
         # Get phase name from genome
-        phase_idx = self.state.current_phase
-        phase = self.genome.turn_structure.phases[phase_idx]
-        phase_name = phase.__class__.__name__.replace("Phase", "")
+        phase_name = self._phase_names[self.state.current_phase]
 
         # Build hand_cards as list of (rank, suit) tuples
         player = self.state.players[self.human_player_idx]
-        hand_cards = [(c.rank.value, c.suit.value) for c in player.hand]
+        if player.hand is not self._shown_hand:
+            self._hand_cards = [(c.rank.value, c.suit.value) for c in player.hand]
+            self._shown_hand = player.hand
 
         # Build opponent info
         opponent_idx = 1 - self.human_player_idx
@@ -748,15 +827,18 @@ class PlaytestSession:
             top = self.state.discard[-1]
             discard_top = (top.rank.value, top.suit.value)
 
-        # Build move options
-        move_options = self._build_move_options(moves)
+        # Build move options (labels depend on the moves and the hand)
+        options_for = self._options_for
+        if options_for is None or options_for[0] is not moves or options_for[1] is not player.hand:
+            self._move_options = self._build_move_options(moves)
+            self._options_for = (moves, player.hand)
 
         return DisplayState(
             game_name=self.genome.genome_id,
             turn=self.state.turn,
             phase_name=phase_name,
             player_id=self.human_player_idx,
-            hand_cards=hand_cards,
+            hand_cards=self._hand_cards,
             opponent_card_count=len(opponent.hand),
             opponent_chips=opponent.chips,
             opponent_bet=opponent.current_bet,
@@ -765,8 +847,10 @@ class PlaytestSession:
             pot=self.state.pot,
             current_bet=self.state.current_bet,
             discard_top=discard_top,
-            moves=move_options,
-            move_log=list(move_log),
+            moves=self._move_options,
+            # Passed live: the deque is already bounded to MOVE_LOG_SIZE and
+            # the display copies what it keeps
+            move_log=move_log,
             terminal_width=terminal_width,
         )
 
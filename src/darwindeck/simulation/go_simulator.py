@@ -12,7 +12,8 @@ from darwindeck.bindings.cardsim.SimulationRequest import (
     SimulationRequestAddMctsIterations, SimulationRequestAddRandomSeed,
     SimulationRequestAddPlayer0AiType, SimulationRequestAddPlayer1AiType,
     SimulationRequestAddAiTypes, SimulationRequestStartAiTypesVector,
-    SimulationRequestAddPlayerCount, SimulationRequestEnd,
+    SimulationRequestAddPlayerCount, SimulationRequestAddMctsThreads,
+    SimulationRequestEnd,
 )
 
 # AI type mapping for asymmetric simulation
@@ -28,7 +29,7 @@ AI_TYPE_MAP = {
 }
 from darwindeck.bindings.cardsim.BatchRequest import (
     BatchRequestStart, BatchRequestAddBatchId, BatchRequestAddRequests,
-    BatchRequestStartRequestsVector, BatchRequestEnd,
+    BatchRequestStartRequestsVector, BatchRequestAddDeadlineMs, BatchRequestEnd,
 )
 from darwindeck.evolution.fitness_full import SimulationResults
 
@@ -45,6 +46,76 @@ def _parse_team_wins(result) -> tuple[int, ...] | None:
     return None
 
 
+def _results_from_stats(result) -> SimulationResults:
+    """Convert a FlatBuffers AggregatedStats table to SimulationResults."""
+    # Read wins array, falling back to legacy fields if array is empty
+    wins_len = result.WinsLength()
+    if wins_len > 0:
+        wins = tuple(result.Wins(i) for i in range(wins_len))
+    else:
+        # Fallback to legacy fields for backward compatibility
+        wins = (result.Player0Wins(), result.Player1Wins())
+
+    result_player_count = result.PlayerCount()
+    if result_player_count == 0:
+        result_player_count = 2
+
+    # Read team_wins array (None if not a team game)
+    team_wins = _parse_team_wins(result)
+
+    return SimulationResults(
+        total_games=result.TotalGames(),
+        wins=wins,
+        player_count=result_player_count,
+        draws=result.Draws(),
+        avg_turns=result.AvgTurns(),
+        errors=result.Errors(),
+        # Phase 1 instrumentation
+        total_decisions=result.TotalDecisions(),
+        total_valid_moves=result.TotalValidMoves(),
+        forced_decisions=result.ForcedDecisions(),
+        total_hand_size=result.TotalHandSize(),
+        total_interactions=result.TotalInteractions(),
+        total_actions=result.TotalActions(),
+        # Bluffing metrics
+        total_claims=result.TotalClaims(),
+        total_bluffs=result.TotalBluffs(),
+        total_challenges=result.TotalChallenges(),
+        successful_bluffs=result.SuccessfulBluffs(),
+        successful_catches=result.SuccessfulCatches(),
+        # Betting metrics
+        total_bets=result.TotalBets(),
+        betting_bluffs=result.BettingBluffs(),
+        fold_wins=result.FoldWins(),
+        showdown_wins=result.ShowdownWins(),
+        all_in_count=result.AllInCount(),
+        # Tension curve metrics
+        lead_changes=result.LeadChanges(),
+        decisive_turn_pct=result.DecisiveTurnPct(),
+        closest_margin=result.ClosestMargin(),
+        trailing_winners=result.TrailingWinners(),
+        # Solitaire detection metrics
+        move_disruption_events=result.MoveDisruptionEvents(),
+        contention_events=result.ContentionEvents(),
+        forced_response_events=result.ForcedResponseEvents(),
+        opponent_turn_count=result.OpponentTurnCount(),
+        # Team play metrics
+        team_wins=team_wins,
+    )
+
+
+def _error_results(num_games: int, player_count: int) -> SimulationResults:
+    """Results for a request where every game failed."""
+    return SimulationResults(
+        total_games=num_games,
+        wins=tuple(0 for _ in range(player_count)),
+        player_count=player_count,
+        draws=0,
+        avg_turns=0.0,
+        errors=num_games,
+    )
+
+
 class GoSimulator:
     """Wrapper for Go simulation engine via CGo."""
 
@@ -85,22 +156,10 @@ class GoSimulator:
 
         # Compile genome to bytecode (with caching)
         try:
-            cache_key = genome.genome_id
-            if cache_key in self._bytecode_cache:
-                bytecode = self._bytecode_cache[cache_key]
-            else:
-                bytecode = self.compiler.compile_genome(genome)
-                self._bytecode_cache[cache_key] = bytecode
+            bytecode = self._compile(genome)
         except Exception as e:
             # Return error results for invalid genomes
-            return SimulationResults(
-                total_games=num_games,
-                wins=tuple(0 for _ in range(player_count)),
-                player_count=player_count,
-                draws=0,
-                avg_turns=0.0,
-                errors=num_games,
-            )
+            return _error_results(num_games, player_count)
 
         # Build FlatBuffers request
         builder = flatbuffers.Builder(2048)
@@ -130,72 +189,10 @@ class GoSimulator:
         # Call Go simulator
         try:
             response = simulate_batch(bytes(builder.Output()))
-            result = response.Results(0)
-
-            # Read wins array, falling back to legacy fields if array is empty
-            wins_len = result.WinsLength()
-            if wins_len > 0:
-                wins = tuple(result.Wins(i) for i in range(wins_len))
-            else:
-                # Fallback to legacy fields for backward compatibility
-                wins = (result.Player0Wins(), result.Player1Wins())
-
-            result_player_count = result.PlayerCount()
-            if result_player_count == 0:
-                result_player_count = 2
-
-            # Read team_wins array (None if not a team game)
-            team_wins = _parse_team_wins(result)
-
-            return SimulationResults(
-                total_games=result.TotalGames(),
-                wins=wins,
-                player_count=result_player_count,
-                draws=result.Draws(),
-                avg_turns=result.AvgTurns(),
-                errors=result.Errors(),
-                # Phase 1 instrumentation
-                total_decisions=result.TotalDecisions(),
-                total_valid_moves=result.TotalValidMoves(),
-                forced_decisions=result.ForcedDecisions(),
-                total_hand_size=result.TotalHandSize(),
-                total_interactions=result.TotalInteractions(),
-                total_actions=result.TotalActions(),
-                # Bluffing metrics
-                total_claims=result.TotalClaims(),
-                total_bluffs=result.TotalBluffs(),
-                total_challenges=result.TotalChallenges(),
-                successful_bluffs=result.SuccessfulBluffs(),
-                successful_catches=result.SuccessfulCatches(),
-                # Betting metrics
-                total_bets=result.TotalBets(),
-                betting_bluffs=result.BettingBluffs(),
-                fold_wins=result.FoldWins(),
-                showdown_wins=result.ShowdownWins(),
-                all_in_count=result.AllInCount(),
-                # Tension curve metrics
-                lead_changes=result.LeadChanges(),
-                decisive_turn_pct=result.DecisiveTurnPct(),
-                closest_margin=result.ClosestMargin(),
-                trailing_winners=result.TrailingWinners(),
-                # Solitaire detection metrics
-                move_disruption_events=result.MoveDisruptionEvents(),
-                contention_events=result.ContentionEvents(),
-                forced_response_events=result.ForcedResponseEvents(),
-                opponent_turn_count=result.OpponentTurnCount(),
-                # Team play metrics
-                team_wins=team_wins,
-            )
+            return _results_from_stats(response.Results(0))
         except Exception as e:
             # Return error results for simulation failures
-            return SimulationResults(
-                total_games=num_games,
-                wins=tuple(0 for _ in range(player_count)),
-                player_count=player_count,
-                draws=0,
-                avg_turns=0.0,
-                errors=num_games,
-            )
+            return _error_results(num_games, player_count)
 
     def simulate_asymmetric(
         self,
@@ -207,6 +204,7 @@ class GoSimulator:
         # Legacy parameters for backward compatibility
         p0_ai_type: Optional[str] = None,
         p1_ai_type: Optional[str] = None,
+        mcts_threads: int = 1,
     ) -> SimulationResults:
         """Simulate games with different AI types for each player.
 
@@ -220,6 +218,7 @@ class GoSimulator:
             player_count: Number of players (2-4)
             p0_ai_type: (DEPRECATED) AI for player 0
             p1_ai_type: (DEPRECATED) AI for player 1
+            mcts_threads: Root-parallel search trees per MCTS move
 
         Returns:
             SimulationResults with game statistics
@@ -241,30 +240,180 @@ class GoSimulator:
 
         # Compile genome to bytecode (with caching)
         try:
-            cache_key = genome.genome_id
-            if cache_key in self._bytecode_cache:
-                bytecode = self._bytecode_cache[cache_key]
-            else:
-                bytecode = self.compiler.compile_genome(genome)
-                self._bytecode_cache[cache_key] = bytecode
+            bytecode = self._compile(genome)
+        except Exception as e:
+            return _error_results(num_games, player_count)
+
+        builder = flatbuffers.Builder(2048)
+        req_offset = self._build_asymmetric_request(
+            builder, builder.CreateByteVector(bytecode), num_games, ai_types,
+            mcts_iterations, player_count, mcts_threads
+        )
+        self._finish_batch(builder, [req_offset])
+
+        try:
+            response = simulate_batch(bytes(builder.Output()))
+            return _results_from_stats(response.Results(0))
+        except Exception as e:
+            return _error_results(num_games, player_count)
+
+    def simulate_symmetric(
+        self,
+        genome: GameGenome | bytes,
+        games_per_direction: int,
+        ai_type: str,
+        opponent_ai_type: str = "random",
+        mcts_iterations: int = 500,
+        mcts_threads: int = 1,
+        time_budget_sec: Optional[float] = None,
+    ) -> tuple[SimulationResults, SimulationResults]:
+        """Play ai_type against opponent_ai_type from both seats in one Go call.
+
+        Both directions are sent as two requests of a single batch, so the
+        CGo boundary is crossed once instead of once per direction.
+
+        Args:
+            genome: Game genome to simulate (2-player), or its bytecode
+            games_per_direction: Games played with ai_type in each seat
+            ai_type: AI under test ("greedy", "mcts", "mcts500", ...)
+            opponent_ai_type: Baseline AI in the other seat
+            mcts_iterations: MCTS iterations (used if any player is MCTS)
+            mcts_threads: Root-parallel search trees per MCTS move
+            time_budget_sec: Optional wall-time budget for both directions;
+                directions cut short report fewer total_games
+
+        Returns:
+            (results with ai_type as P0, results with ai_type as P1)
+        """
+        try:
+            bytecode = self._compile(genome)
+        except Exception as e:
+            return (
+                _error_results(games_per_direction, 2),
+                _error_results(games_per_direction, 2),
+            )
+
+        builder = flatbuffers.Builder(4096)
+        genome_offset = builder.CreateByteVector(bytecode)
+        req_offsets = [
+            self._build_asymmetric_request(
+                builder, genome_offset, games_per_direction, seats, mcts_iterations, 2,
+                mcts_threads
+            )
+            for seats in ([ai_type, opponent_ai_type], [opponent_ai_type, ai_type])
+        ]
+        self._finish_batch(builder, req_offsets, time_budget_sec)
+
+        try:
+            response = simulate_batch(bytes(builder.Output()))
+            return (
+                _results_from_stats(response.Results(0)),
+                _results_from_stats(response.Results(1)),
+            )
         except Exception as e:
-            return SimulationResults(
-                total_games=num_games,
-                wins=tuple(0 for _ in range(player_count)),
-                player_count=player_count,
-                draws=0,
-                avg_turns=0.0,
-                errors=num_games,
+            return (
+                _error_results(games_per_direction, 2),
+                _error_results(games_per_direction, 2),
             )
 
+    def simulate_schedule(
+        self,
+        schedule: list[tuple[GameGenome | bytes, list[str], int, int]],
+        mcts_threads: int = 1,
+        time_budget_sec: Optional[float] = None,
+    ) -> list[SimulationResults]:
+        """Run many 2-player asymmetric simulations in one Go call.
+
+        Args:
+            schedule: (genome, ai_types, num_games, mcts_iterations) per item;
+                genome may be a GameGenome or its compiled bytecode
+            mcts_threads: Root-parallel search trees per MCTS move
+            time_budget_sec: Optional wall-time budget for the whole schedule;
+                items cut short report fewer total_games
+
+        Returns:
+            SimulationResults per schedule item, in order. Items whose genome
+            fails to compile get all-error results without affecting others.
+        """
+        results: list[Optional[SimulationResults]] = [None] * len(schedule)
+        builder = flatbuffers.Builder(4096 * max(1, len(schedule)))
+        # One bytecode vector per genome object; the id-keyed cache is
+        # bypassed since a schedule may hold mutants sharing a genome_id
+        genome_offsets: dict[int, Optional[int]] = {}
+        req_offsets = []
+        sent: list[int] = []
+        for i, (genome, ai_types, num_games, mcts_iterations) in enumerate(schedule):
+            if id(genome) not in genome_offsets:
+                try:
+                    bytecode = (
+                        genome if isinstance(genome, bytes)
+                        else self.compiler.compile_genome(genome)
+                    )
+                    genome_offsets[id(genome)] = builder.CreateByteVector(bytecode)
+                except Exception as e:
+                    genome_offsets[id(genome)] = None
+            genome_offset = genome_offsets[id(genome)]
+            if genome_offset is None:
+                results[i] = _error_results(num_games, 2)
+                continue
+            req_offsets.append(self._build_asymmetric_request(
+                builder, genome_offset, num_games, ai_types, mcts_iterations, 2,
+                mcts_threads
+            ))
+            sent.append(i)
+
+        if sent:
+            self._finish_batch(builder, req_offsets, time_budget_sec)
+            try:
+                response = simulate_batch(bytes(builder.Output()))
+                for j, i in enumerate(sent):
+                    results[i] = _results_from_stats(response.Results(j))
+            except Exception as e:
+                for i in sent:
+                    results[i] = _error_results(schedule[i][2], 2)
+
+        return results  # type: ignore[return-value]
+
+    def clear_bytecode_cache(self) -> None:
+        """Drop compiled bytecode (cache is keyed by genome_id, not content)."""
+        self._bytecode_cache.clear()
+
+    def _compile(self, genome: GameGenome | bytes) -> bytes:
+        """Compile genome to bytecode, caching by genome_id.
+
+        Already-compiled bytecode is returned unchanged.
+        """
+        if isinstance(genome, bytes):
+            return genome
+        cache_key = genome.genome_id
+        bytecode = self._bytecode_cache.get(cache_key)
+        if bytecode is None:
+            bytecode = self.compiler.compile_genome(genome)
+            self._bytecode_cache[cache_key] = bytecode
+        return bytecode
+
+    def _build_asymmetric_request(
+        self,
+        builder: flatbuffers.Builder,
+        genome_offset: int,
+        num_games: int,
+        ai_types: list[str],
+        mcts_iterations: int,
+        player_count: int,
+        mcts_threads: int = 1,
+    ) -> int:
+        """Add a per-player-AI SimulationRequest to builder, returning its offset.
+
+        genome_offset is a bytecode vector already in builder, so requests for
+        the same genome share one copy. Each request consumes one seed from
+        the simulator's sequence. mcts_threads > 1 asks Go for root-parallel
+        MCTS with that many trees per move.
+        """
         # Map AI type strings to enum values (with offset)
         ai_type_values = [
             AI_TYPE_MAP.get(ai.lower(), 1) for ai in ai_types[:player_count]
         ]
 
-        builder = flatbuffers.Builder(2048)
-        genome_offset = builder.CreateByteVector(bytecode)
-
         # Build ai_types vector
         SimulationRequestStartAiTypesVector(builder, len(ai_type_values))
         for ai_val in reversed(ai_type_values):
@@ -279,86 +428,36 @@ class GoSimulator:
         SimulationRequestAddRandomSeed(builder, self.seed + self._batch_id)
         SimulationRequestAddAiTypes(builder, ai_types_offset)
         SimulationRequestAddPlayerCount(builder, player_count)
+        if mcts_threads > 1:
+            SimulationRequestAddMctsThreads(builder, min(mcts_threads, 255))
         # Also set legacy fields for backward compatibility with older Go code
         SimulationRequestAddPlayer0AiType(builder, ai_type_values[0] if ai_type_values else 1)
         SimulationRequestAddPlayer1AiType(builder, ai_type_values[1] if len(ai_type_values) > 1 else 1)
-        req_offset = SimulationRequestEnd(builder)
+        self._batch_id += 1
+        return SimulationRequestEnd(builder)
 
-        BatchRequestStartRequestsVector(builder, 1)
-        builder.PrependUOffsetTRelative(req_offset)
+    def _finish_batch(
+        self,
+        builder: flatbuffers.Builder,
+        req_offsets: list[int],
+        time_budget_sec: Optional[float] = None,
+    ) -> None:
+        """Wrap request offsets in a BatchRequest and finish the buffer.
+
+        With time_budget_sec, Go stops starting new games once the budget
+        (measured from when it begins the batch) is spent; the affected
+        results then report fewer total_games than requested.
+        """
+        BatchRequestStartRequestsVector(builder, len(req_offsets))
+        for req_offset in reversed(req_offsets):
+            builder.PrependUOffsetTRelative(req_offset)
         requests_offset = builder.EndVector()
 
-        self._batch_id += 1
         BatchRequestStart(builder)
         BatchRequestAddBatchId(builder, self._batch_id)
         BatchRequestAddRequests(builder, requests_offset)
+        if time_budget_sec is not None:
+            BatchRequestAddDeadlineMs(builder, max(1, int(time_budget_sec * 1000)))
         batch_offset = BatchRequestEnd(builder)
 
         builder.Finish(batch_offset)
-
-        try:
-            response = simulate_batch(bytes(builder.Output()))
-            result = response.Results(0)
-
-            # Read wins array, falling back to legacy fields if array is empty
-            wins_len = result.WinsLength()
-            if wins_len > 0:
-                wins = tuple(result.Wins(i) for i in range(wins_len))
-            else:
-                # Fallback to legacy fields for backward compatibility
-                wins = (result.Player0Wins(), result.Player1Wins())
-
-            result_player_count = result.PlayerCount()
-            if result_player_count == 0:
-                result_player_count = 2
-
-            # Read team_wins array (None if not a team game)
-            team_wins = _parse_team_wins(result)
-
-            return SimulationResults(
-                total_games=result.TotalGames(),
-                wins=wins,
-                player_count=result_player_count,
-                draws=result.Draws(),
-                avg_turns=result.AvgTurns(),
-                errors=result.Errors(),
-                total_decisions=result.TotalDecisions(),
-                total_valid_moves=result.TotalValidMoves(),
-                forced_decisions=result.ForcedDecisions(),
-                total_hand_size=result.TotalHandSize(),
-                total_interactions=result.TotalInteractions(),
-                total_actions=result.TotalActions(),
-                # Bluffing metrics
-                total_claims=result.TotalClaims(),
-                total_bluffs=result.TotalBluffs(),
-                total_challenges=result.TotalChallenges(),
-                successful_bluffs=result.SuccessfulBluffs(),
-                successful_catches=result.SuccessfulCatches(),
-                # Betting metrics
-                total_bets=result.TotalBets(),
-                betting_bluffs=result.BettingBluffs(),
-                fold_wins=result.FoldWins(),
-                showdown_wins=result.ShowdownWins(),
-                all_in_count=result.AllInCount(),
-                # Tension curve metrics
-                lead_changes=result.LeadChanges(),
-                decisive_turn_pct=result.DecisiveTurnPct(),
-                closest_margin=result.ClosestMargin(),
-                trailing_winners=result.TrailingWinners(),
-                # Solitaire detection metrics
-                move_disruption_events=result.MoveDisruptionEvents(),
-                contention_events=result.ContentionEvents(),
-                forced_response_events=result.ForcedResponseEvents(),
-                opponent_turn_count=result.OpponentTurnCount(),
-                # Team play metrics
-                team_wins=team_wins,
-            )
-        except Exception as e:
-            return SimulationResults(
-                total_games=num_games,
-                wins=tuple(0 for _ in range(player_count)),
-                player_count=player_count,
-                draws=0,
-                avg_turns=0.0,
-                errors=num_games,
-            )
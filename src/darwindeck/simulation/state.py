@@ -34,7 +34,7 @@ class Claim:
     cards_played: tuple[Card, ...]  # Actual cards played (for verification)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlayerState:
     """Immutable player state."""
 
@@ -73,8 +73,20 @@ func (rcv *BatchRequest) MutateBatchId(n uint64) bool {
 	return rcv._tab.MutateUint64Slot(6, n)
 }
 
+func (rcv *BatchRequest) DeadlineMs() uint32 {
+	o := flatbuffers.UOffsetT(rcv._tab.Offset(8))
+	if o != 0 {
+		return rcv._tab.GetUint32(o + rcv._tab.Pos)
+	}
+	return 0
+}
+
+func (rcv *BatchRequest) MutateDeadlineMs(n uint32) bool {
+	return rcv._tab.MutateUint32Slot(8, n)
+}
+
 func BatchRequestStart(builder *flatbuffers.Builder) {
-	builder.StartObject(2)
+	builder.StartObject(3)
 }
 func BatchRequestAddRequests(builder *flatbuffers.Builder, requests flatbuffers.UOffsetT) {
 	builder.PrependUOffsetTSlot(0, flatbuffers.UOffsetT(requests), 0)
@@ -85,6 +97,9 @@ func BatchRequestStartRequestsVector(builder *flatbuffers.Builder, numElems int)
 func BatchRequestAddBatchId(builder *flatbuffers.Builder, batchId uint64) {
 	builder.PrependUint64Slot(1, batchId, 0)
 }
+func BatchRequestAddDeadlineMs(builder *flatbuffers.Builder, deadlineMs uint32) {
+	builder.PrependUint32Slot(2, deadlineMs, 0)
+}
 func BatchRequestEnd(builder *flatbuffers.Builder) flatbuffers.UOffsetT {
 	return builder.EndObject()
 }
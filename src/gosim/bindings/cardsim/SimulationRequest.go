@@ -237,8 +237,20 @@ func (rcv *SimulationRequest) TeamsLength() int {
 	return 0
 }
 
+func (rcv *SimulationRequest) MctsThreads() byte {
+	o := flatbuffers.UOffsetT(rcv._tab.Offset(28))
+	if o != 0 {
+		return rcv._tab.GetByte(o + rcv._tab.Pos)
+	}
+	return 0
+}
+
+func (rcv *SimulationRequest) MutateMctsThreads(n byte) bool {
+	return rcv._tab.MutateByteSlot(28, n)
+}
+
 func SimulationRequestStart(builder *flatbuffers.Builder) {
-	builder.StartObject(12)
+	builder.StartObject(13)
 }
 func SimulationRequestAddGenomeBytecode(builder *flatbuffers.Builder, genomeBytecode flatbuffers.UOffsetT) {
 	builder.PrependUOffsetTSlot(0, flatbuffers.UOffsetT(genomeBytecode), 0)
@@ -285,6 +297,9 @@ func SimulationRequestAddTeams(builder *flatbuffers.Builder, teams flatbuffers.U
 func SimulationRequestStartTeamsVector(builder *flatbuffers.Builder, numElems int) flatbuffers.UOffsetT {
 	return builder.StartVector(4, numElems, 4)
 }
+func SimulationRequestAddMctsThreads(builder *flatbuffers.Builder, mctsThreads byte) {
+	builder.PrependByteSlot(12, mctsThreads, 0)
+}
 func SimulationRequestEnd(builder *flatbuffers.Builder) flatbuffers.UOffsetT {
 	return builder.EndObject()
 }
@@ -6,6 +6,7 @@ package main
 */
 import "C"
 import (
+	"time"
 	"unsafe"
 
 	flatbuffers "github.com/google/flatbuffers/go"
@@ -69,6 +70,12 @@ func SimulateBatch(requestPtr unsafe.Pointer, requestLen C.int, responseLen *C.i
 	// Create response builder
 	builder := flatbuffers.NewBuilder(1024)
 
+	// Optional wall-time budget shared by every request in the batch
+	var deadline time.Time
+	if ms := batchRequest.DeadlineMs(); ms > 0 {
+		deadline = time.Now().Add(time.Duration(ms) * time.Millisecond)
+	}
+
 	// Process each simulation request
 	requestCount := batchRequest.RequestsLength()
 	resultOffsets := make([]flatbuffers.UOffsetT, requestCount)
@@ -95,6 +102,7 @@ func SimulateBatch(requestPtr unsafe.Pointer, requestLen C.int, responseLen *C.i
 		// Determine AI types
 		aiType := simulation.AIPlayerType(req.AiPlayerType())
 		mctsIter := int(req.MctsIterations())
+		mctsThreads := int(req.MctsThreads())
 		seed := req.RandomSeed()
 
 		// Get player count (default to 2 for backward compatibility)
@@ -150,7 +158,7 @@ func SimulateBatch(requestPtr unsafe.Pointer, requestLen C.int, responseLen *C.i
 			simStats = simulation.RunBatch(genome, int(req.NumGames()), aiTypes[0], mctsIter, seed)
 		} else {
 			// Asymmetric simulation (e.g., MCTS vs Random for skill evaluation)
-			simStats = simulation.RunBatchAsymmetric(genome, int(req.NumGames()), aiTypes[0], aiTypes[1], mctsIter, seed)
+			simStats = simulation.RunBatchAsymmetric(genome, int(req.NumGames()), aiTypes[0], aiTypes[1], mctsIter, mctsThreads, seed, deadline)
 		}
 
 		// Convert to AggStats
@@ -203,6 +203,51 @@ func TestMCTSSearch(t *testing.T) {
 	}
 }
 
+func TestMCTSSearchParallel(t *testing.T) {
+	state := engine.GetState()
+	defer engine.PutState(state)
+
+	state.Deck = append(state.Deck,
+		engine.Card{Rank: 5, Suit: 0},
+		engine.Card{Rank: 3, Suit: 1},
+		engine.Card{Rank: 8, Suit: 2},
+	)
+	state.CurrentPlayer = 0
+	state.WinnerID = -1
+
+	genome := &engine.Genome{
+		Header: &engine.BytecodeHeader{
+			PlayerCount: 2,
+			MaxTurns:    100,
+		},
+		TurnPhases: []engine.PhaseDescriptor{
+			{
+				PhaseType: 1,
+				Data: []byte{
+					0,          // source: deck
+					0, 0, 0, 1, // count: 1
+					1, // mandatory: true
+					0, // has_condition: false
+				},
+			},
+		},
+		WinConditions: []engine.WinCondition{
+			{WinType: 0, Threshold: 0},
+		},
+	}
+
+	// Four root-parallel trees sharing the iteration budget
+	move := SearchParallel(state, genome, 100, 1.414, 4)
+
+	if move == nil {
+		t.Fatal("Parallel MCTS returned nil move")
+	}
+
+	if move.PhaseIndex != 0 {
+		t.Errorf("Expected move for phase 0, got %d", move.PhaseIndex)
+	}
+}
+
 func BenchmarkMCTSSearch(b *testing.B) {
 	state := engine.GetState()
 	defer engine.PutState(state)
@@ -2,6 +2,7 @@ package mcts
 
 import (
 	"math/rand"
+	"sync"
 
 	"github.com/signalnine/darwindeck/gosim/engine"
 )
@@ -16,9 +17,90 @@ func Search(state *engine.GameState, genome *engine.Genome, iterations int, expl
 		explorationParam = DefaultExplorationParam
 	}
 
+	root := buildTree(state, genome, iterations, explorationParam)
+	defer PutNode(root)
+
+	// Return most visited child's move
+	bestChild := root.MostVisitedChild()
+	if bestChild == nil || bestChild.Move == nil {
+		// Fallback to first legal move if MCTS fails
+		moves := engine.GenerateLegalMoves(state, genome)
+		if len(moves) > 0 {
+			return &moves[0]
+		}
+		return nil
+	}
+
+	// Create a copy of the move to return
+	moveCopy := *bestChild.Move
+	return &moveCopy
+}
+
+// SearchParallel performs root-parallel MCTS: threads independent trees are
+// grown concurrently with iterations/threads simulations each, their root
+// visit counts are summed per move, and the most visited move is returned.
+// threads <= 1 is equivalent to Search.
+func SearchParallel(state *engine.GameState, genome *engine.Genome, iterations int, explorationParam float64, threads int) *engine.LegalMove {
+	if threads <= 1 {
+		return Search(state, genome, iterations, explorationParam)
+	}
+	if explorationParam == 0 {
+		explorationParam = DefaultExplorationParam
+	}
+
+	perTree := iterations / threads
+	if perTree < 1 {
+		perTree = 1
+	}
+
+	// Each tree reports its root visit counts keyed by move
+	treeVisits := make([]map[engine.LegalMove]int, threads)
+	var wg sync.WaitGroup
+	for t := 0; t < threads; t++ {
+		wg.Add(1)
+		go func(t int) {
+			defer wg.Done()
+			root := buildTree(state, genome, perTree, explorationParam)
+			defer PutNode(root)
+
+			visits := make(map[engine.LegalMove]int, len(root.Children))
+			for _, child := range root.Children {
+				if child.Move != nil {
+					visits[*child.Move] += child.Visits
+				}
+			}
+			treeVisits[t] = visits
+		}(t)
+	}
+	wg.Wait()
+
+	// Pick the move with the most total visits, breaking ties by legal-move
+	// order so the choice doesn't depend on goroutine scheduling
+	moves := engine.GenerateLegalMoves(state, genome)
+	if len(moves) == 0 {
+		return nil
+	}
+	bestIdx := 0
+	bestVisits := -1
+	for i, move := range moves {
+		total := 0
+		for _, visits := range treeVisits {
+			total += visits[move]
+		}
+		if total > bestVisits {
+			bestVisits = total
+			bestIdx = i
+		}
+	}
+
+	return &moves[bestIdx]
+}
+
+// buildTree grows a search tree rooted at a clone of state. The caller owns
+// the returned root and must release it with PutNode.
+func buildTree(state *engine.GameState, genome *engine.Genome, iterations int, explorationParam float64) *MCTSNode {
 	// Create root node
 	root := GetNode()
-	defer PutNode(root)
 
 	root.State = state.Clone()
 	root.PlayerID = state.CurrentPlayer
@@ -53,20 +135,7 @@ func Search(state *engine.GameState, genome *engine.Genome, iterations int, expl
 		backpropagate(node, winner)
 	}
 
-	// Return most visited child's move
-	bestChild := root.MostVisitedChild()
-	if bestChild == nil || bestChild.Move == nil {
-		// Fallback to first legal move if MCTS fails
-		moves := engine.GenerateLegalMoves(state, genome)
-		if len(moves) > 0 {
-			return &moves[0]
-		}
-		return nil
-	}
-
-	// Create a copy of the move to return
-	moveCopy := *bestChild.Move
-	return &moveCopy
+	return root
 }
 
 // expand adds a new child node for an untried move
@@ -162,13 +231,13 @@ func backpropagate(node *MCTSNode, winner int8) {
 type SearchParams struct {
 	Iterations       int
 	ExplorationParam float64
+	Threads          int // Root-parallel trees (0/1 = single tree)
 	// Future extensions:
 	// UseRAVE         bool
 	// UseProgWiden    bool
-	// ParallelWorkers int
 }
 
 // SearchWithParams runs MCTS with custom parameters
 func SearchWithParams(state *engine.GameState, genome *engine.Genome, params SearchParams) *engine.LegalMove {
-	return Search(state, genome, params.Iterations, params.ExplorationParam)
+	return SearchParallel(state, genome, params.Iterations, params.ExplorationParam, params.Threads)
 }
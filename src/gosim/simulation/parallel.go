@@ -206,7 +206,8 @@ func workerAsymmetric(wg *sync.WaitGroup, jobs <-chan GameJob, results chan<- Ga
 	defer wg.Done()
 
 	for job := range jobs {
-		result := RunSingleGameAsymmetric(genome, p0AIType, p1AIType, mctsIterations, job.Seed)
+		// Games already run in parallel here, so each search uses one tree
+		result := RunSingleGameAsymmetric(genome, p0AIType, p1AIType, mctsIterations, 1, job.Seed)
 		results <- result
 	}
 }
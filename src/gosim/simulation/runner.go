@@ -486,21 +486,27 @@ func RunSingleGame(genome *engine.Genome, aiType AIPlayerType, mctsIterations in
 }
 
 // RunBatchAsymmetric simulates games with different AI types for each player.
-// Used for skill gap measurement (e.g., MCTS vs Random).
-func RunBatchAsymmetric(genome *engine.Genome, numGames int, p0AIType AIPlayerType, p1AIType AIPlayerType, mctsIterations int, seed uint64) AggregatedStats {
-	results := make([]GameResult, numGames)
+// Used for skill gap measurement (e.g., MCTS vs Random). mctsThreads > 1 runs
+// that many root-parallel search trees per MCTS move. A non-zero deadline
+// stops starting new games once it passes; the stats then cover only the
+// games played (TotalGames < numGames).
+func RunBatchAsymmetric(genome *engine.Genome, numGames int, p0AIType AIPlayerType, p1AIType AIPlayerType, mctsIterations int, mctsThreads int, seed uint64, deadline time.Time) AggregatedStats {
+	results := make([]GameResult, 0, numGames)
 	rng := rand.New(rand.NewSource(int64(seed)))
 
 	for i := 0; i < numGames; i++ {
+		if !deadline.IsZero() && time.Now().After(deadline) {
+			break
+		}
 		gameSeed := rng.Uint64()
-		results[i] = RunSingleGameAsymmetric(genome, p0AIType, p1AIType, mctsIterations, gameSeed)
+		results = append(results, RunSingleGameAsymmetric(genome, p0AIType, p1AIType, mctsIterations, mctsThreads, gameSeed))
 	}
 
 	return aggregateResults(results)
 }
 
 // RunSingleGameAsymmetric plays one game with different AI for each player.
-func RunSingleGameAsymmetric(genome *engine.Genome, p0AIType AIPlayerType, p1AIType AIPlayerType, mctsIterations int, seed uint64) GameResult {
+func RunSingleGameAsymmetric(genome *engine.Genome, p0AIType AIPlayerType, p1AIType AIPlayerType, mctsIterations int, mctsThreads int, seed uint64) GameResult {
 	start := time.Now()
 	var metrics GameMetrics
 
@@ -745,13 +751,13 @@ func RunSingleGameAsymmetric(genome *engine.Genome, p0AIType AIPlayerType, p1AIT
 			case GreedyAI:
 				move = selectGreedyMove(state, genome, moves)
 			case MCTS100AI:
-				move = mcts.Search(state, genome, 100, mcts.DefaultExplorationParam)
+				move = mcts.SearchParallel(state, genome, 100, mcts.DefaultExplorationParam, mctsThreads)
 			case MCTS500AI:
-				move = mcts.Search(state, genome, 500, mcts.DefaultExplorationParam)
+				move = mcts.SearchParallel(state, genome, 500, mcts.DefaultExplorationParam, mctsThreads)
 			case MCTS1000AI:
-				move = mcts.Search(state, genome, 1000, mcts.DefaultExplorationParam)
+				move = mcts.SearchParallel(state, genome, 1000, mcts.DefaultExplorationParam, mctsThreads)
 			case MCTS2000AI:
-				move = mcts.Search(state, genome, 2000, mcts.DefaultExplorationParam)
+				move = mcts.SearchParallel(state, genome, 2000, mcts.DefaultExplorationParam, mctsThreads)
 			default:
 				move = &moves[0]
 			}
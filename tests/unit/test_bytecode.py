@@ -605,3 +605,16 @@ def test_compile_genome_with_default_contract_scoring():
     nil_bonus_high = bytecode[scoring_start + 4]
     nil_bonus = nil_bonus_low + (nil_bonus_high << 8)
     assert nil_bonus == 100, f"Expected default 100, got {nil_bonus}"
+
+
+def test_compile_condition_reuses_encoding() -> None:
+    """Cached condition encodings match a fresh compiler's output."""
+    from darwindeck.genome.examples import get_seed_genomes
+
+    warm = BytecodeCompiler()
+    for genome in get_seed_genomes():
+        warm.compile_genome(genome)
+    assert warm._condition_cache
+
+    for genome in get_seed_genomes():
+        assert warm.compile_genome(genome) == BytecodeCompiler().compile_genome(genome)
@@ -0,0 +1,59 @@
+"""Tests for the describe CLI."""
+
+import json
+import sys
+
+import pytest
+
+from darwindeck.cli import describe
+from darwindeck.genome.examples import create_war_genome
+from darwindeck.genome.serialization import genome_to_json
+
+SKILL_EVALUATION = {
+    'greedy_win_rate': 0.75,
+    'greedy_wins_as_p0': 8,
+    'greedy_wins_as_p1': 7,
+    'mcts_win_rate': 0.9,
+    'mcts_wins_as_p0': 5,
+    'mcts_wins_as_p1': 4,
+    'skill_score': 0.825,
+    'first_player_advantage': 0.1,
+    'total_games': 30,
+    'timed_out': False,
+}
+
+
+def run_describe(tmp_path, monkeypatch, skill_evaluation):
+    """Run describe on a genome file laid out like evolve's output."""
+    genome_data = json.loads(genome_to_json(create_war_genome()))
+    genome_data['fitness'] = 0.6
+    genome_data['skill_evaluation'] = skill_evaluation
+    genome_file = tmp_path / "rank01_war.json"
+    genome_file.write_text(json.dumps(genome_data))
+
+    seen = {}
+
+    def fake_describe_game(genome, fitness, skill):
+        seen['skill'] = skill
+        return "A game."
+
+    monkeypatch.setattr(describe, "describe_game", fake_describe_game)
+    monkeypatch.setattr(sys, "argv", ["describe", str(genome_file)])
+    describe.main()
+    return seen['skill']
+
+
+def test_embedded_skill_with_mcts_games(tmp_path, monkeypatch):
+    """Skill blocks written by evolve (with mcts_games) are loaded."""
+    skill = run_describe(tmp_path, monkeypatch, {**SKILL_EVALUATION, 'mcts_games': 10})
+    assert skill.genome_id == create_war_genome().genome_id
+    assert skill.mcts_games == 10
+    assert skill.mcts_win_rate == pytest.approx(0.9)
+    assert skill.greedy_win_rate == 0.75
+
+
+def test_embedded_skill_without_mcts_games(tmp_path, monkeypatch):
+    """Older skill blocks split total_games evenly between the tiers."""
+    skill = run_describe(tmp_path, monkeypatch, SKILL_EVALUATION)
+    assert skill.mcts_games == 15
+    assert skill.mcts_win_rate == pytest.approx(9 / 15)
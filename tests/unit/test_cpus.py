@@ -0,0 +1,36 @@
+"""Tests for CPU budget detection."""
+
+from darwindeck.evolution.cpus import _cgroup_cpu_quota, available_cpus
+
+
+def test_cgroup_v2_quota(tmp_path):
+    """cpu.max quota/period gives the core budget."""
+    (tmp_path / "cpu.max").write_text("200000 100000\n")
+    assert _cgroup_cpu_quota(tmp_path) == 2.0
+
+
+def test_cgroup_v2_unlimited(tmp_path):
+    """A 'max' quota means no limit."""
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+    assert _cgroup_cpu_quota(tmp_path) is None
+
+
+def test_cgroup_v1_quota(tmp_path):
+    """cfs_quota_us / cfs_period_us gives the core budget; -1 is unlimited."""
+    (tmp_path / "cpu").mkdir()
+    (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("150000\n")
+    assert _cgroup_cpu_quota(tmp_path) == 1.5
+
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("-1\n")
+    assert _cgroup_cpu_quota(tmp_path) is None
+
+
+def test_no_cgroup_files(tmp_path):
+    """Missing cgroup files mean no known quota."""
+    assert _cgroup_cpu_quota(tmp_path) is None
+
+
+def test_available_cpus_is_positive():
+    """The usable CPU count is always at least one."""
+    assert available_cpus() >= 1
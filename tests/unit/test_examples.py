@@ -159,3 +159,23 @@ def test_partnership_spades_genome_has_bidding():
     has_bidding = any(isinstance(p, BiddingPhase) for p in genome.turn_structure.phases)
     assert has_bidding, "Partnership Spades should have BiddingPhase"
     assert genome.contract_scoring is not None
+
+
+def test_seed_genomes_built_once():
+    """Factories return the same frozen genome; the seed list is a fresh copy."""
+    from darwindeck.genome.examples import create_war_genome, get_seed_genomes
+
+    assert create_war_genome() is create_war_genome()
+    seeds = get_seed_genomes()
+    seeds.clear()
+    assert get_seed_genomes()[0] is create_war_genome()
+
+
+def test_get_seed_genome_by_id():
+    """Each seed is reachable by its own genome_id."""
+    from darwindeck.genome.examples import get_seed_genome, get_seed_genomes
+
+    for genome in get_seed_genomes():
+        assert get_seed_genome(genome.genome_id) is genome
+    with pytest.raises(KeyError):
+        get_seed_genome("no-such-game")
@@ -73,3 +73,31 @@ def test_genome_team_mode_with_teams() -> None:
     )
     assert genome.team_mode is True
     assert genome.teams == ((0, 2), (1, 3))
+
+
+def test_genome_derives_win_types_and_phase_index() -> None:
+    """GameGenome precomputes win types and phases grouped by type."""
+    from dataclasses import replace
+    from darwindeck.genome.schema import (
+        BettingPhase, DrawPhase, Location, PlayPhase, WinCondition,
+    )
+
+    play = PlayPhase(target=Location.DISCARD)
+    genome = GameGenome(
+        schema_version="1.0",
+        genome_id="derived",
+        generation=0,
+        setup=SetupRules(cards_per_player=5),
+        turn_structure=TurnStructure(phases=[DrawPhase(source=Location.DECK), play]),
+        special_effects=[],
+        win_conditions=[WinCondition(type="empty_hand"), WinCondition(type="high_score")],
+        scoring_rules=[],
+    )
+    assert genome.win_types == {"empty_hand", "high_score"}
+    assert genome.phases_of(PlayPhase) == (play,)
+    assert genome.phases_of(BettingPhase) == ()
+
+    # Derived data follows field changes and stays out of equality
+    bare = replace(genome, turn_structure=TurnStructure(phases=[]))
+    assert bare.phases_of(PlayPhase) == ()
+    assert replace(bare, turn_structure=genome.turn_structure) == genome
@@ -68,6 +68,49 @@ class TestGenomeValidator:
         assert len(errors) >= 1
         assert any("starting_chips" in e for e in errors)
 
+    def test_repeated_pattern_reported_once(self):
+        """Identical inconsistent HandPatterns produce a single error."""
+        pattern = HandPattern(
+            name="Full House", rank_priority=1,
+            required_count=4, same_rank_groups=(3, 2),
+        )
+        genome = GameGenome(
+            schema_version="1.0",
+            genome_id="test",
+            generation=0,
+            setup=SetupRules(cards_per_player=5),
+            turn_structure=TurnStructure(phases=[PlayPhase(target=Location.DISCARD)]),
+            special_effects=[],
+            win_conditions=[WinCondition(type="best_hand")],
+            scoring_rules=[],
+            hand_evaluation=HandEvaluation(
+                method=HandEvaluationMethod.PATTERN_MATCH,
+                patterns=(pattern, pattern),
+            ),
+        )
+        errors = GenomeValidator.validate(genome)
+        assert errors == [
+            "HandPattern 'Full House': same_rank_groups sum (5) exceeds required_count (4)"
+        ]
+
+    def test_errors_reported_in_check_order(self):
+        """Showdown errors come before the missing card-play error."""
+        genome = GameGenome(
+            schema_version="1.0",
+            genome_id="test",
+            generation=0,
+            setup=SetupRules(cards_per_player=5, starting_chips=100),
+            turn_structure=TurnStructure(phases=[BettingPhase(min_bet=10)]),
+            special_effects=[],
+            win_conditions=[WinCondition(type="most_chips")],
+            scoring_rules=[],
+        )
+        assert GenomeValidator.validate(genome) == [
+            "BettingPhase with HAND_EVALUATION showdown requires hand_evaluation",
+            "Game has no card play phases "
+            "(needs TrickPhase, PlayPhase, DiscardPhase, or DrawPhase)",
+        ]
+
 
 class TestTeamValidation:
     """Tests for team configuration validation."""
@@ -148,6 +191,29 @@ class TestTeamValidation:
         assert len(errors) >= 1
         assert any("assigned" in e.lower() for e in errors)
 
+    def test_validate_reports_every_team_problem(self):
+        """Out-of-range, duplicate and missing players are all reported."""
+        genome = GameGenome(
+            schema_version="1.0",
+            genome_id="test",
+            generation=0,
+            setup=SetupRules(cards_per_player=5),
+            turn_structure=TurnStructure(phases=[PlayPhase(target=Location.DISCARD)]),
+            special_effects=[],
+            win_conditions=[WinCondition(type="empty_hand")],
+            scoring_rules=[],
+            player_count=4,
+            team_mode=True,
+            teams=((0, 6), (0, -1)),
+        )
+        errors = GenomeValidator.validate(genome)
+        assert errors == [
+            "Player index 6 out of range [0, 4)",
+            "Duplicate player 0 appears in multiple teams",
+            "Player index -1 out of range [0, 4)",
+            "Players not assigned to any team: [1, 2, 3]",
+        ]
+
     def test_validate_single_team_fails(self):
         """Only one team should fail validation (need at least 2)."""
         genome = GameGenome(
@@ -278,3 +344,25 @@ class TestBiddingValidation:
         errors = GenomeValidator.validate(genome)
         bidding_errors = [e for e in errors if "Bidding" in e or "Contract" in e]
         assert len(bidding_errors) == 0, f"Expected no bidding errors but got: {bidding_errors}"
+
+
+class TestIsValid:
+    """Tests for the pass/fail fast path."""
+
+    def test_matches_full_validation(self):
+        """is_valid agrees with validate on valid and invalid genomes."""
+        valid = create_war_genome()
+        invalid = GameGenome(
+            schema_version="1.0",
+            genome_id="test",
+            generation=0,
+            setup=SetupRules(cards_per_player=30),  # 60 cards for 2 players
+            turn_structure=TurnStructure(phases=[BettingPhase(min_bet=10)]),
+            special_effects=[],
+            win_conditions=[WinCondition(type="high_score")],
+            scoring_rules=[],
+        )
+
+        assert GenomeValidator.is_valid(valid)
+        assert not GenomeValidator.is_valid(invalid)
+        assert len(GenomeValidator.validate(invalid)) > 1
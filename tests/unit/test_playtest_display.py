@@ -99,6 +99,28 @@ class TestStateRenderer:
 
         assert "15" in output
 
+    def test_discard_check_follows_genome(self):
+        """Switching genomes re-checks whether a discard pile is shown."""
+        renderer = StateRenderer()
+        state = make_state_with_hand([("A", "C")])
+        with_discard = make_simple_genome()
+        without_discard = GameGenome(
+            schema_version="1.0",
+            genome_id="no-discard",
+            generation=1,
+            setup=SetupRules(cards_per_player=5),
+            turn_structure=TurnStructure(phases=[
+                PlayPhase(target=Location.TABLEAU)
+            ]),
+            special_effects=[],
+            win_conditions=[WinCondition(type="empty_hand")],
+            scoring_rules=[],
+        )
+
+        assert "Discard pile" in renderer.render(state, with_discard, player_idx=0)
+        assert "Discard pile" not in renderer.render(state, without_discard, player_idx=0)
+        assert "Discard pile" in renderer.render(state, with_discard, player_idx=0)
+
 
 class TestMovePresenter:
     """Tests for MovePresenter."""
@@ -174,3 +196,15 @@ class TestMovePresenter:
         assert "[3]" in output and "Pass" in output
         assert "7" in output
         assert "K" in output
+
+
+class TestFormatCard:
+    """Tests for format_card."""
+
+    def test_formats_every_card(self):
+        """Every rank and suit gets its rank text and suit symbol."""
+        symbols = {"H": "♥", "D": "♦", "C": "♣", "S": "♠"}
+        for suit in Suit:
+            for rank in Rank:
+                card = Card(rank=rank, suit=suit)
+                assert format_card(card) == f"{rank.value}{symbols[suit.value]}"
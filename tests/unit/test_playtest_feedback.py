@@ -110,3 +110,45 @@ class TestFeedbackCollector:
         collector.save(result)
 
         assert output_file.exists()
+
+    def test_save_many_appends_all(self, tmp_path: Path):
+        """save_many writes one line per result after existing lines."""
+        output_file = tmp_path / "results.jsonl"
+        collector = FeedbackCollector(output_file)
+        results = [
+            PlaytestResult(
+                genome_id=f"Game{i}",
+                genome_path=f"game{i}.json",
+                difficulty="random",
+                seed=i,
+                winner="ai",
+                turns=5,
+            )
+            for i in range(3)
+        ]
+
+        collector.save(results[0])
+        collector.save_many(results[1:])
+
+        lines = output_file.read_text().strip().split("\n")
+        assert [json.loads(line)["seed"] for line in lines] == [0, 1, 2]
+
+    def test_context_manager_keeps_file_open(self, tmp_path: Path):
+        """Saves inside a with block share one handle and all land on disk."""
+        output_file = tmp_path / "subdir" / "results.jsonl"
+
+        with FeedbackCollector(output_file) as collector:
+            for i in range(3):
+                collector.save(PlaytestResult(
+                    genome_id=f"Game{i}",
+                    genome_path=f"game{i}.json",
+                    difficulty="random",
+                    seed=i,
+                    winner="human",
+                    turns=10,
+                    comment="♥ fun",
+                ))
+
+        lines = output_file.read_text(encoding="utf-8").strip().split("\n")
+        assert [json.loads(line)["genome_id"] for line in lines] == ["Game0", "Game1", "Game2"]
+        assert json.loads(lines[0])["comment"] == "♥ fun"
@@ -86,6 +86,116 @@ class TestPlaytestSession:
         assert session.move_history[0]["player"] == "human"
         assert session.move_history[1]["player"] == "ai"
 
+    def test_legal_moves_generated_once_per_state(self):
+        """Legal moves are reused until the state changes."""
+        genome = make_simple_genome()
+        session = PlaytestSession(genome, SessionConfig(seed=12345))
+        session.state = session._initialize_state()
+
+        with patch(
+            "darwindeck.playtest.session.generate_legal_moves", return_value=[]
+        ) as generate:
+            assert session._legal_moves() is session._legal_moves()
+            assert generate.call_count == 1
+
+            session._advance_turn()
+            session._legal_moves()
+            assert generate.call_count == 2
+
+    def test_win_check_runs_once_per_state(self):
+        """The win check is reused until the state changes."""
+        session = PlaytestSession(make_simple_genome(), SessionConfig(seed=12345))
+        session.state = session._initialize_state()
+
+        with patch(
+            "darwindeck.playtest.session.check_win_conditions", return_value=None
+        ) as check:
+            session._check_win()
+            session._check_win()
+            assert check.call_count == 1
+
+            session._advance_turn()
+            session._check_win()
+            assert check.call_count == 2
+
+    def test_hand_strength_follows_hand(self):
+        """Hand strength is recomputed when the hand changes."""
+        from darwindeck.genome.schema import Rank, Suit
+        from darwindeck.simulation.state import Card
+
+        session = PlaytestSession(make_simple_genome(), SessionConfig(seed=12345))
+        session.state = session._initialize_state()
+
+        def give(*ranks):
+            hand = tuple(Card(rank=r, suit=Suit.SPADES) for r in ranks)
+            players = list(session.state.players)
+            players[0] = players[0].copy_with(hand=hand)
+            session.state = session.state.copy_with(players=tuple(players))
+
+        give(Rank.TWO, Rank.ACE)
+        assert session._evaluate_hand_strength(0) == pytest.approx(0.5)
+        give(Rank.ACE, Rank.ACE)
+        assert session._evaluate_hand_strength(0) == pytest.approx(1.0)
+
+    def test_end_betting_round_advances_and_clears_bets(self):
+        """Ending a betting round moves on a phase and zeroes every bet."""
+        session = PlaytestSession(make_simple_genome(), SessionConfig(seed=12345))
+        session.state = session._initialize_state()
+        bettor = session.state.players[0].copy_with(current_bet=5)
+        untouched = session.state.players[1]
+        session.state = session.state.copy_with(
+            players=(bettor, untouched), current_bet=5, raise_count=1
+        )
+
+        session._end_betting_round()
+
+        state = session.state
+        assert (state.current_phase, state.active_player, state.turn) == (0, 1, 2)
+        assert (state.current_bet, state.raise_count) == (0, 0)
+        assert state.players[0].current_bet == 0
+        assert state.players[1] is untouched
+        assert session._needs_to_act is None
+
+    def test_display_state_reuses_unchanged_pieces(self):
+        """Hand and move labels are rebuilt only when their inputs change."""
+        from collections import deque
+
+        session = PlaytestSession(make_simple_genome(), SessionConfig(seed=12345))
+        session.state = session._initialize_state()
+        moves = session._legal_moves()
+
+        first = session._build_display_state(moves, deque(), 80)
+        session.state = session.state.copy_with(turn=2)
+        second = session._build_display_state(moves, deque(), 80)
+        assert second.hand_cards is first.hand_cards
+        assert second.moves is first.moves
+        assert second.turn == 2
+
+        other_moves = session._legal_moves()
+        third = session._build_display_state(other_moves, deque(), 80)
+        assert third.moves is not first.moves
+        assert third.moves == first.moves
+
+    def test_count_players_matches_movegen(self):
+        """One-pass player counts agree with the movegen helpers."""
+        from darwindeck.simulation.movegen import count_active_players, count_acting_players
+
+        session = PlaytestSession(make_simple_genome(), SessionConfig(seed=12345))
+        state = session._initialize_state()
+        base = state.players[0]
+        players = (
+            base.copy_with(player_id=0, chips=10),
+            base.copy_with(player_id=1, chips=10, has_folded=True),
+            base.copy_with(player_id=2, chips=0, is_all_in=True),
+            base.copy_with(player_id=3, chips=0),
+        )
+        session.state = state.copy_with(players=players)
+
+        assert session._count_players() == (
+            count_active_players(session.state),
+            count_acting_players(session.state),
+        ) == (3, 1)
+
 
 class TestGameLoop:
     """Tests for game loop logic."""
@@ -118,3 +228,34 @@ class TestGameLoop:
         reason = session.stuck_detector.check(session.state)
 
         assert reason is not None
+
+    def test_invalid_input_does_not_count_as_repeat(self):
+        """Re-prompting after a typo neither re-checks nor redraws the state."""
+        from darwindeck.playtest.input import InputResult
+
+        session = PlaytestSession(
+            make_simple_genome(), SessionConfig(seed=12345, show_rules=False)
+        )
+        session.state = session._initialize_state()
+        session.human_player_idx = session.state.active_player
+
+        session.human_input = Mock()
+        session.human_input.get_move.side_effect = (
+            [InputResult(error="Invalid choice 9.")] * 5 + [InputResult(quit=True)]
+        )
+        session.human_input.get_yes_no.return_value = False
+        session.human_input.get_rating.return_value = 3
+        session.human_input.get_comment.return_value = ""
+
+        output: list[str] = []
+        with patch.object(
+            session.stuck_detector, "check", wraps=session.stuck_detector.check
+        ) as check, patch.object(
+            session.renderer, "render", wraps=session.renderer.render
+        ) as render:
+            result = session._run_plain(output.append)
+
+        assert result.winner == "quit"
+        assert check.call_count == 1
+        assert render.call_count == 1
+        assert output.count("Invalid choice 9.") == 5
@@ -110,6 +110,13 @@ class TestFormatCard:
         assert club_suit_style == "default", f"Expected default, got {club_suit_style}"
         assert spade_suit_style == "default", f"Expected default, got {spade_suit_style}"
 
+    def test_format_card_rich_returns_independent_text(self) -> None:
+        """Mutating a returned card must not leak into later calls."""
+        first = format_card_rich("A", "H")
+        first.append("!", style="bold")
+
+        assert format_card_rich("A", "H").plain == "A\u2665"
+
 
 class TestDisplayState:
     """Tests for DisplayState dataclass."""
@@ -303,6 +310,151 @@ class TestRichDisplay:
         assert "empty" in output.lower() or "Hand" in output
 
 
+    def test_render_reuses_panel_for_identical_state(self) -> None:
+        """Re-rendering an unchanged state returns the cached panel."""
+        display = RichDisplay()
+
+        first = display.render(make_test_display_state())
+        again = display.render(make_test_display_state())
+        assert again is first
+
+        changed = make_test_display_state()
+        changed.pot = 75
+        assert display.render(changed) is not first
+
+    def test_hand_panel_spans_cover_each_card(self) -> None:
+        """Index, rank and suit styles line up with the joined hand text."""
+        display = RichDisplay()
+        state = make_test_display_state()
+        state.hand_cards = [("10", "H"), ("K", "S")]
+
+        text = display._build_hand_panel(state).renderable
+        assert text.plain == "[1] 10\u2665   [2] K\u2660   "
+        styled = [(text.plain[span.start:span.end], str(span.style)) for span in text.spans]
+        assert styled == [
+            ("[1]", "bold green"), ("10", "bold"), ("\u2665", "red"),
+            ("[2]", "bold green"), ("K", "bold"), ("\u2660", "default"),
+        ]
+
+    def test_empty_sections_share_placeholder_panels(self) -> None:
+        """Empty hand and move list reuse one prebuilt panel each."""
+        display = RichDisplay()
+        state = make_test_display_state()
+        state.hand_cards = []
+        state.moves = []
+
+        assert display._build_hand_panel(state) is display._build_hand_panel(state)
+        assert display._build_actions_panel(state) is display._build_actions_panel(state)
+
+    def test_terminal_width_reread_only_after_resize(self, monkeypatch) -> None:
+        """The console width is queried again only after a resize."""
+        from darwindeck.playtest import rich_display
+
+        reads: list[int] = []
+
+        class CountingConsole:
+            @property
+            def width(self) -> int:
+                reads.append(1)
+                return 90
+
+        display = RichDisplay()
+        display.console = CountingConsole()
+        monkeypatch.setattr(rich_display, "_resize_watch_installed", True)
+
+        assert display.get_terminal_width() == 90
+        assert display.get_terminal_width() == 90
+        assert len(reads) == 1
+
+        monkeypatch.setattr(rich_display, "_resize_generation", rich_display._resize_generation + 1)
+        assert display.get_terminal_width() == 90
+        assert len(reads) == 2
+
+    def test_messages_are_printed_literally(self) -> None:
+        """Brackets in messages are shown, not parsed as markup."""
+        display = RichDisplay()
+        display.console = Console(record=True, width=80)
+
+        display.show_message("Did the game feel broken? [y/n]: ")
+        display.show_error("bad tag [/bold]")
+
+        output = display.console.export_text()
+        assert "[y/n]" in output
+        assert "Error: bad tag [/bold]" in output
+
+    def test_move_log_reused_until_entries_change(self) -> None:
+        """The move log Text is rebuilt only when visible entries change."""
+        display = RichDisplay()
+        state = make_test_display_state()
+
+        log = display._build_move_log(state)
+        state.turn += 1
+        assert display._build_move_log(state) is log
+
+        state.move_log.append(("opponent", "drew"))
+        rebuilt = display._build_move_log(state)
+        assert rebuilt is not log
+        assert "AI drew" in rebuilt.plain
+
+    def test_unchanged_frame_is_not_redrawn(self, monkeypatch) -> None:
+        """Prompting again on the same state skips the clear and reprint."""
+        import io
+
+        display = RichDisplay()
+        display.console = Console(file=io.StringIO(), width=80)
+        clears = []
+        monkeypatch.setattr(display.console, "clear", lambda *a, **k: clears.append(1))
+        monkeypatch.setattr(display.console, "input", lambda *a, **k: "1")
+        monkeypatch.setattr("time.sleep", lambda _: None)
+
+        state = make_test_display_state()
+        assert display.show_and_prompt(state) == "1"
+        display.show_ai_turn(make_test_display_state())
+        assert display.show_and_prompt(make_test_display_state()) == "1"
+        assert len(clears) == 1
+
+        changed = make_test_display_state()
+        changed.turn = 6
+        display.show_ai_turn(changed)
+        assert len(clears) == 2
+
+    def test_ai_turn_pause_includes_draw_time(self, monkeypatch) -> None:
+        """Time spent drawing the AI frame is taken off the pause."""
+        import io
+        import itertools
+
+        display = RichDisplay()
+        display.console = Console(file=io.StringIO(), width=80)
+        clock = itertools.count(step=0.1)
+        sleeps: list[float] = []
+        monkeypatch.setattr("time.perf_counter", lambda: next(clock))
+        monkeypatch.setattr("time.sleep", sleeps.append)
+
+        display.show_ai_turn(make_test_display_state(), duration=0.3)
+        assert sleeps == [pytest.approx(0.2)]
+
+    def test_prompt_frame_is_one_write(self, monkeypatch) -> None:
+        """Clear and panel reach the terminal in a single synchronized write."""
+        import io
+
+        writes: list[str] = []
+
+        class RecordingFile(io.StringIO):
+            def write(self, s: str) -> int:
+                writes.append(s)
+                return super().write(s)
+
+        display = RichDisplay()
+        display.console = Console(file=RecordingFile(), width=80, force_terminal=True)
+        monkeypatch.setattr(display.console, "input", lambda *a, **k: "")
+
+        display.show_and_prompt(make_test_display_state())
+
+        assert len(writes) == 1
+        assert writes[0].startswith("\x1b[?2026h\x1b[2J")
+        assert writes[0].endswith("\x1b[?2026l")
+
+
 class TestSuitConstants:
     """Tests for suit-related constants."""
 
@@ -540,6 +540,57 @@ class TestRulebookGenerator:
         # Should include common edge cases like deck exhaustion, turn limit
         assert "Empty deck" in markdown or "Turn limit" in markdown or "Tie" in markdown
 
+    def test_render_markdown_optional_sections_in_order(self):
+        """Optional sections render in order only when populated."""
+        generator = RulebookGenerator()
+        full = RulebookSections(
+            game_name="G", player_count=2, objective="Win",
+            overview="An overview", components=["Deck"], setup_steps=["Shuffle"],
+            phases=[("Phase 1: Draw", "Draw 1 card")], scoring_rules=["**Scoring:** x"],
+            special_rules=["**Ace:** y"], edge_cases=["**Tie:** z"], quick_reference="QR",
+        )
+        markdown = generator._render_markdown(full)
+        headings = [line for line in markdown.splitlines() if line.startswith("## ")]
+        assert headings == [
+            "## Overview", "## Components", "## Setup", "## Objective", "## Turn Structure",
+            "## Scoring", "## Special Rules", "## Edge Cases", "## Quick Reference",
+        ]
+        assert markdown.endswith("QR\n")
+
+        bare = generator._render_markdown(
+            RulebookSections(game_name="G", player_count=2, objective="Win")
+        )
+        assert "## Overview" not in bare
+        assert "## Scoring" not in bare
+        assert "## Special Rules" not in bare
+        assert "## Quick Reference" not in bare
+        assert bare.endswith("## Edge Cases")
+
+    def test_generate_reuses_cached_rulebook(self, monkeypatch):
+        """Regenerating an identical genome skips extraction."""
+        generator = RulebookGenerator()
+        first = generator.generate(self._make_genome(), use_llm=False)
+
+        def fail_extract(genome):
+            raise AssertionError("extractor should not run on cache hit")
+
+        monkeypatch.setattr(generator.extractor, "extract", fail_extract)
+        assert generator.generate(self._make_genome(), use_llm=False) == first
+
+    def test_generate_cache_distinguishes_genomes(self):
+        """Genomes differing in any field get their own rulebook."""
+        from dataclasses import replace
+
+        generator = RulebookGenerator()
+        genome = self._make_genome()
+        first = generator.generate(genome, use_llm=False)
+        other = generator.generate(
+            replace(genome, setup=SetupRules(cards_per_player=5)), use_llm=False
+        )
+
+        assert "7 cards" in first
+        assert "5 cards" in other
+
 
 class TestTableauModeDescriptions:
     """Tests for tableau mode descriptions in rulebook."""
@@ -0,0 +1,18 @@
+"""Tests for population seeding."""
+
+from dataclasses import replace
+
+from darwindeck.evolution.seeding import create_seed_population
+from darwindeck.genome.examples import get_seed_genomes
+
+
+def test_seed_copies_keep_every_field() -> None:
+    """Seed copies differ from their source game only in genome_id."""
+    seeds = {
+        replace(g, genome_id="") for g in get_seed_genomes()
+    }
+    population = create_seed_population(size=19, seed_ratio=1.0, random_seed=0)
+
+    assert len({ind.genome.genome_id for ind in population}) == 19
+    for ind in population:
+        assert replace(ind.genome, genome_id="") in seeds
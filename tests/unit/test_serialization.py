@@ -8,7 +8,8 @@ from darwindeck.genome.schema import (
 )
 from darwindeck.genome.serialization import (
     _phase_to_dict, _phase_from_dict, _setup_to_dict, _setup_from_dict,
-    genome_to_dict, genome_from_dict, genome_to_json, genome_from_json
+    genome_to_dict, genome_from_dict, genome_to_json, genome_from_json,
+    genome_content_hash
 )
 from darwindeck.genome.conditions import Condition, ConditionType
 
@@ -185,3 +186,17 @@ def test_genome_deserialization_missing_tableau_mode():
     genome = genome_from_dict(d)
     assert genome.setup.tableau_mode == TableauMode.NONE
     assert genome.setup.sequence_direction == SequenceDirection.BOTH
+
+
+def test_genome_content_hash_ignores_identity():
+    """Content hash ignores genome_id and generation but not rules."""
+    from dataclasses import replace
+    from darwindeck.genome.examples import create_war_genome, create_hearts_genome
+
+    war = create_war_genome()
+    renamed = replace(war, genome_id="other", generation=7)
+    assert genome_content_hash(renamed) == genome_content_hash(war)
+
+    tweaked = replace(war, max_turns=war.max_turns + 1)
+    assert genome_content_hash(tweaked) != genome_content_hash(war)
+    assert genome_content_hash(create_hearts_genome()) != genome_content_hash(war)
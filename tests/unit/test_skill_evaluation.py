@@ -0,0 +1,270 @@
+"""Tests for two-tier skill evaluation (no Go simulator required)."""
+
+from collections import OrderedDict
+from dataclasses import replace
+
+import pytest
+
+from darwindeck.evolution import skill_evaluation as se
+from darwindeck.evolution.fitness_full import SimulationResults
+from darwindeck.evolution.skill_evaluation import (
+    SkillEvalResult, _SeatHalf, _SkillEvalTask, _cache_get, _cache_put,
+    _combine_skill_results, _evaluate_seat_chunk, _is_decisive, _load_programs,
+    _make_timeout_result, _merge_seat_halves, _share_programs, _skill_cache_key,
+    _wilson_interval, evaluate_batch_skill,
+)
+from darwindeck.genome.examples import create_war_genome, get_seed_genomes
+
+
+def results(games: int, p0_wins: int, errors: int = 0) -> SimulationResults:
+    """Two-player results with p0_wins of games won by player 0."""
+    return SimulationResults(
+        total_games=games, wins=(p0_wins, games - p0_wins), player_count=2,
+        draws=0, avg_turns=10.0, errors=errors,
+    )
+
+
+class FakeSimulator:
+    """Stands in for GoSimulator: the non-random seat wins every game.
+
+    played caps the games per schedule item, like a spent Go time budget.
+    """
+
+    def __init__(self, played=None):
+        self.played = played
+        self.calls = []
+
+    def simulate_schedule(self, schedule, mcts_threads=1, time_budget_sec=None):
+        self.calls.append((schedule, time_budget_sec))
+        out = []
+        for _, ai_types, num_games, _ in schedule:
+            games = num_games if self.played is None else min(num_games, self.played)
+            out.append(results(games, games if ai_types[1] == "random" else 0))
+        return out
+
+
+def skill_result(genome_id: str = "g", timed_out: bool = False) -> SkillEvalResult:
+    return SkillEvalResult(
+        genome_id=genome_id, greedy_wins_as_p0=5, greedy_wins_as_p1=5, greedy_win_rate=1.0,
+        mcts_wins_as_p0=5, mcts_wins_as_p1=5, mcts_games=10, total_games=20,
+        skill_score=1.0, first_player_advantage=0.0, timed_out=timed_out,
+    )
+
+
+@pytest.fixture
+def empty_cache(monkeypatch):
+    """A fresh in-memory skill cache with on-disk persistence disabled."""
+    monkeypatch.delenv("EVOLUTION_CACHE_DIR", raising=False)
+    cache = OrderedDict()
+    monkeypatch.setattr(se, "_skill_cache", cache)
+    return cache
+
+
+class TestEarlyStopping:
+    """Tests for the Wilson-interval early stop."""
+
+    def test_wilson_interval_brackets_the_win_rate(self):
+        low, high = _wilson_interval(30, 40)
+        assert low < 0.75 < high
+        assert 0.0 <= low and high <= 1.0
+
+    def test_wilson_interval_without_games_is_uninformative(self):
+        assert _wilson_interval(0, 0) == (0.0, 1.0)
+
+    def test_decisive_only_when_interval_clears_bounds(self):
+        bounds = (0.3, 0.7)
+        assert _is_decisive(20, 20, bounds)
+        assert _is_decisive(0, 20, bounds)
+        assert not _is_decisive(10, 20, bounds)
+        assert not _is_decisive(2, 2, bounds)
+
+
+class TestCombineResults:
+    """Tests for merging tier results into a SkillEvalResult."""
+
+    def test_counts_come_from_results(self):
+        result = _combine_skill_results(
+            "g", results(5, 5), results(5, 0), (4, 3), 4, 3, 0, timed_out=False
+        )
+        assert result.total_games == 17
+        assert result.mcts_games == 7
+        assert result.greedy_win_rate == 1.0
+        assert result.mcts_win_rate == 1.0
+        assert not result.timed_out
+
+    def test_zero_games_is_a_timeout(self):
+        """A genome the budget never reached must not look like a real result."""
+        result = _combine_skill_results(
+            "g", results(0, 0), results(0, 0), (0, 0), 0, 0, 0, timed_out=False
+        )
+        assert result.total_games == 0
+        assert result.skill_score == 0.5
+        assert result.timed_out
+
+    def test_all_errors_is_neutral_but_complete(self):
+        result = _combine_skill_results(
+            "g", results(5, 0, errors=5), results(5, 5, errors=5), (5, 5), 0, 0, 10,
+            timed_out=False,
+        )
+        assert result.skill_score == 0.5
+        assert not result.timed_out
+
+    def test_merge_marks_short_greedy_as_timed_out(self):
+        result = _merge_seat_halves(
+            "g", _SeatHalf(0, results(2, 2), results(5, 5)),
+            _SeatHalf(1, results(5, 0), results(5, 0)), games_per_direction=5,
+        )
+        assert result.timed_out
+
+    def test_merge_complete_halves(self):
+        result = _merge_seat_halves(
+            "g", _SeatHalf(0, results(5, 5), results(5, 5)),
+            _SeatHalf(1, results(5, 0), results(5, 0)), games_per_direction=5,
+        )
+        assert not result.timed_out
+        assert result.total_games == 20
+        assert result.skill_score == 1.0
+
+    def test_merge_without_mcts_is_a_timeout(self):
+        result = _merge_seat_halves(
+            "g", _SeatHalf(0, results(5, 5), None), _SeatHalf(1, results(5, 0), None), 5
+        )
+        assert result.timed_out
+        assert result.mcts_games == 0
+        assert result.total_games == 10
+
+    def test_timeout_result_counts_games_played(self):
+        """Partial directions report the games Go actually played."""
+        result = _make_timeout_result("g", results(5, 5), results(5, 0), results(2, 1), None)
+        assert result.total_games == 12
+        assert result.mcts_games == 2
+        assert result.mcts_win_rate == 0.5
+        assert result.timed_out
+
+
+class TestSkillCache:
+    """Tests for the skill result cache."""
+
+    def test_key_ignores_genome_id(self):
+        genome = create_war_genome()
+        clone = replace(genome, genome_id="clone")
+        assert _skill_cache_key(genome, 10, 100) == _skill_cache_key(clone, 10, 100)
+
+    def test_key_includes_evaluation_parameters(self):
+        genome = create_war_genome()
+        base = _skill_cache_key(genome, 10, 100)
+        assert _skill_cache_key(genome, 20, 100) != base
+        assert _skill_cache_key(genome, 10, 500) != base
+        assert _skill_cache_key(genome, 10, 100, decisive_bounds=(0.2, 0.8)) != base
+        assert _skill_cache_key(genome, 10, 100, mcts_threads=4) != base
+
+    def test_timed_out_results_are_not_cached(self, empty_cache):
+        _cache_put({"done": skill_result(), "cut": skill_result(timed_out=True)})
+        assert _cache_get("done") is not None
+        assert _cache_get("cut") is None
+
+    def test_memory_cache_is_bounded(self, empty_cache, monkeypatch):
+        monkeypatch.setattr(se, "_SKILL_CACHE_SIZE", 2)
+        _cache_put({"a": skill_result("a"), "b": skill_result("b")})
+        _cache_get("a")
+        _cache_put({"c": skill_result("c")})
+        assert list(empty_cache) == ["a", "c"]
+
+    def test_batch_persists_to_disk(self, empty_cache, monkeypatch, tmp_path):
+        monkeypatch.setenv("EVOLUTION_CACHE_DIR", str(tmp_path))
+        _cache_put({"a": skill_result("a"), "b": skill_result("b")})
+        empty_cache.clear()
+        assert _cache_get("b").genome_id == "b"
+
+
+class TestSharedPrograms:
+    """Tests for publishing bytecode through shared memory."""
+
+    def test_round_trip(self):
+        genome = create_war_genome()
+        programs = {0: b"first", 1: genome, 2: b"second program"}
+        block, shared = _share_programs(programs)
+        try:
+            assert shared[1] is genome
+            task = _SkillEvalTask(
+                ("a", "b", "c"), tuple(shared[i] for i in range(3)),
+                10, 100, "mcts", 1.0, shm_name=block.name,
+            )
+            loaded = _load_programs(task)
+        finally:
+            block.close()
+            block.unlink()
+        assert loaded.programs == (b"first", genome, b"second program")
+        assert loaded.shm_name is None
+
+    def test_nothing_compiled_needs_no_block(self):
+        genome = create_war_genome()
+        block, shared = _share_programs({0: genome})
+        assert block is None
+        assert shared == {0: genome}
+
+
+class TestEvaluateChunk:
+    """Tests for chunked evaluation against a fake simulator."""
+
+    def test_greedy_batched_and_mcts_per_genome(self):
+        genomes = tuple(get_seed_genomes()[:3])
+        simulator = FakeSimulator()
+        halves = _evaluate_seat_chunk(genomes, 10, 100, "mcts", 5.0, simulator)
+
+        greedy_call, *mcts_calls = simulator.calls
+        assert len(greedy_call[0]) == 6
+        assert len(mcts_calls) == 3
+        assert all(len(schedule) == 2 for schedule, _ in mcts_calls)
+        # Each genome gets its own budget, not whatever the chunk has left
+        assert all(0 < budget <= 5.0 for _, budget in mcts_calls)
+        assert [[h.seat for h in pair] for pair in halves] == [[0, 1]] * 3
+
+    def test_single_seat(self):
+        simulator = FakeSimulator()
+        halves = _evaluate_seat_chunk(
+            (create_war_genome(),), 10, 100, "mcts", 5.0, simulator, seats=(1,)
+        )
+        assert len(halves) == 1 and halves[0][0].seat == 1
+        assert halves[0][0].greedy.player1_wins == 5
+
+    def test_spent_budget_skips_mcts(self):
+        simulator = FakeSimulator()
+        halves = _evaluate_seat_chunk((create_war_genome(),), 10, 100, "mcts", 0.0, simulator)
+        assert len(simulator.calls) == 1
+        assert halves[0][0].mcts is None
+
+
+class TestEvaluateBatch:
+    """Tests for evaluate_batch_skill with a fake simulator."""
+
+    @pytest.fixture
+    def simulator(self, monkeypatch, empty_cache):
+        simulator = FakeSimulator()
+        monkeypatch.setattr(se, "_new_simulator", lambda: simulator)
+        return simulator
+
+    def test_identical_rules_evaluated_once(self, simulator):
+        genome = create_war_genome()
+        clone = replace(genome, genome_id="clone")
+        batch = evaluate_batch_skill([genome, clone], num_games=10, mcts_iterations=100)
+
+        assert [r.genome_id for r in batch] == [genome.genome_id, "clone"]
+        assert batch[0].skill_score == batch[1].skill_score == 1.0
+        greedy_schedule = simulator.calls[0][0]
+        assert len(greedy_schedule) == 2
+
+    def test_cache_hits_skip_the_simulator(self, simulator):
+        genome = create_war_genome()
+        evaluate_batch_skill([genome], num_games=10)
+        calls = len(simulator.calls)
+        again = evaluate_batch_skill([replace(genome, genome_id="again")], num_games=10)
+        assert len(simulator.calls) == calls
+        assert again[0].genome_id == "again"
+
+    def test_timed_out_results_are_re_evaluated(self, simulator):
+        simulator.played = 0
+        genome = create_war_genome()
+        assert evaluate_batch_skill([genome], num_games=10)[0].timed_out
+        simulator.played = None
+        assert not evaluate_batch_skill([genome], num_games=10)[0].timed_out